@@ -0,0 +1,3 @@
+from .bounds_propagation import BoundTightening, propagate_bounds, get_upper_bounds
+from .static_checks import find_conflicts
+from .constraints_simplification import ConstraintsSimplification, simplify_constraints
@@ -0,0 +1,132 @@
+"""Provides the propagation of upper bounds on the numbers of components' instances in a configuration."""
+
+import math
+from typing import Dict, List, Tuple
+
+from analysis.common import get_instances_count, get_ancestors, get_productions
+from model import Model, Component
+
+ASSOCIATIONS_REASON = 'associations'
+SIMPLE_CONSTRAINTS_REASON = 'simple constraints'
+RESOURCES_REASON = 'resources'
+
+
+class BoundTightening:
+    """Represents the tightened number of component's instances.
+
+    Attributes:
+        component_id: Id of the component.
+        component_name: Name of the component.
+        count: Number of component's instances set in the model.
+        bound: Maximal number of component's instances that can be in a configuration.
+        reason: What the bound has been propagated from (associations, simple constraints or resources).
+    """
+    __slots__ = ('component_id', 'component_name', 'count', 'bound', 'reason')
+
+    def __init__(self, component_id: int, component_name: str, count: int, bound: int, reason: str):
+        self.component_id: int = component_id
+        self.component_name: str = component_name
+        self.count: int = count
+        self.bound: int = bound
+        self.reason: str = reason
+
+    def __str__(self):
+        return f'{self.component_name}: {self.count} -> {self.bound} ({self.reason})'
+
+
+def propagate_bounds(model: Model) -> List[BoundTightening]:
+    """Propagates the upper bounds on the numbers of leaf components' instances that can be in a configuration
+    (see get_upper_bounds) and compares them with the numbers of instances set in the model.
+
+    Only the components with an exact number of instances are tightened, since the instances of the other ones
+    are chosen by a rule requiring at least the minimal number of them to exist.
+
+    :param model: Model.
+    :return: List of the tightened numbers of components' instances.
+    """
+    bounds, reasons = __propagate(model)
+    return [BoundTightening(c.id_, c.name, c.count, bounds[c.id_], reasons[c.id_])
+            for c in model.get_components(is_leaf=True) if c.count and bounds[c.id_] < c.count]
+
+
+def get_upper_bounds(model: Model, simple_constraints: bool = True) -> Dict[int, int]:
+    """Returns the upper bounds on the numbers of leaf components' instances that can be in a configuration:
+    - an instance is in a configuration only through an association of the component or of one of its ancestors,
+      so there can be at most as many of them as the sum of these associations' maximums,
+    - there can be at most as many instances as the maximum of every simple (not distinct) constraint
+      the component or one of its ancestors is counted by,
+    - a resource's consumers can have at most as many instances as the maximal production of the resource
+      (by the producers' instances, bounded in turn) covers.
+
+    :param model: Model.
+    :param simple_constraints: Whether to propagate the bounds from the simple constraints too.
+    :return: Upper bounds on the numbers of instances by the leaf components' ids.
+    """
+    bounds, _ = __propagate(model, simple_constraints)
+    return bounds
+
+
+def __propagate(model: Model, simple_constraints: bool = True) -> Tuple[Dict[int, int], Dict[int, str]]:
+    """Propagates the upper bounds on the numbers of leaf components' instances.
+
+    :param model: Model.
+    :param simple_constraints: Whether to propagate the bounds from the simple constraints too.
+    :return: Tuple of the form (upper bounds by the leaf components' ids,
+                                what the tightened bounds have been propagated from by the leaf components' ids).
+    """
+    leaves = model.get_components(is_leaf=True)
+    bounds: Dict[int, int] = {c.id_: get_instances_count(c) for c in leaves}
+    reasons: Dict[int, str] = {}
+    ancestors: Dict[int, List[Component]] = {c.id_: get_ancestors(model, c) for c in leaves}
+
+    for leaf in leaves:
+        associations_bound = sum(math.inf if c.association.max_ is None else c.association.max_
+                                 for c in ancestors[leaf.id_] if c.association)
+        __tighten(leaf, associations_bound, ASSOCIATIONS_REASON, bounds, reasons)
+    for ctr in model.simple_constraints if simple_constraints else []:
+        if ctr.max_ is None or (ctr.distinct and ctr.max_ > 0):
+            continue    # Distinct constraint bounds the number of components' types, not of their instances
+        constrained_ids = set(ctr.components_ids)
+        for leaf in leaves:
+            if any(c.id_ in constrained_ids for c in ancestors[leaf.id_]):
+                __tighten(leaf, ctr.max_, SIMPLE_CONSTRAINTS_REASON, bounds, reasons)
+    __propagate_resources_bounds(leaves, get_productions(model, leaves, ancestors), bounds, reasons)
+    return bounds, reasons
+
+
+def __propagate_resources_bounds(leaves: List[Component], productions: Dict[int, Dict[int, int]],
+                                 bounds: Dict[int, int], reasons: Dict[int, str]) -> None:
+    """Bounds the numbers of resources' consumers' instances by the maximal production of the resources,
+    until none of the bounds changes (since consumers of one resource can be the producers of another one).
+
+    :param leaves: Leaf components.
+    :param productions: Amounts of resources produced by the leaf components' instances (see get_productions).
+    :param bounds: Upper bounds on the numbers of instances by the components' ids; tightened in place.
+    :param reasons: What the bounds have been propagated from, by the components' ids; updated in place.
+    """
+    changed = True
+    while changed:
+        changed = False
+        for production in productions.values():
+            max_production = sum(amount * bounds[id_] for id_, amount in production.items() if amount > 0)
+            for leaf in leaves:
+                amount = production.get(leaf.id_, 0)
+                if amount < 0:
+                    changed |= __tighten(leaf, max_production // -amount, RESOURCES_REASON, bounds, reasons)
+
+
+def __tighten(cmp: Component, bound: float, reason: str, bounds: Dict[int, int], reasons: Dict[int, str]) -> bool:
+    """Tightens the upper bound on the number of component's instances, if the new bound is lower.
+
+    :param cmp: Component.
+    :param bound: New upper bound.
+    :param reason: What the new bound has been propagated from.
+    :param bounds: Upper bounds on the numbers of instances by the components' ids.
+    :param reasons: What the bounds have been propagated from, by the components' ids.
+    :return: True if the bound has been tightened; False otherwise.
+    """
+    if bound >= bounds[cmp.id_]:
+        return False
+    bounds[cmp.id_] = bound
+    reasons[cmp.id_] = reason
+    return True
@@ -0,0 +1,55 @@
+"""Provides helper functions common to the analyses of the model."""
+
+from typing import Dict, List, Optional
+
+from model import Model, Component
+
+
+def get_instances_count(cmp: Component) -> int:
+    """Returns the number of component's instances (ids reserved for them in the generated code).
+
+    :param cmp: Leaf component.
+    :return: Number of component's instances.
+    """
+    if cmp.count:
+        return cmp.count
+    elif cmp.min_count is not None and cmp.max_count is not None:
+        return cmp.max_count - cmp.min_count
+    return 0
+
+
+def get_ancestors(model: Model, cmp: Component) -> List[Component]:
+    """Returns the component along with its ancestors.
+
+    :param model: Model.
+    :param cmp: Component.
+    :return: List of the component and its ancestors, from the component upwards.
+    """
+    ancestors = [cmp]
+    parent_id: Optional[int] = cmp.parent_id
+    while parent_id is not None:
+        parent = model.get_component(id_=parent_id)
+        ancestors.append(parent)
+        parent_id = parent.parent_id
+    return ancestors
+
+
+def get_productions(model: Model, leaves: List[Component], ancestors: Dict[int, List[Component]]) \
+        -> Dict[int, Dict[int, int]]:
+    """Returns the amounts of resources produced (or consumed, if negative) by an instance of each leaf component,
+    including the amounts set for its ancestors.
+
+    :param model: Model.
+    :param leaves: Leaf components.
+    :param ancestors: Components (the component itself and its ancestors) by the leaf components' ids.
+    :return: Dictionary of the form "id of resource": {"id of leaf component": "amount produced"}
+        (leaving out the components that neither produce nor consume the resource).
+    """
+    productions: Dict[int, Dict[int, int]] = {}
+    for res in model.resources:
+        for leaf in leaves:
+            # Amounts produced are summed up by the solver as a set, so the same amounts count once
+            amounts = {c.produces[res.id_] for c in ancestors[leaf.id_] if res.id_ in c.produces}
+            if sum(amounts):
+                productions.setdefault(res.id_, {})[leaf.id_] = sum(amounts)
+    return productions
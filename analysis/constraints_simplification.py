@@ -0,0 +1,136 @@
+"""Provides the simplification of the simple constraints before generating their code."""
+
+from typing import Dict, List, Optional, Tuple
+
+from analysis.bounds_propagation import get_upper_bounds
+from analysis.common import get_ancestors
+from model import Model, Component, SimpleConstraint
+
+
+class ConstraintsSimplification:
+    """Represents the result of the simplification of the model's simple constraints.
+
+    Attributes:
+        constraints: Simple constraints to generate instead of the model's ones.
+        removed: Descriptions of the constraints (or their bounds) removed or merged.
+        contradictions: Descriptions of the constraints that can never be satisfied.
+    """
+    __slots__ = ('constraints', 'removed', 'contradictions')
+
+    def __init__(self, constraints: List[SimpleConstraint], removed: List[str], contradictions: List[str]):
+        self.constraints: List[SimpleConstraint] = constraints
+        self.removed: List[str] = removed
+        self.contradictions: List[str] = contradictions
+
+
+def simplify_constraints(model: Model) -> ConstraintsSimplification:
+    """Simplifies the model's simple constraints:
+    - the constraints counting the same components (in the same way) are merged into one, with the tightest bounds,
+    - the bounds that always hold are dropped: a minimum of 0, or a maximum not lower than the number of instances
+      (or distinct components) that can be counted (see get_upper_bounds; the bounds propagated from the simple
+      constraints themselves are left out, as these are to be simplified),
+    - the constraints whose bounds are both dropped always hold, and are removed,
+    - the constraints whose minimum is implied by the minimum of a constraint counting some of their components,
+      and whose maximum is implied by the maximum of a constraint counting all of their components (and others)
+      are removed.
+    The merged constraints whose minimum exceeds their maximum, or the number of instances that can be counted,
+    can never be satisfied; they are kept, and reported as contradictions.
+
+    :param model: Model.
+    :return: Simplification of the simple constraints.
+    """
+    leaves = model.get_components(is_leaf=True)
+    ancestors: Dict[int, List[Component]] = {c.id_: get_ancestors(model, c) for c in leaves}
+    bounds = get_upper_bounds(model, simple_constraints=False)
+    removed, contradictions = [], []
+    contradictory_keys = set()
+
+    merged: Dict[Tuple, SimpleConstraint] = {}
+    for ctr in model.simple_constraints:
+        key = __get_constraint_key(model, ctr)
+        first = merged.get(key)
+        if first is None:
+            merged[key] = SimpleConstraint(ctr.id_, ctr.name, ctr.description, ctr.min_, ctr.max_,
+                                           list(ctr.components_ids), ctr.distinct)
+        else:
+            first.min_ = __merge_bound(first.min_, ctr.min_, max)
+            first.max_ = __merge_bound(first.max_, ctr.max_, min)
+            removed.append(f'Simple constraint "{ctr.name}" has been merged into "{first.name}".')
+
+    simplified: Dict[Tuple, SimpleConstraint] = {}
+    for key, ctr in merged.items():
+        ids = set(key[0])
+        if ctr.distinct:
+            available = sum(1 for id_ in ids if any(bounds[c.id_] for c in leaves
+                                                    if any(a.id_ == id_ for a in ancestors[c.id_])))
+        else:
+            available = sum(bounds[c.id_] for c in leaves if any(a.id_ in ids for a in ancestors[c.id_]))
+        if ctr.min_ is not None and ((ctr.max_ is not None and ctr.min_ > ctr.max_) or ctr.min_ > available):
+            contradictions.append(f'Simple constraint "{ctr.name}" requires at least {ctr.min_}, but at most '
+                                  f'{available if ctr.max_ is None else min(ctr.max_, available)} can be counted.')
+            simplified[key] = ctr
+            contradictory_keys.add(key)
+            continue
+        if ctr.min_ == 0:
+            ctr.min_ = None
+        if ctr.max_ is not None and ctr.max_ >= available:
+            ctr.max_ = None
+        if ctr.min_ is None and ctr.max_ is None:
+            removed.append(f'Simple constraint "{ctr.name}" always holds.')
+        else:
+            simplified[key] = ctr
+
+    constraints = []
+    for key, ctr in simplified.items():
+        if key not in contradictory_keys and __is_implied(key, ctr, simplified):
+            removed.append(f'Simple constraint "{ctr.name}" is implied by the other ones.')
+        else:
+            constraints.append(ctr)
+    return ConstraintsSimplification(constraints, removed, contradictions)
+
+
+def __get_constraint_key(model: Model, ctr: SimpleConstraint) -> Tuple:
+    """Returns what the constraint counts: its components (in any order, since the elements of the aggregate
+    form a set) and whether the distinct components are counted.
+
+    :param model: Model.
+    :param ctr: Simple constraint.
+    :return: Constraint's key.
+    """
+    return tuple(c.id_ for c in model.get_components_by_ids(ctr.components_ids)), ctr.distinct
+
+
+def __merge_bound(bound: Optional[int], other_bound: Optional[int], tightest) -> Optional[int]:
+    """Returns the tightest of the bounds.
+
+    :param bound: Bound (or None).
+    :param other_bound: Other bound (or None).
+    :param tightest: Function choosing the tightest of two bounds (min or max).
+    :return: Tightest bound (or None if both are None).
+    """
+    if bound is None or other_bound is None:
+        return other_bound if bound is None else bound
+    return tightest(bound, other_bound)
+
+
+def __is_implied(key: Tuple, ctr: SimpleConstraint, constraints: Dict[Tuple, SimpleConstraint]) -> bool:
+    """Checks whether both bounds of the constraint are implied by the other constraints, counting the components
+    in the same way: the count can only grow with the components counted.
+
+    :param key: Constraint's key.
+    :param ctr: Simple constraint.
+    :param constraints: Merged constraints by their keys.
+    :return: True if the constraint is implied by the other constraints; False otherwise.
+    """
+    ids = set(key[0])
+    min_implied = ctr.min_ is None
+    max_implied = ctr.max_ is None
+    for other_key, other in constraints.items():
+        if other_key == key or other_key[1] != key[1]:
+            continue
+        other_ids = set(other_key[0])
+        if not min_implied and other.min_ is not None and other_ids <= ids and other.min_ >= ctr.min_:
+            min_implied = True
+        if not max_implied and other.max_ is not None and other_ids >= ids and other.max_ <= ctr.max_:
+            max_implied = True
+    return min_implied and max_implied
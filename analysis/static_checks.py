@@ -0,0 +1,157 @@
+"""Provides the static checks of the model, detecting (without grounding the encoding) the cases,
+in which no configuration exists."""
+
+from typing import Dict, List, Set
+
+from analysis.bounds_propagation import get_upper_bounds
+from analysis.common import get_ancestors, get_productions
+from model import Model, Component
+
+
+def find_conflicts(model: Model) -> List[str]:
+    """Checks whether the model's requirements exceed what the components can provide:
+    - the minimum of an association or a simple constraint exceeds its maximum,
+    - the minimum of an association or a simple constraint exceeds the number of instances that can be
+      in a configuration (see get_upper_bounds); the instances of components having a port that has to be connected,
+      while no port compatible with it can be in a configuration, cannot be in a configuration either,
+    - the consumption of a resource by the instances required by the associations exceeds
+      the maximal production of the resource.
+    Each of these cases makes the model unsatisfiable.
+
+    :param model: Model.
+    :return: List of the conflicts' descriptions (empty if none has been found).
+    """
+    leaves = model.get_components(is_leaf=True)
+    ancestors: Dict[int, List[Component]] = {c.id_: get_ancestors(model, c) for c in leaves}
+    bounds = get_upper_bounds(model)
+    unconnectable = __get_unconnectable_components_ids(model, leaves, bounds)
+    for id_ in unconnectable:
+        bounds[id_] = 0
+
+    conflicts = []
+    for cmp in model.taxonomy:
+        if cmp.association:
+            conflicts.extend(__check_bounds(f'Association of "{cmp.name}"', cmp.association.min_, cmp.association.max_,
+                                            __get_descendants(cmp.id_, leaves, ancestors), bounds, unconnectable))
+    for ctr in model.simple_constraints:
+        if ctr.distinct:
+            # Only the constrained components having some instances in a configuration are counted
+            available = sum(1 for id_ in set(ctr.components_ids)
+                            if any(bounds[c.id_] for c in __get_descendants(id_, leaves, ancestors)))
+            conflicts.extend(__check_bounds(f'Simple constraint "{ctr.name}"', ctr.min_, ctr.max_, [], bounds,
+                                            unconnectable, available, 'distinct components'))
+        else:
+            constrained_ids = set(ctr.components_ids)
+            descendants = [c for c in leaves if any(a.id_ in constrained_ids for a in ancestors[c.id_])]
+            conflicts.extend(__check_bounds(f'Simple constraint "{ctr.name}"', ctr.min_, ctr.max_, descendants,
+                                            bounds, unconnectable))
+    conflicts.extend(__check_resources(model, leaves, ancestors, bounds))
+    return conflicts
+
+
+def __check_bounds(name: str, min_: int, max_: int, descendants: List[Component], bounds: Dict[int, int],
+                   unconnectable: Set[int], available: int = None, counted: str = 'instances') -> List[str]:
+    """Checks whether the minimum of an association or a simple constraint can be satisfied.
+
+    :param name: Name of the association or constraint (to describe the conflict with).
+    :param min_: Minimum (or None).
+    :param max_: Maximum (or None).
+    :param descendants: Leaf components, whose instances are counted.
+    :param bounds: Upper bounds on the numbers of instances by the leaf components' ids.
+    :param unconnectable: Ids of components that cannot be in a configuration because of their ports.
+    :param available: Maximal count that can be reached; the sum of the descendants' bounds if None.
+    :param counted: What is counted (to describe the conflict with).
+    :return: List of the conflicts' descriptions.
+    """
+    if min_ is None:
+        return []
+    if max_ is not None and min_ > max_:
+        return [f'{name} requires at least {min_} {counted}, but at most {max_}.']
+    if available is None:
+        available = sum(bounds[c.id_] for c in descendants)
+    if min_ > available:
+        conflict = f'{name} requires at least {min_} {counted}, but at most {available} can be in a configuration.'
+        excluded = [c.name for c in descendants if c.id_ in unconnectable]
+        if excluded:
+            conflict += f' ({", ".join(excluded)} cannot be in any: their ports have to be connected, ' \
+                        f'but no port compatible with them can be in a configuration.)'
+        return [conflict]
+    return []
+
+
+def __check_resources(model: Model, leaves: List[Component], ancestors: Dict[int, List[Component]],
+                      bounds: Dict[int, int]) -> List[str]:
+    """Checks whether the resources produced can cover the resources consumed by the instances required
+    by the associations (filled with the instances consuming the least first).
+
+    :param model: Model.
+    :param leaves: Leaf components.
+    :param ancestors: Components (the component itself and its ancestors) by the leaf components' ids.
+    :param bounds: Upper bounds on the numbers of instances by the leaf components' ids.
+    :return: List of the conflicts' descriptions.
+    """
+    conflicts = []
+    productions = get_productions(model, leaves, ancestors)
+    for res in model.resources:
+        production = productions.get(res.id_, {})
+        max_production = sum(amount * bounds[id_] for id_, amount in production.items() if amount > 0)
+        min_consumption = 0
+        for cmp in model.taxonomy:
+            if cmp.association and cmp.association.min_:
+                # Every instance is required by at most one association
+                consumptions = sorted((-production.get(c.id_, 0), bounds[c.id_])
+                                      for c in __get_descendants(cmp.id_, leaves, ancestors) if bounds[c.id_])
+                required = cmp.association.min_
+                for consumption, bound in consumptions:
+                    if required <= 0:
+                        break
+                    min_consumption += max(consumption, 0) * min(bound, required)
+                    required -= bound
+        if min_consumption > max_production:
+            conflicts.append(f'Resource "{res.name}" is consumed at least in amount of {min_consumption} '
+                             f'by the required instances, but at most {max_production} of it can be produced.')
+    return conflicts
+
+
+def __get_unconnectable_components_ids(model: Model, leaves: List[Component], bounds: Dict[int, int]) -> Set[int]:
+    """Returns the leaf components having a port that has to be connected, while no compatible port
+    (in either direction) belongs to a component that can be in a configuration.
+
+    :param model: Model.
+    :param leaves: Leaf components.
+    :param bounds: Upper bounds on the numbers of instances by the leaf components' ids.
+    :return: Ids of the components that cannot be in a configuration because of their ports.
+    """
+    compatible: Dict[int, Set[int]] = {prt.id_: set() for prt in model.ports}
+    for prt in model.ports:
+        for compatible_with_id in prt.compatible_with:
+            compatible[prt.id_].add(compatible_with_id)
+            compatible.setdefault(compatible_with_id, set()).add(prt.id_)
+
+    unconnectable = set()
+    changed = True
+    while changed:
+        changed = False
+        available_ports_ids = {prt_id for c in leaves if bounds[c.id_] and c.id_ not in unconnectable
+                               for prt_id in c.ports}
+        for cmp in leaves:
+            if cmp.id_ in unconnectable or not bounds[cmp.id_]:
+                continue
+            for prt_id in cmp.ports:
+                if model.get_port(id_=prt_id).force_connection and not compatible[prt_id] & available_ports_ids:
+                    unconnectable.add(cmp.id_)
+                    changed = True
+                    break
+    return unconnectable
+
+
+def __get_descendants(cmp_id: int, leaves: List[Component], ancestors: Dict[int, List[Component]]) \
+        -> List[Component]:
+    """Returns the leaf components descending from the component (or the component itself, if it is a leaf).
+
+    :param cmp_id: Id of the component.
+    :param leaves: Leaf components.
+    :param ancestors: Components (the component itself and its ancestors) by the leaf components' ids.
+    :return: List of the leaf descendants.
+    """
+    return [c for c in leaves if any(a.id_ == cmp_id for a in ancestors[c.id_])]
@@ -0,0 +1,58 @@
+"""Measures how the time of the code generation scales with the size of the taxonomy, the time of generating
+the code again with the sections cached (after an edit of a single constraint), and the peak memory used
+when the code is built in memory and when it is streamed to a file.
+
+Run from the project's root directory:
+    python -m benchmarks.code_generation
+"""
+
+import os
+import tracemalloc
+from typing import Dict
+
+from code_generator import generate_code, write_code, GenerationCache, SYMBOLS, INSTANCES_FACTS
+from benchmarks.common import build_model, measure
+from model import Model
+
+TAXONOMY_SIZES = [1000, 2000, 4000, 8000, 16000]
+
+
+def __edit_and_generate_code(model: Model, shown_predicates_dict: Dict[str, bool], cache: GenerationCache) -> str:
+    """Edits a single constraint of the model and generates its code again, using the cache.
+
+    :param model: Model.
+    :param shown_predicates_dict: Predicates to generate the "#show" directives for.
+    :param cache: Cache of the sections generated previously.
+    :return: Generated code.
+    """
+    model.simple_constraints[0].min_ += 1
+    return generate_code(model, False, shown_predicates_dict, cache)
+
+
+def main():
+    shown_predicates_dict = {s: True for s in [INSTANCES_FACTS] + SYMBOLS}
+    print(f'{"components":>12}{"time [s]":>12}{"us / component":>18}{"cached [s]":>12}{"code [kB]":>12}'
+          f'{"peak [kB]":>12}{"streamed peak [kB]":>20}')
+    for size in TAXONOMY_SIZES:
+        model = build_model(size)
+        time_, code = measure(generate_code, model, False, shown_predicates_dict)
+        del code
+
+        cache = GenerationCache()
+        generate_code(model, False, shown_predicates_dict, cache)
+        cached_time, _ = measure(__edit_and_generate_code, model, shown_predicates_dict, cache)
+
+        tracemalloc.start()
+        code_length = len(generate_code(model, False, shown_predicates_dict))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        with open(os.devnull, 'w') as output:
+            write_code(model, False, shown_predicates_dict, output)
+        _, streamed_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f'{size:>12}{time_:>12.3f}{time_ / size * 1e6:>18.1f}{cached_time:>12.3f}{code_length / 1024:>12.0f}'
+              f'{peak / 1024:>12.0f}{streamed_peak / 1024:>20.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""Provides helper functions shared by the benchmarks."""
+
+import random
+import time
+from typing import Callable, Any, Tuple
+
+import clingo
+
+import code_generator  # Imported before model, to resolve the circular import between model and code_generator
+from model import Model, Component, Resource, Port, SimpleConstraint, ComplexConstraint, Association
+
+EXAMPLE_PATH = 'examples/tutorial/pc.json'
+ROOT_NAME = 'product'
+CHILDREN_PER_COMPONENT = 4
+RESOURCES_COUNT = 3
+PORTS_COUNT = 4
+CONSTRAINTS_COUNT = 10
+# The number of the generated compatibility rules grows quadratically with the number of components having ports,
+# hence by default only some of them have ports.
+COMPONENTS_WITH_PORTS_COUNT = 20
+
+
+def build_model(components_count: int, components_with_ports_count: int = COMPONENTS_WITH_PORTS_COUNT,
+                seed: int = 0) -> Model:
+    """Builds a synthetic model with the taxonomy of given size, as well as resources, ports, associations
+    and constraints referring to its components.
+
+    :param components_count: Number of components in the taxonomy.
+    :param components_with_ports_count: Number of leaf components that have ports.
+    :param seed: Seed of the random number generator.
+    :return: Synthetic model.
+    """
+    rand = random.Random(seed)
+    model = Model(root_name=ROOT_NAME)
+    taxonomy = []
+    for i in range(components_count):
+        parent = taxonomy[(i - 1) // CHILDREN_PER_COMPONENT] if i else None
+        level = 0 if parent is None else parent.level + 1
+        parent_id = None if parent is None else parent.id_
+        taxonomy.append(Component(f'cmp_{i}', level, parent_id=parent_id))
+    model.set_taxonomy(taxonomy)
+
+    resources = [model.add_resource(Resource(f'res_{i}')) for i in range(RESOURCES_COUNT)]
+    ports = [model.add_port(Port(f'prt_{i}', force_connection=(i == 0))) for i in range(PORTS_COUNT)]
+    for i, prt in enumerate(ports):
+        model.update_ports_compatibility(prt, [ports[(i + 1) % PORTS_COUNT]])
+
+    leaves = model.get_components(is_leaf=True)
+    for i, cmp in enumerate(leaves):
+        if rand.random() < 0.5:
+            cmp.exact = True
+            cmp.count = rand.randint(1, 3)
+        else:
+            cmp.exact = False
+            cmp.min_count = rand.randint(0, 1)
+            cmp.max_count = cmp.min_count + rand.randint(1, 2)
+        cmp.association = Association(0, cmp.count if cmp.exact else cmp.max_count)
+        cmp.produces = {rand.choice(resources).id_: rand.randint(-2, 2)}
+        if i < components_with_ports_count:
+            cmp.ports = {rand.choice(ports).id_: rand.randint(1, 2)}
+
+    for i in range(CONSTRAINTS_COUNT):
+        ids = [cmp.id_ for cmp in rand.sample(leaves, min(3, len(leaves)))]
+        model.add_constraint(SimpleConstraint(name=f'simple_{i}', min_=1, components_ids=ids, distinct=bool(i % 2)))
+        antecedent = [SimpleConstraint(name=f'ante_{i}', min_=1, components_ids=ids[:1])]
+        consequent = [SimpleConstraint(name=f'cons_{i}', max_=2, components_ids=ids[1:])]
+        model.add_constraint(ComplexConstraint(name=f'complex_{i}', antecedent=antecedent, consequent=consequent,
+                                               consequent_all=bool(i % 2)))
+    return model
+
+
+def load_example() -> Model:
+    """Loads the tutorial's example model.
+
+    :return: Example model.
+    """
+    with open(EXAMPLE_PATH) as file:
+        return Model.from_json(file.read())
+
+
+def measure(function: Callable[..., Any], *args, repeat: int = 3, **kwargs) -> Tuple[float, Any]:
+    """Measures the best execution time of a function.
+
+    :param function: Function to measure.
+    :param repeat: Number of repetitions.
+    :return: Tuple of the form (best execution time in seconds, function's result).
+    """
+    best_time, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+    return best_time, result
+
+
+class __RulesCounter:
+    """Observer of the grounding, counting the ground rules."""
+    def __init__(self):
+        self.rules_count = 0
+
+    def rule(self, *_) -> None:
+        self.rules_count += 1
+
+    def weight_rule(self, *_) -> None:
+        self.rules_count += 1
+
+
+def ground(code: str) -> Tuple[float, int]:
+    """Grounds the logic program.
+
+    :param code: Logic program.
+    :return: Tuple of the form (time of grounding in seconds, number of ground rules).
+    """
+    control = clingo.Control(['--warn=none'])
+    counter = __RulesCounter()
+    control.register_observer(counter)
+    control.add('base', [], code)
+    start = time.perf_counter()
+    control.ground([('base', [])])
+    return time.perf_counter() - start, counter.rules_count
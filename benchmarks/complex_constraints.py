@@ -0,0 +1,60 @@
+"""Compares the conditions of the complex constraints generated once per condition (default) with the identical
+conditions generated once, under a shared head: the size of the generated code, the number of ground rules
+and the time of grounding, on models whose complex constraints reuse the conditions from a small pool.
+
+Run from the project's root directory:
+    python -m benchmarks.complex_constraints
+"""
+
+import random
+
+from code_generator import generate_code
+from benchmarks.common import build_model, ground
+from model import Model, SimpleConstraint, ComplexConstraint
+
+TAXONOMY_SIZE = 200
+CONDITIONS_POOL_SIZE = 10
+CONDITIONS_PER_PART = 2
+COMPLEX_CONSTRAINTS_COUNTS = [50, 100, 200]
+
+
+def __add_complex_constraints(model: Model, constraints_count: int, seed: int = 0) -> Model:
+    """Adds complex constraints, each of whose conditions is a copy (of its own name) of a condition from the pool.
+
+    :param model: Model to add the constraints to.
+    :param constraints_count: Number of complex constraints to add.
+    :param seed: Seed of the random number generator.
+    :return: Model.
+    """
+    rand = random.Random(seed)
+    leaves = model.get_components(is_leaf=True)
+    pool = [(rand.sample([c.id_ for c in leaves], 3), rand.randint(0, 2), bool(i % 2))
+            for i in range(CONDITIONS_POOL_SIZE)]
+
+    def copy_condition(name: str) -> SimpleConstraint:
+        components_ids, min_, distinct = rand.choice(pool)
+        return SimpleConstraint(name=name, min_=min_, max_=min_ + 2, components_ids=list(components_ids),
+                                distinct=distinct)
+
+    for i in range(constraints_count):
+        model.add_constraint(ComplexConstraint(
+            name=f'rule_{i}',
+            antecedent=[copy_condition(f'rule_{i}_if_{j}') for j in range(CONDITIONS_PER_PART)],
+            consequent=[copy_condition(f'rule_{i}_then_{j}') for j in range(CONDITIONS_PER_PART)],
+            consequent_all=bool(i % 2)))
+    return model
+
+
+def main():
+    print(f'{"constraints":>12}{"conditions":>12}{"code [kB]":>12}{"ground rules":>14}{"grounding [s]":>14}')
+    for constraints_count in COMPLEX_CONSTRAINTS_COUNTS:
+        model = __add_complex_constraints(build_model(TAXONOMY_SIZE), constraints_count)
+        for shared in (False, True):
+            code = generate_code(model, True, {}, shared_conditions=shared)
+            grounding_time, rules_count = ground(code)
+            print(f'{constraints_count:>12}{"shared" if shared else "each":>12}{len(code) / 1024:>12.0f}'
+                  f'{rules_count:>14}{grounding_time:>14.3f}')
+
+
+if __name__ == '__main__':
+    main()
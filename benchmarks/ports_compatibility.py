@@ -0,0 +1,38 @@
+"""Compares the encoding of the ports' compatibility per pair of ports' individuals (default) with the encoding
+per pair of port types: the size of the generated code, the time of its generation, the number of ground rules
+and the time of grounding.
+
+Run from the project's root directory:
+    python -m benchmarks.ports_compatibility
+"""
+
+from code_generator import generate_code
+from benchmarks.common import build_model, measure, ground, load_example
+from model import Model
+
+TAXONOMY_SIZE = 400
+COMPONENTS_WITH_PORTS_COUNTS = [20, 40, 80]
+
+
+def __compare(name: str, model: Model) -> None:
+    """Prints the comparison of both encodings of the model.
+
+    :param name: Name of the model.
+    :param model: Model.
+    """
+    for by_type in (False, True):
+        time_, code = measure(generate_code, model, True, {}, ports_compatibility_by_type=by_type)
+        grounding_time, rules_count = ground(code)
+        print(f'{name:>16}{"types" if by_type else "individuals":>14}{len(code) / 1024:>12.0f}{time_:>12.3f}'
+              f'{rules_count:>14}{grounding_time:>14.3f}')
+
+
+def main():
+    print(f'{"model":>16}{"encoding":>14}{"code [kB]":>12}{"time [s]":>12}{"ground rules":>14}{"grounding [s]":>14}')
+    __compare('pc.json', load_example())
+    for count in COMPONENTS_WITH_PORTS_COUNTS:
+        __compare(f'{count} with ports', build_model(TAXONOMY_SIZE, components_with_ports_count=count))
+
+
+if __name__ == '__main__':
+    main()
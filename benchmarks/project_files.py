@@ -0,0 +1,151 @@
+"""Measures how the time of saving and loading the project scales with the size of the taxonomy, for the indented
+JSON, compact JSON and binary project files, as well as for the original path (serialization through the generic
+fallback to the objects' attributes, and decoding through the generic walk of the nested dictionaries) as a baseline.
+
+Run from the project's root directory:
+    python -m benchmarks.project_files
+"""
+
+import json
+import os
+import tempfile
+from typing import Any, Dict
+
+from benchmarks.common import build_model, measure
+from misc.project_file import ProjectFile, write_project
+from misc.json_converter import get_json_string
+from model import Model, Component, Resource, Port, SimpleConstraint, ComplexConstraint, Association
+
+TAXONOMY_SIZES = [1000, 4000, 16000, 64000]
+
+
+def save_json(model: Model, file_name: str, compact: bool) -> None:
+    """Saves model to JSON file.
+
+    :param model: Model to save.
+    :param file_name: File path.
+    :param compact: Whether to save compact JSON.
+    """
+    with open(file_name, 'w') as file:
+        file.write(get_json_string(model, compact=compact))
+
+
+def __to_attributes(obj: Any) -> Dict[str, Any]:
+    """Converts the object to the dictionary of its public attributes, as the original serializer's fallback
+    (obj.__dict__) did.
+
+    :param obj: Object.
+    :return: Dictionary of the object's attributes.
+    """
+    names = getattr(obj, '__slots__', None) or [name for name in vars(obj) if not name.startswith('_')]
+    return {name: getattr(obj, name) for name in names}
+
+
+def save_json_baseline(model: Model, file_name: str) -> None:
+    """Saves model to JSON file the original way: json.dumps with the fallback called per object, indented.
+
+    :param model: Model to save.
+    :param file_name: File path.
+    """
+    with open(file_name, 'w') as file:
+        file.write(json.dumps(model, default=__to_attributes, indent=4, sort_keys=True))
+
+
+def __from_attributes(class_, data: Dict[str, Any]) -> Any:
+    """Creates the object from the dictionary of its attributes, as the original from_json methods did: converting
+    the nested dictionaries in place and passing all the attributes as keyword arguments.
+
+    :param class_: Target class.
+    :param data: Dictionary of the object's attributes.
+    :return: Object.
+    """
+    if class_ is Component:
+        data['association'] = None if not data['association'] else Association(**data['association'])
+        data['produces'] = {int(key): val for key, val in data['produces'].items()}
+        data['ports'] = {int(key): val for key, val in data['ports'].items()}
+    elif class_ is ComplexConstraint:
+        data['antecedent'] = [__from_attributes(SimpleConstraint, sc) for sc in data['antecedent']]
+        data['consequent'] = [__from_attributes(SimpleConstraint, sc) for sc in data['consequent']]
+    return class_(**data)
+
+
+def load_json_baseline(file_name: str) -> Model:
+    """Loads model from JSON file the original way.
+
+    :param file_name: File path.
+    :return: Model.
+    """
+    with open(file_name, 'r') as file:
+        data = json.loads(file.read())
+    for section, class_ in [('taxonomy', Component), ('resources', Resource), ('ports', Port),
+                            ('simple_constraints', SimpleConstraint), ('complex_constraints', ComplexConstraint)]:
+        data[section] = list(map(lambda d: __from_attributes(class_, d), data[section]))
+    return Model(**data)
+
+
+def save_binary(model: Model, file_name: str) -> None:
+    """Saves model to binary project file.
+
+    :param model: Model to save.
+    :param file_name: File path.
+    """
+    with open(file_name, 'wb') as file:
+        write_project(model, file)
+
+
+def load_json(file_name: str) -> Model:
+    """Loads model from JSON file.
+
+    :param file_name: File path.
+    :return: Model.
+    """
+    with open(file_name, 'r') as file:
+        return Model.from_json(file.read())
+
+
+def load_binary(file_name: str) -> Model:
+    """Loads model from binary project file.
+
+    :param file_name: File path.
+    :return: Model.
+    """
+    with open(file_name, 'rb') as file, ProjectFile(file) as project_file:
+        return project_file.to_model()
+
+
+def read_binary_root_name(file_name: str) -> str:
+    """Reads only the name of the root component from binary project file.
+
+    :param file_name: File path.
+    :return: Name of the root component.
+    """
+    with open(file_name, 'rb') as file, ProjectFile(file) as project_file:
+        return project_file.root_name
+
+
+def main():
+    print(f'{"components":>12}{"format":>10}{"save [s]":>12}{"load [s]":>12}{"size [kB]":>12}')
+    with tempfile.TemporaryDirectory() as dir_name:
+        json_file_name = os.path.join(dir_name, 'project.json')
+        binary_file_name = os.path.join(dir_name, 'project.bgp')
+        for size in TAXONOMY_SIZES:
+            model = build_model(size)
+            save_time, _ = measure(save_json_baseline, model, json_file_name)
+            load_time, _ = measure(load_json_baseline, json_file_name)
+            file_size = os.path.getsize(json_file_name)
+            print(f'{size:>12}{"original":>10}{save_time:>12.3f}{load_time:>12.3f}{file_size / 1024:>12.0f}')
+            for format_, compact in [('json', False), ('compact', True)]:
+                save_time, _ = measure(save_json, model, json_file_name, compact)
+                load_time, _ = measure(load_json, json_file_name)
+                file_size = os.path.getsize(json_file_name)
+                print(f'{size:>12}{format_:>10}{save_time:>12.3f}{load_time:>12.3f}{file_size / 1024:>12.0f}')
+            save_time, _ = measure(save_binary, model, binary_file_name)
+            load_time, _ = measure(load_binary, binary_file_name)
+            root_name_time, _ = measure(read_binary_root_name, binary_file_name)
+            file_size = os.path.getsize(binary_file_name)
+            print(f'{size:>12}{"binary":>10}{save_time:>12.3f}{load_time:>12.3f}{file_size / 1024:>12.0f}'
+                  f'    (root name only: {root_name_time * 1000:.2f} ms)')
+
+
+if __name__ == '__main__':
+    main()
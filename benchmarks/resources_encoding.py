@@ -0,0 +1,84 @@
+"""Compares the balance of the resources summed over the instances (default) with the balance summed over
+the component types, by the numbers of their instances: the number of ground rules, the time of grounding
+and the time of finding a configuration, on the tutorial's example and on models of many interchangeable
+instances producing and consuming the resources.
+
+Run from the project's root directory:
+    python -m benchmarks.resources_encoding
+"""
+
+import random
+import time
+from typing import Tuple
+
+import clingo
+
+from code_generator import generate_code
+from benchmarks.common import ground, load_example
+from model import Model, Component, Resource, Association
+
+RESOURCES_COUNT = 3
+# Pairs of the form (number of components, number of instances of each of them)
+SIZES = [(10, 50), (20, 100)]
+
+
+def __build_resources_model(components_count: int, instances_count: int, seed: int = 0) -> Model:
+    """Builds a model of components, every other of them producing the resources and the rest consuming them,
+    a quarter of whose instances are required in a configuration.
+
+    :param components_count: Number of components.
+    :param instances_count: Number of instances of each component.
+    :param seed: Seed of the random number generator.
+    :return: Model.
+    """
+    rand = random.Random(seed)
+    model = Model(root_name='product')
+    group = model.add_component(Component('group', 0))
+    resources = [model.add_resource(Resource(f'res_{i}')) for i in range(RESOURCES_COUNT)]
+    for i in range(components_count):
+        cmp = model.add_component(Component(f'cmp_{i}', 1, parent_id=group.id_))
+        cmp.exact, cmp.count = True, instances_count
+        sign = 1 if i % 2 else -1
+        cmp.produces = {res.id_: sign * rand.randint(1, 9) for res in resources}
+    group.association = Association(components_count * instances_count // 4, None)
+    return model
+
+
+def __solve(code: str) -> Tuple[float, bool]:
+    """Grounds the logic program and finds its first answer set.
+
+    :param code: Logic program.
+    :return: Tuple of the form (time of solving in seconds, whether the program is satisfiable).
+    """
+    control = clingo.Control(['--warn=none'])
+    control.add('base', [], code)
+    control.ground([('base', [])])
+    start = time.perf_counter()
+    result = control.solve()
+    return time.perf_counter() - start, result.satisfiable
+
+
+def __compare(name: str, model: Model) -> None:
+    """Prints the comparison of both encodings of the model.
+
+    :param name: Name of the model.
+    :param model: Model.
+    """
+    for aggregated in (False, True):
+        code = generate_code(model, True, {}, aggregated_resources=aggregated)
+        grounding_time, rules_count = ground(code)
+        solving_time, _ = __solve(code)
+        print(f'{name:>16}{"types" if aggregated else "instances":>12}{rules_count:>14}{grounding_time:>14.3f}'
+              f'{solving_time:>12.3f}')
+
+
+def main():
+    print(f'{"model":>16}{"encoding":>12}{"ground rules":>14}{"grounding [s]":>14}{"solving [s]":>12}')
+    __compare('pc.json', load_example())
+    for components_count, instances_count in SIZES:
+        __compare(f'{components_count} x {instances_count}',
+                  __build_resources_model(components_count, instances_count))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""Compares the symmetry breaking (and ordering of the variable number of instances) by rules over all pairs of
+instances' ids (default) with the rules over the pairs of consecutive ids: the number of ground rules and the time
+of grounding, on the tutorial's example scaled up by multiplying the numbers of components' instances.
+
+Then compares the symmetry breaking with and without the lexicographic ordering of the instances by their
+connections: the number of answer sets and the time of enumerating them, on small models with many ports.
+
+Run from the project's root directory:
+    python -m benchmarks.symmetry_breaking
+"""
+
+import time
+from typing import Tuple
+
+import clingo
+
+from code_generator import generate_code
+from benchmarks.common import ground, load_example
+from model import Model, Component, Port, Association
+
+SCALES = [1, 2, 4]
+MOTHERBOARDS_COUNTS = [2, 3, 4]
+SLOTS_COUNT = 2
+
+
+def __scale(model: Model, scale: int, variable: bool) -> Model:
+    """Multiplies the numbers of the model's components' instances.
+
+    :param model: Model to scale.
+    :param scale: Factor to multiply the numbers of instances by.
+    :param variable: Whether to make the numbers of instances variable (from 0 to the scaled number).
+    :return: Scaled model.
+    """
+    for cmp in model.taxonomy:
+        if cmp.count:
+            if variable:
+                cmp.min_count, cmp.max_count, cmp.count = 0, cmp.count * scale, None
+            else:
+                cmp.count *= scale
+    return model
+
+
+def __build_ports_model(motherboards_count: int) -> Model:
+    """Builds a model of motherboards, each having GPU slots and a disk port, and of GPUs and disks to connect.
+
+    :param motherboards_count: Number of motherboards' instances (there is one more GPU's instance).
+    :return: Model.
+    """
+    model = Model(root_name='computer')
+    motherboard = model.add_component(Component('motherboard', 0, symmetry_breaking=True))
+    gpu = model.add_component(Component('gpu', 0, symmetry_breaking=True))
+    disk = model.add_component(Component('disk', 0, symmetry_breaking=True))
+    slot, plug, sata, sata_plug = [model.add_port(Port(name)) for name in ('slot', 'plug', 'sata', 'sata_plug')]
+    model.update_ports_compatibility(slot, [plug])
+    model.update_ports_compatibility(sata, [sata_plug])
+    for cmp, count, ports in [(motherboard, motherboards_count, {slot.id_: SLOTS_COUNT, sata.id_: 1}),
+                              (gpu, motherboards_count + 1, {plug.id_: 1}),
+                              (disk, 2, {sata_plug.id_: 1})]:
+        cmp.exact, cmp.count, cmp.ports = True, count, ports
+        cmp.association = Association(1 if cmp is motherboard else 0, count)
+    return model
+
+
+def __enumerate(code: str) -> Tuple[float, int]:
+    """Grounds the logic program and enumerates all its answer sets.
+
+    :param code: Logic program.
+    :return: Tuple of the form (time of grounding and enumerating in seconds, number of answer sets).
+    """
+    start = time.perf_counter()
+    control = clingo.Control(['0', '--warn=none'])
+    control.add('base', [], code)
+    control.ground([('base', [])])
+    answer_sets_count = 0
+    with control.solve(yield_=True) as handle:
+        for _ in handle:
+            answer_sets_count += 1
+    return time.perf_counter() - start, answer_sets_count
+
+
+def main():
+    print(f'{"scale":>8}{"counts":>10}{"encoding":>12}{"ground rules":>14}{"grounding [s]":>14}')
+    for scale in SCALES:
+        for variable in (False, True):
+            model = __scale(load_example(), scale, variable)
+            for linear in (False, True):
+                code = generate_code(model, True, {}, linear_symmetry_breaking=linear)
+                grounding_time, rules_count = ground(code)
+                print(f'{scale:>8}{"variable" if variable else "exact":>10}{"linear" if linear else "pairs":>12}'
+                      f'{rules_count:>14}{grounding_time:>14.3f}')
+
+    print(f'\n{"motherboards":>14}{"connections":>14}{"answer sets":>14}{"time [s]":>12}')
+    for motherboards_count in MOTHERBOARDS_COUNTS:
+        model = __build_ports_model(motherboards_count)
+        for connections in (False, True):
+            code = generate_code(model, True, {}, deterministic_ports_binding=True,
+                                 connections_symmetry_breaking=connections)
+            time_, answer_sets_count = __enumerate(code)
+            print(f'{motherboards_count:>14}{"ordered" if connections else "-":>14}{answer_sets_count:>14}'
+                  f'{time_:>12.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Measures how the time of importing the taxonomy from string and of adding components one at a time scales
+with the size of the taxonomy.
+
+Run from the project's root directory:
+    python -m benchmarks.taxonomy_editing
+"""
+
+from benchmarks.common import measure, ROOT_NAME, CHILDREN_PER_COMPONENT
+from model import Model, Component
+from model.helpers import string_converter
+
+TAXONOMY_SIZES = [1000, 5000, 10000, 50000]
+
+
+def build_taxonomy_string(components_count: int) -> str:
+    """Builds a string representation of a synthetic taxonomy of given size.
+
+    :param components_count: Number of components in the taxonomy.
+    :return: Taxonomy's string representation.
+    """
+    lines = []
+    stack = [(0, 0)]    # Pairs of the form (component's number, component's level)
+    while stack:
+        i, level = stack.pop()
+        lines.append(level * string_converter.CHILD_SYMBOL + f'cmp_{i}')
+        children = range(i * CHILDREN_PER_COMPONENT + 1, min((i + 1) * CHILDREN_PER_COMPONENT + 1, components_count))
+        stack.extend((child, level + 1) for child in reversed(children))
+    return string_converter.NEWLINE_SYMBOL.join(lines)
+
+
+def import_taxonomy(taxonomy_string: str) -> Model:
+    """Imports the taxonomy from string into a new model.
+
+    :param taxonomy_string: Taxonomy's string representation.
+    :return: Model with the imported taxonomy.
+    """
+    model = Model(root_name=ROOT_NAME)
+    model.set_taxonomy(string_converter.string_to_taxonomy(taxonomy_string))
+    return model
+
+
+def add_components(components_count: int) -> Model:
+    """Adds the components of a synthetic taxonomy one at a time to a new model.
+
+    :param components_count: Number of components to add.
+    :return: Model with the added components.
+    """
+    model = Model(root_name=ROOT_NAME)
+    taxonomy = []
+    for i in range(components_count):
+        parent = taxonomy[(i - 1) // CHILDREN_PER_COMPONENT] if i else None
+        level = 0 if parent is None else parent.level + 1
+        parent_id = None if parent is None else parent.id_
+        taxonomy.append(model.add_component(Component(f'cmp_{i}', level, parent_id=parent_id)))
+    return model
+
+
+def main():
+    print(f'{"components":>12}{"import [s]":>12}{"add [s]":>12}')
+    for size in TAXONOMY_SIZES:
+        taxonomy_string = build_taxonomy_string(size)
+        import_time, _ = measure(import_taxonomy, taxonomy_string)
+        add_time, _ = measure(add_components, size)
+        print(f'{size:>12}{import_time:>12.3f}{add_time:>12.3f}')
+
+
+if __name__ == '__main__':
+    main()
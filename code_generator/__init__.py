@@ -1,2 +1,4 @@
-from .code_generator import KEYWORDS, generate_code, DOMAIN_STRING, PRD_SYMBOL, SYMBOLS, CN_SYMBOL, IN_SYMBOL, \
-    INSTANCES_FACTS
+from .code_generator import KEYWORDS, generate_code, write_code, create_symbol_table, \
+    DOMAIN_STRING, PRD_SYMBOL, CNT_SYMBOL, SYMBOLS, CN_SYMBOL, IN_SYMBOL, INSTANCES_FACTS
+from .generation_cache import GenerationCache
+from .symbol_table import SymbolTable, SYMBOL_TABLE_EXTENSION
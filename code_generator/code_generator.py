@@ -1,8 +1,12 @@
 """Provides functionality for generation of the ASP code."""
 
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, TextIO, Optional, Callable, Any, Set
 
 from model import Model, Component, Port, SimpleConstraint
+from code_generator.code_writer import CodeWriter
+from code_generator.generation_cache import GenerationCache
+from code_generator.symbol_table import SymbolTable
+from analysis.common import get_ancestors, get_productions
 from misc.project_info import PROJECT_WEBSITE, PROJECT_VERSION, AUTHOR_EMAIL
 
 DEFAULT_NEGATION_OPERATOR = 'not'
@@ -29,6 +33,7 @@ PPAT_SYMBOL = 'ppat'
 RES_SYMBOL = 'res'
 RES_VARIABLE = 'R'
 PRD_SYMBOL = 'prd'
+CNT_SYMBOL = 'cnt'
 # Ports
 PON_SYMBOL = 'pon'
 PRT_SYMBOL = 'prt'
@@ -36,6 +41,13 @@ PRT_VARIABLE = 'P'
 CMB_SYMBOL = 'cmb'
 PO_SYMBOL = 'po'
 CN_SYMBOL = 'cn'
+PTY_SYMBOL = 'pty'
+CMBT_SYMBOL = 'cmbt'
+TYPE_VARIABLE = 'T'
+# Lexicographic symmetry breaking over connections
+LXC_SYMBOL = 'lxc'
+LXV_SYMBOL = 'lxv'
+LXE_SYMBOL = 'lxe'
 
 # Key in the "shown_predicates_dictionary"
 # if value is True then show instances facts
@@ -83,195 +95,513 @@ KEYWORDS = [
     CMB_SYMBOL,
     PO_SYMBOL,
     CN_SYMBOL,
+    PTY_SYMBOL,
+    CMBT_SYMBOL,
+    TYPE_VARIABLE,
+    LXC_SYMBOL,
+    LXV_SYMBOL,
+    LXE_SYMBOL,
+    CNT_SYMBOL,
 ]
 
 SYMBOLS = list(SYMBOLS_WITH_ARITIES.keys())
 
-DOMAIN_STRING = 'Domain'
+# Indexes of the arguments holding the string constants (interned as integer codes, if requested) by predicates' symbols
+INTERNED_ARGUMENTS = {
+    PAN_SYMBOL: [0],
+    PPA_SYMBOL: [2],
+    PA_SYMBOL: [2],
+    RES_SYMBOL: [0],
+    PRD_SYMBOL: [1],
+    PON_SYMBOL: [0],
+    PO_SYMBOL: [2],
+    PTY_SYMBOL: [1],
+    CMBT_SYMBOL: [0, 1]
+}
 
+DOMAIN_STRING = 'Domain'
 
-def generate_code(model: Model, show_all_predicates: bool, shown_predicates_dict: Dict[str, bool]) -> str:
+# Names of the sections of code, cached separately
+TAXONOMY_SECTION = 'taxonomy'
+ASSOCIATIONS_SECTION = 'associations'
+RESOURCES_SECTION = 'resources'
+PORTS_SECTION = 'ports'
+CONSTRAINTS_SECTION = 'constraints'
+INSTANCES_SECTION = 'instances'
+
+
+def generate_code(model: Model, show_all_predicates: bool, shown_predicates_dict: Dict[str, bool],
+                  cache: Optional[GenerationCache] = None, ports_compatibility_by_type: bool = False,
+                  deterministic_ports_binding: bool = False, linear_symmetry_breaking: bool = False,
+                  connections_symmetry_breaking: bool = False, symbol_table: Optional[SymbolTable] = None,
+                  instances_counts: Optional[Dict[int, int]] = None, aggregated_resources: bool = False,
+                  shared_conditions: bool = False, simple_constraints: Optional[List[SimpleConstraint]] = None,
+                  dead_code_elimination: bool = False) -> str:
     """Generates ASP encoding of the model.
 
     :param model: Model to generate the encoding of.
     :param show_all_predicates: Whether to show all predicates or the selected ones.
     :param shown_predicates_dict:   Dictionary of type predicate_symbol: show?
+    :param cache: Cache of the sections generated previously; if given, only the sections whose data has changed
+        are generated anew.
+    :param ports_compatibility_by_type: Whether to encode the compatibility of ports once per pair of port types,
+        instead of once per pair of ports' individuals.
+    :param deterministic_ports_binding: Whether to bind the ports' instances to the components' instances
+        according to their ids, instead of letting the solver choose them.
+    :param linear_symmetry_breaking: Whether to order the instances by rules over the pairs of consecutive ids
+        (grounding linearly in the number of instances), instead of all pairs of ids (grounding quadratically).
+    :param connections_symmetry_breaking: Whether to order the instances (of the components with symmetry breaking)
+        lexicographically by their connections too.
+    :param symbol_table: Table of the model's string constants (see create_symbol_table); if given, the constants
+        are encoded by their integer codes instead of the strings.
+    :param instances_counts: Numbers of instances of the components (by their ids) to generate instead of the ones
+        set in the model (e.g. tightened by the bounds propagation).
+    :param aggregated_resources: Whether to balance the resources by the numbers of instances of each component type
+        multiplied by the amounts they produce, instead of the amounts produced by each instance.
+    :param shared_conditions: Whether to generate the identical conditions of the complex constraints once,
+        under a head shared by all of them, instead of once per condition.
+    :param simple_constraints: Simple constraints to generate instead of the ones of the model
+        (e.g. simplified by the constraints simplification).
+    :param dead_code_elimination: Whether to leave out the rules of the taxonomy, resources and ports that never
+        apply, since the components (or ports' individuals) they refer to have no instances.
     :return: Model's ASP encoding.
     """
-    info = __generate_code_info()
-    root_code = __generate_root_code(model)
-    taxonomy_def = __generate_taxonomy_ontology_definitions()
-    taxonomy_code = __generate_taxonomy_code(model)
-    associations_def = __generate_associations_ontology_definitions()
-    associations_code = __generate_associations_code(model)
-    resource_code = __generate_resources_code(model)
-    resource_def = __generate_resources_ontology_definitions()
-    ports_def = __generate_ports_ontology_definitions()
-    ports_code = __generate_ports_code(model)
-    simple_constraints_code, complex_constraints_code = __generate_constraints_code(model)
-    instances_code, instances_predicates = __generate_instances_code(model)
-    show_directives = __generate_show_directives(show_all_predicates, shown_predicates_dict, instances_predicates)
-
-    return f'{info} \n{root_code}' \
-           f'\n%\n% Taxonomy ontology definitions\n%\n{taxonomy_def}\n%\n% Component taxonomy\n%\n{taxonomy_code}' \
-           f'\n%\n% Associations ontology definitions\n%\n{associations_def}\n%\n% Associations\n%\n{associations_code}' \
-           f'\n%\n% Resources ontology definitions\n%\n{resource_def}\n%\n% Resource\n%\n{resource_code}' \
-           f'\n%\n% Ports ontology definitions\n%\n{ports_def}\n%\n% Ports\n%\n{ports_code}' \
-           f'\n%\n% Constraints\n%\n%\n% Simple constraints\n%\n{simple_constraints_code}' \
-           f'\n%\n% Complex constraints\n%\n{complex_constraints_code}' \
-           f'\n%\n% Instances\n%\n{instances_code}' \
-           f'\n\n{show_directives}'
-
-
-def __generate_code_info() -> str:
-    """Creates header comment for the generated file.
-
-    :return: Header comment.
-    """
-    info = ''
-    info += f'%=====================================================================================\n'
-    info += f'%\n'
-    info += f'% The following ASP code has been generated by the "Benchmark Generator" version {PROJECT_VERSION}.\n'
-    info += f'% In case of problems please refer to:\n'
-    info += f'% \t{PROJECT_WEBSITE}\n'
-    info += f'% or write an email to:\n'
-    info += f'% \t{AUTHOR_EMAIL}\n'
-    info += f'%\n'
-    info += f'%=====================================================================================\n'
-    return info
-
-
-def __generate_root_code(model: Model) -> str:
+    code = CodeWriter()
+    __generate_program(model, show_all_predicates, shown_predicates_dict, code, cache, ports_compatibility_by_type,
+                       deterministic_ports_binding, linear_symmetry_breaking, connections_symmetry_breaking,
+                       symbol_table, instances_counts, aggregated_resources, shared_conditions, simple_constraints,
+                       dead_code_elimination)
+    return code.getvalue()
+
+
+def write_code(model: Model, show_all_predicates: bool, shown_predicates_dict: Dict[str, bool],
+               output: TextIO, cache: Optional[GenerationCache] = None,
+               ports_compatibility_by_type: bool = False, deterministic_ports_binding: bool = False,
+               linear_symmetry_breaking: bool = False, connections_symmetry_breaking: bool = False,
+               symbol_table: Optional[SymbolTable] = None, instances_counts: Optional[Dict[int, int]] = None,
+               aggregated_resources: bool = False, shared_conditions: bool = False,
+               simple_constraints: Optional[List[SimpleConstraint]] = None,
+               dead_code_elimination: bool = False) -> int:
+    """Generates ASP encoding of the model, streaming it to the output in chunks
+    (so that the whole encoding is never kept in memory, unless the cache is given).
+
+    :param model: Model to generate the encoding of.
+    :param show_all_predicates: Whether to show all predicates or the selected ones.
+    :param shown_predicates_dict:   Dictionary of type predicate_symbol: show?
+    :param output: Output (e.g. file opened for writing) to write the encoding to.
+    :param cache: Cache of the sections generated previously; if given, only the sections whose data has changed
+        are generated anew.
+    :param ports_compatibility_by_type: Whether to encode the compatibility of ports once per pair of port types,
+        instead of once per pair of ports' individuals.
+    :param deterministic_ports_binding: Whether to bind the ports' instances to the components' instances
+        according to their ids, instead of letting the solver choose them.
+    :param linear_symmetry_breaking: Whether to order the instances by rules over the pairs of consecutive ids
+        (grounding linearly in the number of instances), instead of all pairs of ids (grounding quadratically).
+    :param connections_symmetry_breaking: Whether to order the instances (of the components with symmetry breaking)
+        lexicographically by their connections too.
+    :param symbol_table: Table of the model's string constants (see create_symbol_table); if given, the constants
+        are encoded by their integer codes instead of the strings.
+    :param instances_counts: Numbers of instances of the components (by their ids) to generate instead of the ones
+        set in the model (e.g. tightened by the bounds propagation).
+    :param aggregated_resources: Whether to balance the resources by the numbers of instances of each component type
+        multiplied by the amounts they produce, instead of the amounts produced by each instance.
+    :param shared_conditions: Whether to generate the identical conditions of the complex constraints once,
+        under a head shared by all of them, instead of once per condition.
+    :param simple_constraints: Simple constraints to generate instead of the ones of the model
+        (e.g. simplified by the constraints simplification).
+    :param dead_code_elimination: Whether to leave out the rules of the taxonomy, resources and ports that never
+        apply, since the components (or ports' individuals) they refer to have no instances.
+    :return: Number of the rules left out by the dead code elimination (0 unless enabled).
+    """
+    code = CodeWriter(output)
+    pruned_rules_count = __generate_program(model, show_all_predicates, shown_predicates_dict, code, cache,
+                                            ports_compatibility_by_type, deterministic_ports_binding,
+                                            linear_symmetry_breaking, connections_symmetry_breaking, symbol_table,
+                                            instances_counts, aggregated_resources, shared_conditions,
+                                            simple_constraints, dead_code_elimination)
+    code.flush()
+    return pruned_rules_count
+
+
+def __generate_program(model: Model, show_all_predicates: bool, shown_predicates_dict: Dict[str, bool],
+                       code: CodeWriter, cache: Optional[GenerationCache], ports_compatibility_by_type: bool,
+                       deterministic_ports_binding: bool, linear_symmetry_breaking: bool,
+                       connections_symmetry_breaking: bool, symbol_table: Optional[SymbolTable],
+                       instances_counts: Optional[Dict[int, int]], aggregated_resources: bool,
+                       shared_conditions: bool, simple_constraints: Optional[List[SimpleConstraint]],
+                       dead_code_elimination: bool) -> int:
+    """Generates ASP encoding of the model.
+
+    :param model: Model to generate the encoding of.
+    :param show_all_predicates: Whether to show all predicates or the selected ones.
+    :param shown_predicates_dict:   Dictionary of type predicate_symbol: show?
+    :param code: Writer to write the encoding to.
+    :param cache: Cache of the sections generated previously (or None).
+    :param ports_compatibility_by_type: Whether to encode the compatibility of ports once per pair of port types.
+    :param deterministic_ports_binding: Whether to bind the ports' instances to the components' instances
+        according to their ids.
+    :param linear_symmetry_breaking: Whether to order the instances by rules over the pairs of consecutive ids.
+    :param connections_symmetry_breaking: Whether to order the instances lexicographically by their connections too.
+    :param symbol_table: Table of the model's string constants to encode by their codes (or None).
+    :param instances_counts: Numbers of instances of the components to generate instead of the model's ones (or None).
+    :param aggregated_resources: Whether to balance the resources by the numbers of instances of component types.
+    :param shared_conditions: Whether to generate the identical conditions of the complex constraints once.
+    :param simple_constraints: Simple constraints to generate instead of the model's ones (or None).
+    :param dead_code_elimination: Whether to leave out the rules referring to the components without instances.
+    :return: Number of the rules left out by the dead code elimination.
+    """
+    symbols = symbol_table.get_data() if symbol_table is not None else None
+    counts = tuple(sorted(instances_counts.items())) if instances_counts else None
+    constraints = tuple(repr(ctr.to_json()) for ctr in simple_constraints) if simple_constraints is not None else None
+    dead_ids = __get_dead_components_ids(model, instances_counts) if dead_code_elimination else None
+    dead = tuple(sorted(dead_ids)) if dead_ids is not None else None
+    __generate_code_info(code)
+    code.write(' \n')
+    __generate_root_code(model, code)
+    code.write('\n%\n% Taxonomy ontology definitions\n%\n')
+    __generate_taxonomy_ontology_definitions(code)
+    code.write('\n%\n% Component taxonomy\n%\n')
+    pruned_rules_count = __generate_section(TAXONOMY_SECTION,
+                                            lambda m: (dead, __get_taxonomy_data(m)),
+                                            lambda m, c: __generate_taxonomy_code(m, c, dead_ids),
+                                            model, code, cache)
+    code.write('\n%\n% Associations ontology definitions\n%\n')
+    __generate_associations_ontology_definitions(code)
+    code.write('\n%\n% Associations\n%\n')
+    __generate_section(ASSOCIATIONS_SECTION,
+                       lambda m: (symbols, __get_associations_data(m)),
+                       lambda m, c: __generate_associations_code(m, c, symbol_table),
+                       model, code, cache)
+    if not aggregated_resources:    # Otherwise the resources are balanced by the rules specific to component types
+        code.write('\n%\n% Resources ontology definitions\n%\n')
+        __generate_resources_ontology_definitions(code)
+    code.write('\n%\n% Resource\n%\n')
+    pruned_rules_count += __generate_section(RESOURCES_SECTION,
+                                             # Produced amounts depend on the ancestors' ones too
+                                             lambda m: (symbols, aggregated_resources, dead, __get_resources_data(m),
+                                                        __get_taxonomy_data(m) if aggregated_resources else None),
+                                             lambda m, c: __generate_resources_code(m, c, symbol_table,
+                                                                                    aggregated_resources, dead_ids),
+                                             model, code, cache)
+    code.write('\n%\n% Ports ontology definitions\n%\n')
+    __generate_ports_ontology_definitions(code)
+    code.write('\n%\n% Ports\n%\n')
+    pruned_rules_count += __generate_section(PORTS_SECTION,
+                                             lambda m: (ports_compatibility_by_type, deterministic_ports_binding,
+                                                        dead_code_elimination, symbols, counts, __get_ports_data(m)),
+                                             lambda m, c: __generate_ports_code(m, c, ports_compatibility_by_type,
+                                                                                deterministic_ports_binding,
+                                                                                symbol_table, instances_counts,
+                                                                                dead_code_elimination),
+                                             model, code, cache)
+    code.write('\n%\n% Constraints\n%\n')
+    __generate_section(CONSTRAINTS_SECTION,
+                       lambda m: (shared_conditions, constraints, __get_constraints_data(m)),
+                       lambda m, c: __generate_constraints_code(m, c, shared_conditions, simple_constraints),
+                       model, code, cache)
+    code.write('\n%\n% Instances\n%\n')
+    instances_predicates = __generate_section(INSTANCES_SECTION,
+                                              lambda m: (deterministic_ports_binding, linear_symmetry_breaking,
+                                                         connections_symmetry_breaking, symbols, counts,
+                                                         __get_instances_data(m)),
+                                              lambda m, c: __generate_instances_code(m, c, deterministic_ports_binding,
+                                                                                     linear_symmetry_breaking,
+                                                                                     connections_symmetry_breaking,
+                                                                                     symbol_table, instances_counts),
+                                              model, code, cache)
+    code.write('\n\n')
+    __generate_show_directives(show_all_predicates, shown_predicates_dict, instances_predicates, code)
+    return pruned_rules_count
+
+
+def __generate_section(section: str, get_data: Callable[[Model], Tuple],
+                       generate_section: Callable[[Model, CodeWriter], Any], model: Model, code: CodeWriter,
+                       cache: Optional[GenerationCache]) -> Any:
+    """Generates the section of code, or takes it from the cache if the data it depends on has not changed.
+
+    :param section: Name of the section.
+    :param get_data: Function returning the model's data the section depends on.
+    :param generate_section: Function generating the section.
+    :param model: Model.
+    :param code: Writer to write the section to.
+    :param cache: Cache of the sections generated previously (or None).
+    :return: Result of the section's generation.
+    """
+    if cache is None:
+        return generate_section(model, code)
+    data = get_data(model)
+    cached = cache.get(section, data)
+    if cached is None:
+        section_code = CodeWriter()
+        result = generate_section(model, section_code)
+        cached = section_code.getvalue(), result
+        cache.put(section, data, *cached)
+    section_code, result = cached
+    code.write(section_code)
+    return result
+
+
+def __get_taxonomy_data(model: Model) -> Tuple:
+    """Returns the model's data the taxonomy's code depends on."""
+    return tuple((c.id_, c.name, c.parent_id) for c in model.taxonomy)
+
+
+def __get_associations_data(model: Model) -> Tuple:
+    """Returns the model's data the associations' code depends on."""
+    return model.root_name, tuple((c.name, c.association.min_, c.association.max_)
+                                  for c in model.taxonomy if c.association)
+
+
+def __get_resources_data(model: Model) -> Tuple:
+    """Returns the model's data the resources' code depends on."""
+    return tuple((r.id_, r.name) for r in model.resources), \
+        tuple((c.name, tuple(c.produces.items())) for c in model.taxonomy if c.produces)
+
+
+def __get_ports_data(model: Model) -> Tuple:
+    """Returns the model's data the ports' code depends on."""
+    return tuple((p.id_, p.name, p.force_connection, tuple(p.compatible_with)) for p in model.ports), \
+        tuple((c.name, tuple(c.ports.items()), c.is_leaf, c.count, c.min_count, c.max_count)
+              for c in model.taxonomy if c.ports)
+
+
+def __get_constraints_data(model: Model) -> Tuple:
+    """Returns the model's data the constraints' code depends on."""
+    components_ids = set()
+    for ctr in model.simple_constraints:
+        components_ids.update(ctr.components_ids)
+    for ctr in model.complex_constraints:
+        for condition in ctr.antecedent + ctr.consequent:
+            components_ids.update(condition.components_ids)
+    components = model.get_components_by_ids(list(components_ids))
+    return model.root_name, tuple((c.id_, c.name) for c in components), \
+        tuple(repr(ctr.to_json()) for ctr in model.get_all_constraints())
+
+
+def __get_instances_data(model: Model) -> Tuple:
+    """Returns the model's data the instances' code depends on."""
+    return model.root_name, tuple((p.id_, p.name, tuple(p.compatible_with)) for p in model.ports), \
+        tuple((c.id_, c.name, c.is_leaf, c.count, c.min_count, c.max_count, c.symmetry_breaking, tuple(c.ports.items()))
+              for c in model.taxonomy)
+
+
+def create_symbol_table(model: Model) -> SymbolTable:
+    """Creates the table of the model's string constants: names of the ports' individuals, associations, resources
+    and port types, along with the arguments of predicates holding them.
+
+    :param model: Model.
+    :return: Symbol table of the model.
+    """
+    symbol_table = SymbolTable(arguments=INTERNED_ARGUMENTS)
+    for c in model.taxonomy:
+        if c.association:
+            symbol_table.intern(c.name)
+    for r in model.resources:
+        symbol_table.intern(r.name)
+        symbol_table.add_arguments(r.name, [0])
+    for prt in model.ports:
+        symbol_table.intern(prt.name)
+    for c in model.taxonomy:
+        for prt_id in c.ports:
+            for prt_individual_name in __get_port_individual_names(c, model.get_port(id_=prt_id)):
+                symbol_table.intern(prt_individual_name)
+    return symbol_table
+
+
+def __get_constant(name: str, symbol_table: Optional[SymbolTable]) -> str:
+    """Returns the string constant's representation in the code.
+
+    :param name: String constant.
+    :param symbol_table: Table of the string constants (or None).
+    :return: Quoted string constant; its integer code if the symbol table is given.
+    """
+    if symbol_table is None:
+        return f'"{name}"'
+    return str(symbol_table.get_code(name))
+
+
+def __generate_code_info(code: CodeWriter) -> None:
+    """Generates header comment for the generated file.
+
+    :param code: Writer to write the header comment to.
+    """
+    code.write(f'%=====================================================================================\n',
+               f'%\n',
+               f'% The following ASP code has been generated by the "Benchmark Generator" version {PROJECT_VERSION}.\n',
+               f'% In case of problems please refer to:\n',
+               f'% \t{PROJECT_WEBSITE}\n',
+               f'% or write an email to:\n',
+               f'% \t{AUTHOR_EMAIL}\n',
+               f'%\n',
+               f'%=====================================================================================\n')
+
+
+def __generate_root_code(model: Model, code: CodeWriter) -> None:
     """Generates root component's code.
 
     :param model: Model.
-    :return: Root component's code.
+    :param code: Writer to write the root component's code to.
     """
-    root_code = f'{ROOT_SYMBOL}({CMP_VARIABLE}) :- {model.root_name}({CMP_VARIABLE}).\n'
-    root_code += f'{CMP_SYMBOL}({CMP_VARIABLE}) :- {model.root_name}({CMP_VARIABLE}).\n'
-    return root_code
+    code.write(f'{ROOT_SYMBOL}({CMP_VARIABLE}) :- {model.root_name}({CMP_VARIABLE}).\n',
+               f'{CMP_SYMBOL}({CMP_VARIABLE}) :- {model.root_name}({CMP_VARIABLE}).\n')
 
 
-def __generate_taxonomy_code(model: Model) -> str:
+def __generate_taxonomy_code(model: Model, code: CodeWriter, dead_components_ids: Optional[Set[int]] = None) -> int:
     """Generates taxonomy of components' code.
 
     :param model: Model
-    :return: Taxonomy of components' code.
+    :param code: Writer to write the taxonomy of components' code to.
+    :param dead_components_ids: Ids of the components without instances, whose rules are left out (or None).
+    :return: Number of the rules left out.
     """
-    taxonomy_code = ''
+    pruned_rules_count = 0
     for c in model.taxonomy:
+        if dead_components_ids is not None and c.id_ in dead_components_ids:
+            pruned_rules_count += 1
+            continue
         parent_name = CMP_SYMBOL
         if c.parent_id:
             parent: Component = model.get_component(id_=c.parent_id)
             parent_name = parent.name   # If there is a parent, overwrite :parent_name:
 
-        taxonomy_code += f'{parent_name}({CMP_VARIABLE}) :- {c.name}({CMP_VARIABLE}).\n'
-    return taxonomy_code
+        code.write(f'{parent_name}({CMP_VARIABLE}) :- {c.name}({CMP_VARIABLE}).\n')
+    return pruned_rules_count
 
 
-def __generate_taxonomy_ontology_definitions():
+def __generate_taxonomy_ontology_definitions(code: CodeWriter) -> None:
     """Generates ontology definitions regarding taxonomy of components.
     (Ontology definitions are the same for every instance of configuration problem.)
 
-    :return: Ontology definitions of taxonomy.
+    :param code: Writer to write the ontology definitions of taxonomy to.
     """
-    definitions = f'1 {{ {IN_SYMBOL}({CMP_VARIABLE}) : root({CMP_VARIABLE}) }} 1.\n'
-    return definitions
+    code.write(f'1 {{ {IN_SYMBOL}({CMP_VARIABLE}) : root({CMP_VARIABLE}) }} 1.\n')
 
 
-def __generate_associations_ontology_definitions():
+def __generate_associations_ontology_definitions(code: CodeWriter) -> None:
     """Generates ontology definitions regarding associations.
     (Ontology definitions are the same for every instance of configuration problem.)
 
-    :return: Ontology definitions of associations.
+    :param code: Writer to write the ontology definitions of associations to.
     """
-    definitions = ''
-    definitions += f'{IN_SYMBOL}({CMP_VARIABLE}2) :- {PA_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}2, {N_VARIABLE}), ' \
-                   f'{CMP_SYMBOL}({CMP_VARIABLE}1), {CMP_SYMBOL}({CMP_VARIABLE}2), {PAN_SYMBOL}({N_VARIABLE}).\n'
-    definitions += f':- {CMP_SYMBOL}({CMP_VARIABLE}2), 2 {{ {PA_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}2, ' \
-                   f'{N_VARIABLE}) : {CMP_SYMBOL}({CMP_VARIABLE}1), {PAN_SYMBOL}({N_VARIABLE}) }}.\n'
-    definitions += f'{PPAT_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}2) :- ' \
-                   f'{PPA_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}2, {N_VARIABLE}), {PAN_SYMBOL}({N_VARIABLE}).\n'
-    definitions += f'{PPAT_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}3) :- {PPA_SYMBOL}({CMP_VARIABLE}1, ' \
-                   f'{CMP_VARIABLE}2, {N_VARIABLE}), {CMP_SYMBOL}({CMP_VARIABLE}3), {PPAT_SYMBOL}({CMP_VARIABLE}2, ' \
-                   f'{CMP_VARIABLE}3), {PAN_SYMBOL}({N_VARIABLE}).\n'
-    definitions += f':- {PPAT_SYMBOL}({CMP_VARIABLE}, {CMP_VARIABLE}), {CMP_SYMBOL}({CMP_VARIABLE}).\n'
-    return definitions
-
-
-def __generate_associations_code(model: Model) -> str:
+    code.write(f'{IN_SYMBOL}({CMP_VARIABLE}2) :- {PA_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}2, {N_VARIABLE}), '
+               f'{CMP_SYMBOL}({CMP_VARIABLE}1), {CMP_SYMBOL}({CMP_VARIABLE}2), {PAN_SYMBOL}({N_VARIABLE}).\n',
+               f':- {CMP_SYMBOL}({CMP_VARIABLE}2), 2 {{ {PA_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}2, '
+               f'{N_VARIABLE}) : {CMP_SYMBOL}({CMP_VARIABLE}1), {PAN_SYMBOL}({N_VARIABLE}) }}.\n',
+               f'{PPAT_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}2) :- '
+               f'{PPA_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}2, {N_VARIABLE}), {PAN_SYMBOL}({N_VARIABLE}).\n',
+               f'{PPAT_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}3) :- {PPA_SYMBOL}({CMP_VARIABLE}1, '
+               f'{CMP_VARIABLE}2, {N_VARIABLE}), {CMP_SYMBOL}({CMP_VARIABLE}3), {PPAT_SYMBOL}({CMP_VARIABLE}2, '
+               f'{CMP_VARIABLE}3), {PAN_SYMBOL}({N_VARIABLE}).\n',
+               f':- {PPAT_SYMBOL}({CMP_VARIABLE}, {CMP_VARIABLE}), {CMP_SYMBOL}({CMP_VARIABLE}).\n')
+
+
+def __generate_associations_code(model: Model, code: CodeWriter, symbol_table: Optional[SymbolTable] = None) -> None:
     """Generates associations' code.
 
     :param model: Model.
-    :return: Associations' code.
+    :param code: Writer to write the associations' code to.
+    :param symbol_table: Table of the string constants to encode by their codes (or None).
     """
-    associations_code = ''
     for c in model.taxonomy:
         if c.association:
-            associations_code += f'{PAN_SYMBOL}("{c.name}").\n'
-            associations_code += f'{PPA_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}2, "{c.name}") :- ' \
-                                 f'{model.root_name}({CMP_VARIABLE}1), {c.name}({CMP_VARIABLE}2).\n'
             min_ = '' if c.association.min_ is None else c.association.min_
             max_ = '' if c.association.max_ is None else c.association.max_
-            associations_code += f'{min_} {{ {PA_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}2, "{c.name}") : ' \
-                                 f'{PPA_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}2, "{c.name}") }} {max_} :- ' \
-                                 f'{IN_SYMBOL}({CMP_VARIABLE}1), {model.root_name}({CMP_VARIABLE}1).\n'
-    return associations_code
+            name = __get_constant(c.name, symbol_table)
+            code.write(f'{PAN_SYMBOL}({name}).\n',
+                       f'{PPA_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}2, {name}) :- '
+                       f'{model.root_name}({CMP_VARIABLE}1), {c.name}({CMP_VARIABLE}2).\n',
+                       f'{min_} {{ {PA_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}2, {name}) : '
+                       f'{PPA_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}2, {name}) }} {max_} :- '
+                       f'{IN_SYMBOL}({CMP_VARIABLE}1), {model.root_name}({CMP_VARIABLE}1).\n')
 
 
-def __generate_resources_ontology_definitions() -> str:
-    """Generates ontology definitions regarding taxonomy of components.
+def __generate_resources_ontology_definitions(code: CodeWriter) -> None:
+    """Generates ontology definitions regarding resources.
     (Ontology definitions are the same for every instance of configuration problem.)
 
-    :return: Ontology definitions of taxonomy.
+    :param code: Writer to write the ontology definitions of resources to.
     """
-    definitions = ''
-    definitions += f':- {RES_SYMBOL}({RES_VARIABLE}), #sum {{ {M_VARIABLE},{CMP_VARIABLE} : ' \
-                   f'{PRD_SYMBOL}({CMP_VARIABLE}, {RES_VARIABLE}, {M_VARIABLE}), {IN_SYMBOL}({CMP_VARIABLE}) }} < 0.\n'
-    return definitions
+    code.write(f':- {RES_SYMBOL}({RES_VARIABLE}), #sum {{ {M_VARIABLE},{CMP_VARIABLE} : '
+               f'{PRD_SYMBOL}({CMP_VARIABLE}, {RES_VARIABLE}, {M_VARIABLE}), {IN_SYMBOL}({CMP_VARIABLE}) }} < 0.\n')
 
 
-def __generate_resources_code(model: Model) -> str:
+def __generate_resources_code(model: Model, code: CodeWriter, symbol_table: Optional[SymbolTable] = None,
+                              aggregated: bool = False, dead_components_ids: Optional[Set[int]] = None) -> int:
     """Generates resources' code.
 
     :param model: Model
-    :return: Resources' code.
+    :param code: Writer to write the resources' code to.
+    :param symbol_table: Table of the string constants to encode by their codes (or None).
+    :param aggregated: Whether to balance the resources by the numbers of instances of component types
+        (see __generate_aggregated_resources_code), instead of the amounts produced by each instance.
+    :param dead_components_ids: Ids of the components without instances, whose rules are left out (or None).
+    :return: Number of the rules left out.
     """
-    res_code = ''
     for r in model.resources:
-        res_code += f'{RES_SYMBOL}({RES_VARIABLE}) :- {r.name}({RES_VARIABLE}).\n'
-        res_code += f'{r.name}("{r.name}").\n\n'
+        code.write(f'{RES_SYMBOL}({RES_VARIABLE}) :- {r.name}({RES_VARIABLE}).\n',
+                   f'{r.name}({__get_constant(r.name, symbol_table)}).\n\n')
+    if aggregated:
+        __generate_aggregated_resources_code(model, code)
+        return 0
+    pruned_rules_count = 0
     for c in model.taxonomy:
-        if c.produces:
+        if dead_components_ids is not None and c.id_ in dead_components_ids:
+            pruned_rules_count += len(c.produces)
+        elif c.produces:
             for res_id, amount in c.produces.items():
                 res = model.get_resource(id_=res_id)
-                res_code += f'{PRD_SYMBOL}({CMP_VARIABLE}, "{res.name}", {amount}) :- ' \
-                            f'{c.name}({CMP_VARIABLE}).\n'
-    return res_code
+                code.write(f'{PRD_SYMBOL}({CMP_VARIABLE}, {__get_constant(res.name, symbol_table)}, {amount}) :- '
+                           f'{c.name}({CMP_VARIABLE}).\n')
+    return pruned_rules_count
 
 
-def __generate_ports_ontology_definitions() -> str:
-    """Generates ontology definitions regarding taxonomy of components.
+def __generate_aggregated_resources_code(model: Model, code: CodeWriter) -> None:
+    """Generates the balance of each consumed resource as a sum over the component types: the number of instances
+    of a leaf component in the configuration (counted once per type) multiplied by the amount an instance produces
+    (including the amounts set for its ancestors). Unlike the sum over the instances, it lets the solver reason
+    about the numbers of interchangeable instances, instead of about each of them.
+
+    :param model: Model
+    :param code: Writer to write the resources' balance code to.
+    """
+    leaves = model.get_components(is_leaf=True)
+    productions = get_productions(model, leaves, {c.id_: get_ancestors(model, c) for c in leaves})
+    consumed = [(r, productions[r.id_]) for r in model.resources
+                if any(amount < 0 for amount in productions.get(r.id_, {}).values())]
+    counted_ids = {id_ for _, production in consumed for id_ in production}
+    for cmp in leaves:
+        if cmp.id_ in counted_ids:
+            code.write(f'{CNT_SYMBOL}({cmp.name}, {N_VARIABLE}) :- '
+                       f'{N_VARIABLE} = {COUNT_DIRECTIVE} {{ {CMP_VARIABLE} : {IN_SYMBOL}({CMP_VARIABLE}), '
+                       f'{cmp.name}({CMP_VARIABLE}) }}.\n')
+    for res, production in consumed:
+        elements = ';\n'.join(f'\t{amount}*{N_VARIABLE},{cmp.name} : {CNT_SYMBOL}({cmp.name}, {N_VARIABLE})'
+                              for cmp in leaves for amount in [production.get(cmp.id_)] if amount)
+        code.write(f'% {res.name}\n',
+                   f':- #sum {{\n{elements}\n}} < 0.\n')
+
+
+def __generate_ports_ontology_definitions(code: CodeWriter) -> None:
+    """Generates ontology definitions regarding ports.
     (Ontology definitions are the same for every instance of configuration problem.)
 
-    :return: Ontology definitions of taxonomy.
-    """
-    definitions = f'0 {{ {CN_SYMBOL}({PRT_VARIABLE}1, {PRT_VARIABLE}2) }} 1 :- {IN_SYMBOL}({PRT_VARIABLE}1), ' \
-                   f'{IN_SYMBOL}({PRT_VARIABLE}2), {CMB_SYMBOL}({PRT_VARIABLE}1, {PRT_VARIABLE}2).\n'
-    definitions += f'{CN_SYMBOL}({PRT_VARIABLE}2, {PRT_VARIABLE}1) :- {CN_SYMBOL}({PRT_VARIABLE}1, {PRT_VARIABLE}2), ' \
-                   f'{PRT_SYMBOL}({PRT_VARIABLE}1), {PRT_SYMBOL}({PRT_VARIABLE}2).\n'
-    definitions += f':- {PRT_SYMBOL}({PRT_VARIABLE}1), ' \
-                   f'2 {{ {CN_SYMBOL}({PRT_VARIABLE}1, {PRT_VARIABLE}2) : {PRT_SYMBOL}({PRT_VARIABLE}2) }}.\n'
-    definitions += f':- {PRT_SYMBOL}({PRT_VARIABLE}), {CN_SYMBOL}({PRT_VARIABLE}, {PRT_VARIABLE}).\n'
-    definitions += f'{IN_SYMBOL}({PRT_VARIABLE}) :- {CMP_SYMBOL}({CMP_VARIABLE}), {PON_SYMBOL}({N_VARIABLE}), ' \
-                   f'{PRT_SYMBOL}({PRT_VARIABLE}), {PO_SYMBOL}({CMP_VARIABLE}, {PRT_VARIABLE}, {N_VARIABLE}).\n'
-    definitions += f':- {CMP_SYMBOL}({CMP_VARIABLE}), {PRT_SYMBOL}({PRT_VARIABLE}1), {PON_SYMBOL}({N_VARIABLE}1), ' \
-                   f'{PRT_SYMBOL}({PRT_VARIABLE}2), {PON_SYMBOL}({N_VARIABLE}2), {PO_SYMBOL}({CMP_VARIABLE}, {PRT_VARIABLE}1, {N_VARIABLE}1), ' \
-                   f'{PO_SYMBOL}({CMP_VARIABLE}, {PRT_VARIABLE}2, {N_VARIABLE}2), {CN_SYMBOL}({PRT_VARIABLE}1, {PRT_VARIABLE}2).\n'
-    # TODO: rule added by me. Requires testing.
-    definitions += f':- {PRT_SYMBOL}({PRT_VARIABLE}), 2 {{ {PO_SYMBOL}({CMP_VARIABLE}, {PRT_VARIABLE}, {N_VARIABLE}) : ' \
-                   f'{CMP_SYMBOL}({CMP_VARIABLE}), {PON_SYMBOL}({N_VARIABLE}) }}.\n'
-    return definitions
+    :param code: Writer to write the ontology definitions of ports to.
+    """
+    code.write(f'0 {{ {CN_SYMBOL}({PRT_VARIABLE}1, {PRT_VARIABLE}2) }} 1 :- {IN_SYMBOL}({PRT_VARIABLE}1), '
+               f'{IN_SYMBOL}({PRT_VARIABLE}2), {CMB_SYMBOL}({PRT_VARIABLE}1, {PRT_VARIABLE}2).\n',
+               f'{CN_SYMBOL}({PRT_VARIABLE}2, {PRT_VARIABLE}1) :- {CN_SYMBOL}({PRT_VARIABLE}1, {PRT_VARIABLE}2), '
+               f'{PRT_SYMBOL}({PRT_VARIABLE}1), {PRT_SYMBOL}({PRT_VARIABLE}2).\n',
+               f':- {PRT_SYMBOL}({PRT_VARIABLE}1), '
+               f'2 {{ {CN_SYMBOL}({PRT_VARIABLE}1, {PRT_VARIABLE}2) : {PRT_SYMBOL}({PRT_VARIABLE}2) }}.\n',
+               f':- {PRT_SYMBOL}({PRT_VARIABLE}), {CN_SYMBOL}({PRT_VARIABLE}, {PRT_VARIABLE}).\n',
+               f'{IN_SYMBOL}({PRT_VARIABLE}) :- {CMP_SYMBOL}({CMP_VARIABLE}), {PON_SYMBOL}({N_VARIABLE}), '
+               f'{PRT_SYMBOL}({PRT_VARIABLE}), {PO_SYMBOL}({CMP_VARIABLE}, {PRT_VARIABLE}, {N_VARIABLE}).\n',
+               f':- {CMP_SYMBOL}({CMP_VARIABLE}), {PRT_SYMBOL}({PRT_VARIABLE}1), {PON_SYMBOL}({N_VARIABLE}1), '
+               f'{PRT_SYMBOL}({PRT_VARIABLE}2), {PON_SYMBOL}({N_VARIABLE}2), {PO_SYMBOL}({CMP_VARIABLE}, {PRT_VARIABLE}1, {N_VARIABLE}1), '
+               f'{PO_SYMBOL}({CMP_VARIABLE}, {PRT_VARIABLE}2, {N_VARIABLE}2), {CN_SYMBOL}({PRT_VARIABLE}1, {PRT_VARIABLE}2).\n',
+               # TODO: rule added by me. Requires testing.
+               f':- {PRT_SYMBOL}({PRT_VARIABLE}), 2 {{ {PO_SYMBOL}({CMP_VARIABLE}, {PRT_VARIABLE}, {N_VARIABLE}) : '
+               f'{CMP_SYMBOL}({CMP_VARIABLE}), {PON_SYMBOL}({N_VARIABLE}) }}.\n')
 
 
 def __get_port_individual_names(cmp: Component, prt: Port) -> List[str]:
@@ -282,47 +612,109 @@ def __get_port_individual_names(cmp: Component, prt: Port) -> List[str]:
     :param prt: Port
     :return: List of individual names of port's instances.
     """
-    names = []
-    for i in range(cmp.ports[prt.id_]):
-        names.append(f'{cmp.name}_{prt.name}_{i}')
-    return names
+    return [f'{cmp.name}_{prt.name}_{i}' for i in range(cmp.ports[prt.id_])]
 
 
-def __generate_ports_code(model: Model) -> str:
+def __generate_ports_code(model: Model, code: CodeWriter, compatibility_by_type: bool = False,
+                          deterministic_binding: bool = False, symbol_table: Optional[SymbolTable] = None,
+                          instances_counts: Optional[Dict[int, int]] = None,
+                          dead_code_elimination: bool = False) -> int:
     """Generates ports' code.
 
     :param model: Model
-    :return: Ports' code.
+    :param code: Writer to write the ports' code to.
+    :param compatibility_by_type: Whether to encode the compatibility once per pair of port types (as facts, joined
+        with the types of ports' individuals by a single rule), instead of a rule per pair of ports' individuals.
+    :param deterministic_binding: Whether the ports' instances of the components with instances are bound to them
+        in the instances' code (hence no choice rule is generated for them).
+    :param symbol_table: Table of the string constants to encode by their codes (or None).
+    :param instances_counts: Numbers of instances of the components to generate instead of the model's ones (or None).
+    :param dead_code_elimination: Whether to leave out the rules of the ports' individuals without instances
+        (of the components without instances), as well as the compatibility with them.
+    :return: Number of the rules left out.
     """
-    prt_code = ''
+    # Ports' individuals of the components without instances have no instances either
+    dead_ids = {c.id_ for c in model.taxonomy if c.ports and not __get_instances_count(c, instances_counts)} \
+        if dead_code_elimination else set()
+    pruned_rules_count = 0
     for c in model.taxonomy:
         if c.ports:
+            bound = deterministic_binding and __has_deterministic_ports_binding(c, instances_counts)
             for prt_id in c.ports:
                 prt = model.get_port(id_=prt_id)
                 prt_individual_names = __get_port_individual_names(c, prt)
                 for prt_individual_name in prt_individual_names:
-                    prt_code += f'{PRT_SYMBOL}({PRT_VARIABLE}) :- {prt_individual_name}({PRT_VARIABLE}).\n'
-                    prt_code += f'{PON_SYMBOL}("{prt_individual_name}").\n'
-                    # Port on a device
-                    prt_code += f'1 {{ {PO_SYMBOL}({CMP_VARIABLE}, {PRT_VARIABLE}, "{prt_individual_name}") : ' \
-                                f'{prt_individual_name}({PRT_VARIABLE}) }} 1 :- ' \
-                                f'{IN_SYMBOL}({CMP_VARIABLE}), {c.name}({CMP_VARIABLE}).\n'
+                    name = __get_constant(prt_individual_name, symbol_table)
+                    if c.id_ in dead_ids:
+                        code.write(f'{PON_SYMBOL}({name}).\n')    # Fact is kept, so that answer sets are the same
+                        pruned_rules_count += __count_port_individual_rules(model, prt, bound, compatibility_by_type)
+                        continue
+                    code.write(f'{PRT_SYMBOL}({PRT_VARIABLE}) :- {prt_individual_name}({PRT_VARIABLE}).\n',
+                               f'{PON_SYMBOL}({name}).\n')
+                    if not bound:
+                        # Port on a device
+                        code.write(f'1 {{ {PO_SYMBOL}({CMP_VARIABLE}, {PRT_VARIABLE}, {name}) : '
+                                   f'{prt_individual_name}({PRT_VARIABLE}) }} 1 :- '
+                                   f'{IN_SYMBOL}({CMP_VARIABLE}), {c.name}({CMP_VARIABLE}).\n')
                     # Force connection
                     if prt.force_connection:
-                        prt_code += f':- {c.name}({CMP_VARIABLE}), {prt_individual_name}({PRT_VARIABLE}1), ' \
-                                    f'{PO_SYMBOL}({CMP_VARIABLE}, {PRT_VARIABLE}1, "{prt_individual_name}"), ' \
-                                    f'{{ {CN_SYMBOL}({PRT_VARIABLE}1, {PRT_VARIABLE}2) : {PRT_SYMBOL}({PRT_VARIABLE}2) }} 0.\n'
+                        code.write(f':- {c.name}({CMP_VARIABLE}), {prt_individual_name}({PRT_VARIABLE}1), '
+                                   f'{PO_SYMBOL}({CMP_VARIABLE}, {PRT_VARIABLE}1, {name}), '
+                                   f'{{ {CN_SYMBOL}({PRT_VARIABLE}1, {PRT_VARIABLE}2) : {PRT_SYMBOL}({PRT_VARIABLE}2) }} 0.\n')
                     # Compatibility
-                    for compatible_with_id in prt.compatible_with:
-                        prt2 = model.get_port(id_=compatible_with_id)
-                        for c2 in model.taxonomy:
-                            if compatible_with_id in c2.ports:
-                                prt_individual_names_2 = __get_port_individual_names(c2, prt2)
-                                for prt_individual_name_2 in prt_individual_names_2:
-                                    prt_code += f'{CMB_SYMBOL}({PRT_VARIABLE}1, {PRT_VARIABLE}2) :- ' \
-                                                f'{prt_individual_name}({PRT_VARIABLE}1), {prt_individual_name_2}({PRT_VARIABLE}2). \n'
+                    if compatibility_by_type:
+                        # Port's type, joined with the compatible types below
+                        code.write(f'{PTY_SYMBOL}({PRT_VARIABLE}, {__get_constant(prt.name, symbol_table)}) :- '
+                                   f'{prt_individual_name}({PRT_VARIABLE}).\n')
+                    else:
+                        for compatible_with_id in prt.compatible_with:
+                            prt2 = model.get_port(id_=compatible_with_id)
+                            for c2 in model.taxonomy:
+                                if compatible_with_id in c2.ports and c2.id_ in dead_ids:
+                                    pruned_rules_count += c2.ports[compatible_with_id]
+                                elif compatible_with_id in c2.ports:
+                                    prt_individual_names_2 = __get_port_individual_names(c2, prt2)
+                                    for prt_individual_name_2 in prt_individual_names_2:
+                                        code.write(f'{CMB_SYMBOL}({PRT_VARIABLE}1, {PRT_VARIABLE}2) :- '
+                                                   f'{prt_individual_name}({PRT_VARIABLE}1), {prt_individual_name_2}({PRT_VARIABLE}2). \n')
+    if compatibility_by_type:
+        __generate_ports_types_compatibility_code(model, code, symbol_table)
+    return pruned_rules_count
+
+
+def __count_port_individual_rules(model: Model, prt: Port, bound: bool, compatibility_by_type: bool) -> int:
+    """Returns the number of rules generated for a port's individual (see __generate_ports_code).
 
-    return prt_code
+    :param model: Model.
+    :param prt: Port of the individual.
+    :param bound: Whether the port's instances are bound to the component's instances (no choice rule is generated).
+    :param compatibility_by_type: Whether the compatibility is encoded once per pair of port types.
+    :return: Number of rules.
+    """
+    rules_count = 1 + int(not bound) + int(prt.force_connection)
+    if compatibility_by_type:
+        return rules_count + 1
+    for compatible_with_id in prt.compatible_with:
+        rules_count += sum(c.ports[compatible_with_id] for c in model.taxonomy if compatible_with_id in c.ports)
+    return rules_count
+
+
+def __generate_ports_types_compatibility_code(model: Model, code: CodeWriter,
+                                              symbol_table: Optional[SymbolTable] = None) -> None:
+    """Generates the compatibility of ports, encoded once per pair of compatible port types.
+
+    :param model: Model
+    :param code: Writer to write the compatibility's code to.
+    :param symbol_table: Table of the string constants to encode by their codes (or None).
+    """
+    for prt in model.ports:
+        for compatible_with_id in prt.compatible_with:
+            prt2 = model.get_port(id_=compatible_with_id)
+            code.write(f'{CMBT_SYMBOL}({__get_constant(prt.name, symbol_table)}, '
+                       f'{__get_constant(prt2.name, symbol_table)}).\n')
+    code.write(f'{CMB_SYMBOL}({PRT_VARIABLE}1, {PRT_VARIABLE}2) :- '
+               f'{PTY_SYMBOL}({PRT_VARIABLE}1, {TYPE_VARIABLE}1), {PTY_SYMBOL}({PRT_VARIABLE}2, {TYPE_VARIABLE}2), '
+               f'{CMBT_SYMBOL}({TYPE_VARIABLE}1, {TYPE_VARIABLE}2).\n')
 
 
 def __generate_simple_constraint_distinct_partial_code(ctr: SimpleConstraint, model: Model) -> str:
@@ -333,21 +725,16 @@ def __generate_simple_constraint_distinct_partial_code(ctr: SimpleConstraint, mo
     :param model: Model.
     :return: Part of simple constraint's code.
     """
-    ctr_code = ''
     components = model.get_components_by_ids(ctr.components_ids)
-    components_count = len(components)
-    for i, cmp in enumerate(components):
-        var_no = i + 2
-        ctr_code += f'\t{cmp.name} : {PA_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}{var_no}, {UNKNOWN_VARIABLE}), {cmp.name}({CMP_VARIABLE}{var_no})'
-        if i == components_count-1:
-            ctr_code += '\n'    # Do not put the ';' sign after last part
-        else:
-            ctr_code += ';\n'
+    # Do not put the ';' sign after last part
+    elements = ';\n'.join(f'\t{cmp.name} : {PA_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}{i + 2}, {UNKNOWN_VARIABLE}), '
+                          f'{cmp.name}({CMP_VARIABLE}{i + 2})' for i, cmp in enumerate(components))
+    if components:
+        elements += '\n'
     min_ = '' if ctr.min_ is None else ctr.min_
     max_ = '' if ctr.max_ is None else ctr.max_
     # C1 is always reserved for the root component
-    ctr_code = f'{min_} {COUNT_DIRECTIVE} {{\n{ctr_code}}} {max_}'
-    return ctr_code
+    return f'{min_} {COUNT_DIRECTIVE} {{\n{elements}}} {max_}'
 
 
 def __generate_simple_constraint_partial_code(ctr: SimpleConstraint, model: Model) -> str:
@@ -358,54 +745,95 @@ def __generate_simple_constraint_partial_code(ctr: SimpleConstraint, model: Mode
     :param model: Model.
     :return: Part of simple constraint's code.
     """
-    ctr_code = ''
     components = model.get_components_by_ids(ctr.components_ids)
-    components_count = len(components)
-    for i, cmp in enumerate(components):
-        var_no = i + 2
-        ctr_code += f'\t{PA_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}{var_no}, {UNKNOWN_VARIABLE}) : {cmp.name}({CMP_VARIABLE}{var_no})'
-        if i == components_count - 1:
-            ctr_code += '\n'  # Do not put the ';' sign after last part
-        else:
-            ctr_code += ';\n'
+    # Do not put the ';' sign after last part
+    elements = ';\n'.join(f'\t{PA_SYMBOL}({CMP_VARIABLE}1, {CMP_VARIABLE}{i + 2}, {UNKNOWN_VARIABLE}) : '
+                          f'{cmp.name}({CMP_VARIABLE}{i + 2})' for i, cmp in enumerate(components))
+    if components:
+        elements += '\n'
     min_ = '' if ctr.min_ is None else ctr.min_
     max_ = '' if ctr.max_ is None else ctr.max_
     # C1 is always reserved for the root component
-    ctr_code = f'{min_} {{\n{ctr_code}}} {max_}'
-    return ctr_code
+    return f'{min_} {{\n{elements}}} {max_}'
 
 
-def __generate_simple_constraints_code(model: Model) -> str:
+def __generate_simple_constraints_code(model: Model, code: CodeWriter,
+                                       constraints: Optional[List[SimpleConstraint]] = None) -> None:
     """Generates simple constraints' code.
 
     :param model: Model
-    :return: Simple constraints' code.
+    :param code: Writer to write the simple constraints' code to.
+    :param constraints: Simple constraints to generate instead of the model's ones (or None).
     """
-    ctrs_code = ''
-    for ctr in model.simple_constraints:
+    for ctr in model.simple_constraints if constraints is None else constraints:
         partial_ctr_code = __generate_simple_constraint_distinct_partial_code(ctr, model) if ctr.distinct \
             else __generate_simple_constraint_partial_code(ctr, model)
-        ctrs_code += f':- {model.root_name}({CMP_VARIABLE}1), {DEFAULT_NEGATION_OPERATOR} {partial_ctr_code}.\n'
-    return ctrs_code
+        code.write(f':- {model.root_name}({CMP_VARIABLE}1), {DEFAULT_NEGATION_OPERATOR} {partial_ctr_code}.\n')
 
 
-def __generate_implication_part(conditions: List[SimpleConstraint], model: Model) -> Tuple[str, List[str]]:
+def __generate_implication_part(conditions: List[SimpleConstraint], model: Model, code: CodeWriter,
+                                shared_heads: Optional[Dict[Tuple, str]] = None,
+                                generated: Optional[Set[Tuple]] = None) -> List[str]:
     """Generates a part of the implication. For each SimpleConstraint it creates a rule stating that a new fact
     is satisfied if so is its condition. These new facts are later used to create the complex constraints.
 
     :param conditions: List of conditions represented as SimpleConstraints
     :param model: Model
-    :return: Tuple of the form (code generated with new rules, list of new facts [heads of the new rules])
+    :param code: Writer to write the new rules to.
+    :param shared_heads: Heads shared by the identical conditions (see __get_shared_conditions_heads), or None
+        to generate a rule for every condition.
+    :param generated: Pairs of the form (head, condition's key) of the rules generated so far; updated in place.
+    :return: List of new facts [heads of the new rules].
     """
     heads = []
-    code = ''
     for condition in conditions:
+        head = condition.name
+        if shared_heads is not None:
+            key = __get_condition_key(condition)
+            head = shared_heads[(head, key)]
+            if (head, key) in generated:
+                heads.append(head)
+                continue
+            generated.add((head, key))
         condition_code = __generate_simple_constraint_distinct_partial_code(condition, model) \
             if condition.distinct else __generate_simple_constraint_partial_code(condition, model)
-        head = condition.name
-        code += f'{head} :- {model.root_name}({CMP_VARIABLE}1), {condition_code}.\n'
+        code.write(f'{head} :- {model.root_name}({CMP_VARIABLE}1), {condition_code}.\n')
         heads.append(head)
-    return code, heads
+    return heads
+
+
+def __get_condition_key(condition: SimpleConstraint) -> Tuple:
+    """Returns the canonical form of the condition's body: the counted components (in any order, since the elements
+    of the aggregate form a set), the bounds and whether the distinct components are counted.
+
+    :param condition: Condition represented as SimpleConstraint.
+    :return: Condition's key.
+    """
+    return tuple(sorted(set(condition.components_ids))), condition.min_, condition.max_, condition.distinct
+
+
+def __get_shared_conditions_heads(model: Model) -> Dict[Tuple, str]:
+    """Returns the heads shared by the identical conditions of the complex constraints: the name of the first of them.
+
+    The name of a condition is kept as its head, if some other condition of the same name is not identical to it,
+    since that name stands for the disjunction of all of them.
+
+    :param model: Model
+    :return: Dictionary of the form "(condition's name, condition's key)": "head".
+    """
+    conditions = [cnd for ctr in model.complex_constraints for cnd in ctr.antecedent + ctr.consequent]
+    keys_by_names: Dict[str, Set[Tuple]] = {}
+    for condition in conditions:
+        keys_by_names.setdefault(condition.name, set()).add(__get_condition_key(condition))
+    heads_by_keys: Dict[Tuple, str] = {}
+    heads: Dict[Tuple, str] = {}
+    for condition in conditions:
+        key = __get_condition_key(condition)
+        if len(keys_by_names[condition.name]) == 1:
+            heads[(condition.name, key)] = heads_by_keys.setdefault(key, condition.name)
+        else:
+            heads[(condition.name, key)] = condition.name
+    return heads
 
 
 def __generate_implication_complete_part(head: str, names: List[str], all_: bool) -> str:
@@ -420,16 +848,20 @@ def __generate_implication_complete_part(head: str, names: List[str], all_: bool
     return f'{head} :- {body}.\n'
 
 
-def __generate_complex_constraints_code(model: Model) -> str:
+def __generate_complex_constraints_code(model: Model, code: CodeWriter, shared_conditions: bool = False) -> None:
     """Generates complex constraints' code.
 
     :param model: Model
-    :return: Complex constraints' code.
+    :param code: Writer to write the complex constraints' code to.
+    :param shared_conditions: Whether to generate the identical conditions once, under a shared head
+        (see __get_shared_conditions_heads).
     """
-    ctrs_code = ''
+    shared_heads = __get_shared_conditions_heads(model) if shared_conditions else None
+    generated = set()
     for ctr in model.complex_constraints:
-        antecedents_code, antecedents_heads = __generate_implication_part(ctr.antecedent, model)
-        consequents_code, consequents_heads = __generate_implication_part(ctr.consequent, model)
+        antecedents_heads = __generate_implication_part(ctr.antecedent, model, code, shared_heads, generated)
+        code.write('\n')
+        consequents_heads = __generate_implication_part(ctr.consequent, model, code, shared_heads, generated)
         antecedent_head = f'{ctr.name.replace(" ", "_")}_antecedent'
         antecedent_complete_code = __generate_implication_complete_part(antecedent_head, antecedents_heads,
                                                                         ctr.antecedent_all)
@@ -437,39 +869,46 @@ def __generate_complex_constraints_code(model: Model) -> str:
         consequent_complete_code = __generate_implication_complete_part(consequent_head, consequents_heads,
                                                                         ctr.consequent_all)
         complete_implication = f':- {antecedent_head}, {DEFAULT_NEGATION_OPERATOR} {consequent_head}.\n'
-        ctrs_code += f'{antecedents_code}\n' \
-                     f'{consequents_code}\n' \
-                     f'{antecedent_complete_code}' \
-                     f'\n{consequent_complete_code}' \
-                     f'\n{complete_implication}'
-    return ctrs_code
+        code.write('\n',
+                   antecedent_complete_code,
+                   '\n', consequent_complete_code,
+                   '\n', complete_implication)
 
 
-def __generate_constraints_code(model: Model) -> Tuple[str, str]:
+def __generate_constraints_code(model: Model, code: CodeWriter, shared_conditions: bool = False,
+                                simple_constraints: Optional[List[SimpleConstraint]] = None) -> None:
     """Generates constraints (both simple & complex).
 
     :param model: Model
-    :return: Simple constraints' code; Complex constraints' code
+    :param code: Writer to write the constraints' code to.
+    :param shared_conditions: Whether to generate the identical conditions of the complex constraints once.
+    :param simple_constraints: Simple constraints to generate instead of the model's ones (or None).
     """
-    simple_constraints_code = __generate_simple_constraints_code(model)
-    complex_constraints_code = __generate_complex_constraints_code(model)
-    return simple_constraints_code, complex_constraints_code
+    code.write('%\n% Simple constraints\n%\n')
+    __generate_simple_constraints_code(model, code, simple_constraints)
+    code.write('\n%\n% Complex constraints\n%\n')
+    __generate_complex_constraints_code(model, code, shared_conditions)
 
 
-def __generate_variable_number_of_components_instances(cmp: Component, count: int, offset: int) -> str:
+def __generate_variable_number_of_components_instances(cmp: Component, count: int, offset: int,
+                                                       linear: bool = False) -> str:
     """Generates a rule expressing the variable (bounded) number of component's instances.
 
     :param cmp: Component
     :param count: Maximal number of component's instances (max - min).
     :param offset: Instances id offset.
+    :param linear: Whether the instances have to be chosen in order of their ids by a rule per pair of consecutive
+        ids (linear in the number of instances), instead of a rule per any pair of ids (quadratic).
     :return: Rule expressing variable number of component's instances.
     """
-    instance_code = f'{cmp.name}{DOMAIN_STRING}({offset+1}..{offset+count}).\n'
-    instance_code += f'{cmp.min_count} {{{cmp.name}({CMP_VARIABLE}) : {cmp.name}{DOMAIN_STRING}({CMP_VARIABLE})}} {cmp.max_count}.\n'
-    instance_code += f'{cmp.name}({CMP_VARIABLE}1) :- {cmp.name}{DOMAIN_STRING}({CMP_VARIABLE}1), ' \
-                     f'{cmp.name}{DOMAIN_STRING}({CMP_VARIABLE}2), {cmp.name}({CMP_VARIABLE}2), ' \
-                     f'{CMP_VARIABLE}1 < {CMP_VARIABLE}2.\n'
-    return instance_code
+    rules = f'{cmp.name}{DOMAIN_STRING}({offset+1}..{offset+count}).\n' \
+            f'{cmp.min_count} {{{cmp.name}({CMP_VARIABLE}) : {cmp.name}{DOMAIN_STRING}({CMP_VARIABLE})}} {cmp.max_count}.\n'
+    if linear:
+        return rules + f'{cmp.name}({CMP_VARIABLE}-1) :- {cmp.name}({CMP_VARIABLE}), ' \
+                       f'{cmp.name}{DOMAIN_STRING}({CMP_VARIABLE}-1).\n'
+    return rules + f'{cmp.name}({CMP_VARIABLE}1) :- {cmp.name}{DOMAIN_STRING}({CMP_VARIABLE}1), ' \
+                   f'{cmp.name}{DOMAIN_STRING}({CMP_VARIABLE}2), {cmp.name}({CMP_VARIABLE}2), ' \
+                   f'{CMP_VARIABLE}1 < {CMP_VARIABLE}2.\n'
 
 
 def __generate_variable_number_of_port_instances(name: str, cmp: Component, count: int, prt_number: int, offset: int) \
@@ -483,97 +922,240 @@ def __generate_variable_number_of_port_instances(name: str, cmp: Component, coun
     :param offset:  Instances id offset.
     :return: Rule expressing variable number of port instances.
     """
-    instance_code = f'{name}{DOMAIN_STRING}({offset+1}..{offset+count}).\n'     # Rule is added for solving purposes
-    instance_code += f'{name}({INSTANCE_VARIABLE}+{prt_number * count}) :- {cmp.name}({INSTANCE_VARIABLE}), ' \
-                     f'{name}{DOMAIN_STRING}({INSTANCE_VARIABLE}+{prt_number * count}).\n'  # TODO: rule added by me. Requires testing.
-    return instance_code
+    return f'{name}{DOMAIN_STRING}({offset+1}..{offset+count}).\n' \
+           f'{name}({INSTANCE_VARIABLE}+{prt_number * count}) :- {cmp.name}({INSTANCE_VARIABLE}), ' \
+           f'{name}{DOMAIN_STRING}({INSTANCE_VARIABLE}+{prt_number * count}).\n'  # TODO: rule added by me. Requires testing.
 
 
-def __generate_symmetry_breaking_rule(name: str, variable: str = CMP_VARIABLE) -> str:
+def __generate_symmetry_breaking_rule(name: str, variable: str = CMP_VARIABLE, linear: bool = False) -> str:
     """Generates symmetry breaking rule.
 
     :param name: Component's name to generate the symmetry breaking rule of.
     :param variable: Variable to use.
+    :param linear: Whether to generate the rule for each pair of consecutive ids (it grounds linearly in the number
+        of instances, but requires the ids of the instances to be consecutive), instead of any pair of ids.
     :return: Symmetry breaking rule for the given component's name.
     """
+    if linear:
+        return f':- {IN_SYMBOL}({variable}), {name}({variable}), {DEFAULT_NEGATION_OPERATOR} ' \
+               f'{IN_SYMBOL}({variable}-1), {name}({variable}-1).\n'
     symm_breaking_rule = f':- {IN_SYMBOL}({variable}2), {name}({variable}2), {DEFAULT_NEGATION_OPERATOR} ' \
                          f'{IN_SYMBOL}({variable}1), {name}({variable}1), ' \
                          f'{variable}1 < {variable}2.\n'        # TODO: rule added by me. Requires testing.
     return symm_breaking_rule
 
 
-def __generate_instances_code(model: Model) -> Tuple[str, List[str]]:
+def __get_dead_components_ids(model: Model, instances_counts: Optional[Dict[int, int]] = None) -> Set[int]:
+    """Returns the components that have no instances in any configuration: the ones with no ids reserved for their
+    instances, none of whose descendants have any either. No rule having their predicate in its body ever applies.
+
+    :param model: Model.
+    :param instances_counts: Numbers of instances of the components to generate instead of the model's ones (or None).
+    :return: Ids of the components without instances.
+    """
+    live_ids = set()
+    for cmp in model.taxonomy:
+        if __get_instances_count(cmp, instances_counts):
+            id_ = cmp.id_
+            while id_ is not None and id_ not in live_ids:
+                live_ids.add(id_)
+                id_ = model.get_component(id_=id_).parent_id
+    return {c.id_ for c in model.taxonomy if c.id_ not in live_ids}
+
+
+def __get_instances_count(cmp: Component, instances_counts: Optional[Dict[int, int]] = None) -> int:
+    """Returns the number of ids reserved for the component's instances (and for each of its ports' individuals).
+
+    :param cmp: Component.
+    :param instances_counts: Numbers of instances of the components to generate instead of the model's ones (or None).
+    :return: Number of ids reserved for the component's instances.
+    """
+    if cmp.count:
+        return instances_counts.get(cmp.id_, cmp.count) if instances_counts else cmp.count
+    elif cmp.min_count is not None and cmp.max_count is not None:
+        return cmp.max_count - cmp.min_count
+    return 0
+
+
+def __has_deterministic_ports_binding(cmp: Component, instances_counts: Optional[Dict[int, int]] = None) -> bool:
+    """Checks whether the component's ports can be bound to its instances according to their ids. This holds for
+    the leaf components with instances, as no other component's instances satisfy the component's predicate.
+
+    :param cmp: Component.
+    :param instances_counts: Numbers of instances of the components to generate instead of the model's ones (or None).
+    :return: True if the component's ports can be bound to its instances deterministically; False otherwise.
+    """
+    return cmp.is_leaf and __get_instances_count(cmp, instances_counts) > 0
+
+
+def __generate_port_binding_rule(cmp: Component, prt_individual_name: str, id_shift: int,
+                                 symbol_table: Optional[SymbolTable] = None) -> str:
+    """Generates the rule binding the port's instances to the component's instances. The ids of the port individual's
+    instances are reserved right after the component's ones (and the ones of its previous ports' individuals),
+    so the port instance of the component's instance C has the id: C + id_shift.
+
+    :param cmp: Component the port belongs to.
+    :param prt_individual_name: Name of the port's individual.
+    :param id_shift: Difference between the ids of the port's instance and the component's instance.
+    :param symbol_table: Table of the string constants to encode by their codes (or None).
+    :return: Rule binding the port's instances to the component's instances.
+    """
+    return f'{PO_SYMBOL}({CMP_VARIABLE}, {CMP_VARIABLE}+{id_shift}, ' \
+           f'{__get_constant(prt_individual_name, symbol_table)}) :- ' \
+           f'{IN_SYMBOL}({CMP_VARIABLE}), {cmp.name}({CMP_VARIABLE}), ' \
+           f'{prt_individual_name}({CMP_VARIABLE}+{id_shift}).\n'
+
+
+def __get_connections_ordered_components_ids(model: Model, instances_counts: Optional[Dict[int, int]] = None) \
+        -> Set[int]:
+    """Returns the ids of components, whose instances can be ordered lexicographically by the ids of ports their ports
+    are connected to. These are the leaf components with symmetry breaking, more than one instance and ports,
+    such that their ports cannot be connected to the ports of the component itself, nor to the ports of any other
+    of the returned components (since swapping the instances of one of them would change the order of the other one).
+
+    :param model: Model.
+    :param instances_counts: Numbers of instances of the components to generate instead of the model's ones (or None).
+    :return: Ids of components, whose instances can be ordered by their connections.
+    """
+    owners_ids: Dict[int, Set[int]] = {}   # Ids of components having the port by port's id
+    for cmp in model.taxonomy:
+        for prt_id in cmp.ports:
+            owners_ids.setdefault(prt_id, set()).add(cmp.id_)
+
+    ordered_ids = set()
+    for cmp in model.taxonomy:
+        if cmp.is_leaf and cmp.symmetry_breaking and cmp.ports and __get_instances_count(cmp, instances_counts) > 1:
+            partners_ids = {owner_id for prt_id in cmp.ports
+                            for compatible_with_id in model.get_port(id_=prt_id).compatible_with
+                            for owner_id in owners_ids.get(compatible_with_id, ())}
+            if cmp.id_ not in partners_ids and not partners_ids & ordered_ids:
+                ordered_ids.add(cmp.id_)
+    return ordered_ids
+
+
+def __generate_connections_symmetry_breaking_code(cmp: Component, prt_individual_names: List[str],
+                                                  symbol_table: Optional[SymbolTable] = None) -> str:
+    """Generates the lex-leader constraints over the connections of the component's instances: for each pair of
+    consecutive instances in the configuration, the ids of ports connected to the ports of the first one
+    (0 if not connected), taken in order of the component's ports' individuals, have to be lexicographically
+    smaller or equal to the ones of the second instance.
+
+    :param cmp: Component.
+    :param prt_individual_names: Names of the component's ports' individuals.
+    :param symbol_table: Table of the string constants to encode by their codes (or None).
+    :return: Lex-leader constraints over the connections of the component's instances.
+    """
+    rules = [f'{LXE_SYMBOL}({CMP_VARIABLE}, 0) :- {IN_SYMBOL}({CMP_VARIABLE}), {cmp.name}({CMP_VARIABLE}), '
+             f'{IN_SYMBOL}({CMP_VARIABLE}+1), {cmp.name}({CMP_VARIABLE}+1).\n']
+    for i, prt_individual_name in enumerate(prt_individual_names, start=1):
+        name = __get_constant(prt_individual_name, symbol_table)
+        rules.append(f'{LXV_SYMBOL}({CMP_VARIABLE}, {i}, {PRT_VARIABLE}2) :- {cmp.name}({CMP_VARIABLE}), '
+                     f'{PO_SYMBOL}({CMP_VARIABLE}, {PRT_VARIABLE}1, {name}), '
+                     f'{CN_SYMBOL}({PRT_VARIABLE}1, {PRT_VARIABLE}2).\n'
+                     f'{LXV_SYMBOL}({CMP_VARIABLE}, {i}, 0) :- {cmp.name}({CMP_VARIABLE}), '
+                     f'{PO_SYMBOL}({CMP_VARIABLE}, {PRT_VARIABLE}1, {name}), '
+                     f'{DEFAULT_NEGATION_OPERATOR} {LXC_SYMBOL}({PRT_VARIABLE}1).\n'
+                     f'{LXE_SYMBOL}({CMP_VARIABLE}, {i}) :- {LXE_SYMBOL}({CMP_VARIABLE}, {i - 1}), '
+                     f'{LXV_SYMBOL}({CMP_VARIABLE}, {i}, {PRT_VARIABLE}1), '
+                     f'{LXV_SYMBOL}({CMP_VARIABLE}+1, {i}, {PRT_VARIABLE}1).\n'
+                     f':- {LXE_SYMBOL}({CMP_VARIABLE}, {i - 1}), {LXV_SYMBOL}({CMP_VARIABLE}, {i}, {PRT_VARIABLE}1), '
+                     f'{LXV_SYMBOL}({CMP_VARIABLE}+1, {i}, {PRT_VARIABLE}2), {PRT_VARIABLE}1 > {PRT_VARIABLE}2.\n')
+    return ''.join(rules)
+
+
+def __generate_instances_code(model: Model, code: CodeWriter, deterministic_ports_binding: bool = False,
+                              linear_symmetry_breaking: bool = False,
+                              connections_symmetry_breaking: bool = False,
+                              symbol_table: Optional[SymbolTable] = None,
+                              instances_counts: Optional[Dict[int, int]] = None) -> List[str]:
     """Generates instances code.
 
     :param model: Model.
-    :return: Instances code; List of instances predicate symbols.
+    :param code: Writer to write the instances code to.
+    :param deterministic_ports_binding: Whether to bind the ports' instances to the components' instances according
+        to their ids.
+    :param linear_symmetry_breaking: Whether to order the instances by rules over the pairs of consecutive ids,
+        instead of all pairs of ids.
+    :param connections_symmetry_breaking: Whether to order the instances (of the components with symmetry breaking)
+        lexicographically by their connections too.
+    :param symbol_table: Table of the string constants to encode by their codes (or None).
+    :param instances_counts: Numbers of instances of the components to generate instead of the model's ones (or None).
+    :return: List of instances predicate symbols.
     """
     inst_predicates = []
-    inst_code = ''
-    inst_code += f'{model.root_name}(0..0).\t% ROOT\n\n'
+    code.write(f'{model.root_name}(0..0).\t% ROOT\n\n')
+    connections_ordered_ids = __get_connections_ordered_components_ids(model, instances_counts) \
+        if connections_symmetry_breaking else set()
+    if connections_ordered_ids:
+        code.write(f'{LXC_SYMBOL}({PRT_VARIABLE}1) :- {CN_SYMBOL}({PRT_VARIABLE}1, {PRT_VARIABLE}2).\n\n')
     offset = 0
     for cmp in model.get_components():
-        count = 0
+        count = __get_instances_count(cmp, instances_counts)
         if cmp.count:
-            count = cmp.count
-            inst_code += f'{cmp.name}({offset + 1}..{offset + count}).\n'
-            inst_predicates.append(cmp.name)
+            if count:   # Unless none of the instances can be in a configuration
+                code.write(f'{cmp.name}({offset + 1}..{offset + count}).\n')
+                inst_predicates.append(cmp.name)
         elif cmp.min_count is not None and cmp.max_count is not None:
-            count = cmp.max_count - cmp.min_count
-            inst_code += __generate_variable_number_of_components_instances(cmp, count, offset)
+            code.write(__generate_variable_number_of_components_instances(cmp, count, offset,
+                                                                          linear_symmetry_breaking))
             inst_predicates.append(f'{cmp.name}{DOMAIN_STRING}')
             inst_predicates.append(cmp.name)
 
         if cmp.symmetry_breaking:
-            inst_code += __generate_symmetry_breaking_rule(cmp.name)
+            # Only the leaf component's instances have consecutive ids
+            code.write(__generate_symmetry_breaking_rule(cmp.name, linear=linear_symmetry_breaking and cmp.is_leaf))
 
         if count:   # If component appears in configuration
             inst_predicates.append(cmp.name)
             offset += count
             prt_number = 0
+            bound = deterministic_ports_binding and __has_deterministic_ports_binding(cmp, instances_counts)
+            cmp_prt_individual_names = []
             for prt_id, prt_count in cmp.ports.items():
                 prt = model.get_port(id_=prt_id)
-                prt_instance_code = ''
                 prt_individual_names = __get_port_individual_names(cmp, prt)
+                cmp_prt_individual_names.extend(prt_individual_names)
                 for prt_individual_name in prt_individual_names:
                     prt_number += 1
                     if cmp.count:
-                        prt_instance_code += f'{prt_individual_name}({offset+1}..{offset+cmp.count}).\n'
+                        code.write(f'{prt_individual_name}({offset+1}..{offset+count}).\n')
                     else:
-                        prt_instance_code += __generate_variable_number_of_port_instances(prt_individual_name, cmp,
-                                                                                          count, prt_number, offset)
+                        code.write(__generate_variable_number_of_port_instances(prt_individual_name, cmp, count,
+                                                                                prt_number, offset))
                         inst_predicates.append(f'{prt_individual_name}{DOMAIN_STRING}')
 
                     inst_predicates.append(prt_individual_name)
                     offset += count
+                    if bound:
+                        code.write(__generate_port_binding_rule(cmp, prt_individual_name, prt_number * count,
+                                                                symbol_table))
                     if cmp.symmetry_breaking:
-                        prt_instance_code += __generate_symmetry_breaking_rule(prt_individual_name,
-                                                                               variable=PRT_VARIABLE)
-                inst_code += prt_instance_code
-        inst_code += '\n'
-    return inst_code, inst_predicates
+                        code.write(__generate_symmetry_breaking_rule(prt_individual_name, variable=PRT_VARIABLE,
+                                                                     linear=linear_symmetry_breaking))
+            if cmp.id_ in connections_ordered_ids:
+                code.write(__generate_connections_symmetry_breaking_code(cmp, cmp_prt_individual_names,
+                                                                      symbol_table))
+        code.write('\n')
+    return inst_predicates
 
 
 def __generate_show_directives(show_all_predicates: bool, shown_predicates_dict: Dict[str, bool],
-                               instances_predicates: List[str]) \
-        -> str:
+                               instances_predicates: List[str], code: CodeWriter) -> None:
     """Generates the '#show' directives, according to user's selection of predicates.
 
     :param show_all_predicates: If this is set to true then no directives are generated,
         resulting in showing all possible predicates.
     :param shown_predicates_dict: A dictionary of type predicate_symbol: show?
     :param instances_predicates: Predicates symbols representing instances.
-    :return: '#show' directives code.
+    :param code: Writer to write the '#show' directives code to.
     """
     if show_all_predicates:
-        return ''
+        return
 
-    dir_code = ''
     if shown_predicates_dict[INSTANCES_FACTS]:
-        dir_code += '% Instances facts:\n'
+        code.write('% Instances facts:\n')
         for pred in instances_predicates:
-            dir_code += f'{SHOW_DIRECTIVE} {pred}/1.\n'
+            code.write(f'{SHOW_DIRECTIVE} {pred}/1.\n')
     for symbol in SYMBOLS:
         if shown_predicates_dict[symbol]:
-            dir_code += f'#show {symbol}/{SYMBOLS_WITH_ARITIES[symbol]}.\n'
-    return dir_code
+            code.write(f'#show {symbol}/{SYMBOLS_WITH_ARITIES[symbol]}.\n')
@@ -0,0 +1,51 @@
+"""Provides the writer collecting chunks of the generated ASP code."""
+
+from typing import List, Optional, TextIO
+
+BUFFER_SIZE = 1 << 20   # Number of characters collected before they are written to the output
+
+
+class CodeWriter:
+    """Collects chunks of generated code and joins them only once, when the code is requested.
+    Appending a chunk takes constant time, so the complete code is built in time linear in its length
+    (unlike the repeated string concatenation).
+
+    If the output is given, the collected chunks are written to it whenever they exceed the buffer size,
+    so the memory used does not depend on the length of the code.
+
+    Attributes:
+        __chunks: Chunks of code written so far (and not yet written to the output).
+        __output: Output to stream the code to; None if the code is kept in memory.
+        __buffer_size: Number of characters collected before they are written to the output.
+        __buffered: Number of characters collected so far.
+    """
+    def __init__(self, output: Optional[TextIO] = None, buffer_size: int = BUFFER_SIZE):
+        self.__chunks: List[str] = []
+        self.__output: Optional[TextIO] = output
+        self.__buffer_size: int = buffer_size
+        self.__buffered: int = 0
+
+    def write(self, *chunks: str) -> None:
+        """Appends chunks of code.
+
+        :param chunks: Chunks of code to append.
+        """
+        self.__chunks.extend(chunks)
+        if self.__output is not None:
+            self.__buffered += sum(map(len, chunks))
+            if self.__buffered >= self.__buffer_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """Writes the collected chunks to the output (if it is given)."""
+        if self.__output is not None:
+            self.__output.write(''.join(self.__chunks))
+            self.__chunks.clear()
+            self.__buffered = 0
+
+    def getvalue(self) -> str:
+        """Returns the code written so far (and not yet written to the output).
+
+        :return: Code.
+        """
+        return ''.join(self.__chunks)
@@ -0,0 +1,42 @@
+"""Provides the cache of the generated sections of ASP code."""
+
+from typing import Any, Dict, Optional, Tuple
+
+
+class GenerationCache:
+    """Keeps the generated sections of code, along with the model's data they have been generated from,
+    so that a section is generated anew only if the data it depends on has changed.
+    (The data is compared itself, not by its hash only, since different data may have equal hashes,
+    e.g. hash(-1) == hash(-2).)
+
+    Attributes:
+        __sections: Data, generated code and the generation's result by the sections' names.
+    """
+    def __init__(self):
+        self.__sections: Dict[str, Tuple[Tuple, str, Any]] = {}
+
+    def get(self, section: str, data: Tuple) -> Optional[Tuple[str, Any]]:
+        """Returns the cached section, if it has been generated from the same data.
+
+        :param section: Name of the section.
+        :param data: Data (tuple of tuples, strings, numbers etc.) the section depends on.
+        :return: Tuple of the form (code, generation's result); None if the section has to be generated anew.
+        """
+        cached = self.__sections.get(section)
+        if cached is None or cached[0] != data:
+            return None
+        return cached[1], cached[2]
+
+    def put(self, section: str, data: Tuple, code: str, result: Any = None) -> None:
+        """Caches the generated section.
+
+        :param section: Name of the section.
+        :param data: Data the section has been generated from.
+        :param code: Generated code.
+        :param result: Generation's result (e.g. the list of generated predicates).
+        """
+        self.__sections[section] = (data, code, result)
+
+    def clear(self) -> None:
+        """Removes all the cached sections."""
+        self.__sections.clear()
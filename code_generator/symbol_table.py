@@ -0,0 +1,89 @@
+"""Provides the table of string constants interned as integer codes in the generated ASP code."""
+
+from typing import Any, Dict, List, Tuple
+
+SYMBOL_TABLE_EXTENSION = '.symbols.json'
+
+
+class SymbolTable:
+    """Maps the string constants of the encoding (names of ports' individuals, associations, resources and port types)
+    to integer codes, which are cheaper to ground and hash than the strings, and back. The table is saved next to
+    the generated program, so that the solver can translate the codes in the answer sets back to the names.
+
+    Attributes:
+        __names: Interned names, indexed by their codes.
+        __codes: Codes by the interned names.
+        __arguments: Indexes of the arguments holding the codes by the predicates' symbols.
+    """
+    def __init__(self, names: List[str] = None, arguments: Dict[str, List[int]] = None):
+        self.__names: List[str] = []
+        self.__codes: Dict[str, int] = {}
+        self.__arguments: Dict[str, List[int]] = {}
+        for name in names or []:
+            self.intern(name)
+        for symbol, indexes in (arguments or {}).items():
+            self.add_arguments(symbol, indexes)
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]):
+        """Necessary to create an instance from JSON"""
+        return cls(data['names'], data['arguments'])
+
+    def to_json(self) -> Dict[str, Any]:
+        """Necessary to convert an instance to JSON"""
+        return {
+            'names': self.__names,
+            'arguments': self.__arguments
+        }
+
+    def intern(self, name: str) -> int:
+        """Returns the code of the name, assigning it the next free code if it has none yet.
+
+        :param name: Name to intern.
+        :return: Name's code.
+        """
+        code = self.__codes.get(name)
+        if code is None:
+            code = len(self.__names)
+            self.__codes[name] = code
+            self.__names.append(name)
+        return code
+
+    def get_code(self, name: str) -> int:
+        """Returns the code of an already interned name.
+
+        :param name: Name.
+        :return: Name's code.
+        """
+        return self.__codes[name]
+
+    def get_name(self, code: int) -> str:
+        """Returns the name of the code.
+
+        :param code: Code.
+        :return: Interned name.
+        """
+        return self.__names[code]
+
+    def add_arguments(self, symbol: str, indexes: List[int]) -> None:
+        """Marks the arguments of the predicate as holding the codes.
+
+        :param symbol: Predicate's symbol.
+        :param indexes: Indexes of the predicate's arguments holding the codes.
+        """
+        self.__arguments[symbol] = list(indexes)
+
+    def get_arguments(self, symbol: str) -> List[int]:
+        """Returns the indexes of the predicate's arguments holding the codes.
+
+        :param symbol: Predicate's symbol.
+        :return: Indexes of the arguments holding the codes (empty if there are none).
+        """
+        return self.__arguments.get(symbol, [])
+
+    def get_data(self) -> Tuple[str, ...]:
+        """Returns the table's content, so that the sections of code depending on it are cached along with it."""
+        return tuple(self.__names)
+
+    def __len__(self):
+        return len(self.__names)
@@ -1,15 +1,21 @@
 """Common file operations."""
 
 import ntpath
+import os
+import json
 from json import JSONDecodeError
 from tkinter import filedialog, messagebox
-from typing import Dict, Optional, Callable, Any
+from typing import Dict, Optional, Callable, Any, List, Tuple
 from threading import Event
 
 from pubsub import pub
 
-from misc import actions
-from code_generator import generate_code
+from misc import actions, project_journal
+from misc.json_converter import get_json_string
+from misc.project_file import ProjectFile, write_project
+from code_generator import write_code, create_symbol_table, GenerationCache, \
+    SYMBOL_TABLE_EXTENSION
+from analysis import BoundTightening, propagate_bounds, find_conflicts, simplify_constraints
 from misc.exceptions import BGError
 from model import Model
 from misc.settings import Settings
@@ -17,13 +23,18 @@ from solver import Solver, InstanceRepresentation
 from misc.state import State
 
 JSON_EXTENSION = '.json'
+BINARY_EXTENSION = '.bgp'
+TEMP_EXTENSION = '.tmp'
 LP_EXTENSION = '.lp'
 CSV_EXTENSION = '.csv'
 
 LP_FILE_TYPE = ('ASP Logic Program file', f'*{LP_EXTENSION}')
 JSON_FILE_TYPE = ('JSON file', f'*{JSON_EXTENSION}')
+BINARY_FILE_TYPE = ('Binary project file', f'*{BINARY_EXTENSION}')
 ALL_FILES_TYPE = ("All Files", "*.*")
 
+__generation_cache = GenerationCache()    # Sections of the logic program generated by the previous exports (if set)
+
 
 def extract_file_name(path: str):
     """Extracts the file name from path.
@@ -40,25 +51,30 @@ def open_project(callback: Optional[Callable] = None) -> None:
 
     :param callback: Callback function, to be executed after opening the project.
     """
-    file_name = filedialog.askopenfilename(filetypes=(JSON_FILE_TYPE, ALL_FILES_TYPE))
+    file_name = filedialog.askopenfilename(filetypes=(JSON_FILE_TYPE, BINARY_FILE_TYPE, ALL_FILES_TYPE))
     if file_name:
         load_from_file(file_name, callback)
 
 
 def load_from_file(file_name: str, callback: Optional[Callable]):
-    """Loads model from file.
+    """Loads model from file (binary project file if it has the BINARY_EXTENSION; JSON file otherwise).
 
     :param file_name: File path.
     :param callback: Callback function, to be executed after loading model from file.
     """
     try:
-        with open(file_name, mode='r') as file:
+        binary = file_name.endswith(BINARY_EXTENSION)
+        with open(file_name, mode='rb' if binary else 'r') as file:
             state = State()
-            json = file.read()
-            model = Model.from_json(json)
+            if binary:
+                with ProjectFile(file) as project_file:    # Sections are decoded as the model is created
+                    model = Model.from_dict(project_journal.replay(file_name, project_file))
+            else:
+                model = Model.from_dict(project_journal.replay(file_name, json.loads(file.read())))
 
             state.file = file
             state.model = model
+            __generation_cache.clear()  # Sections of the previous model are not reused, so they need not be kept
             Settings.get_settings().add_recently_opened_project(model.root_name, file_name)
 
             if callback is not None:
@@ -75,6 +91,56 @@ def load_from_file(file_name: str, callback: Optional[Callable]):
         messagebox.showerror('File not found.', str(e))
 
 
+def save_to_file(model: Model, file_name: str, rewrite: bool = False) -> None:
+    """Saves model to file (binary project file if it has the BINARY_EXTENSION; JSON file otherwise).
+
+    If journaled saves are set in the settings, only the changes since the previous save are appended to the file's
+    journal, unless the whole model has changed (e.g. it has been loaded) or the journal has grown too large;
+    then the file is rewritten (atomically). The journal is removed whenever the whole file is written.
+
+    :param model: Model to save.
+    :param file_name: File path.
+    :param rewrite: Whether to rewrite the whole file even if journaled saves are set (e.g. on "Save as").
+    """
+    if not file_name:
+        raise BGError('Project file path must be specified.')
+    changes = model.get_changes()
+    settings = Settings.get_settings()
+    if not settings.journaled_saves:
+        __write_to_file(model, file_name, file_name, settings.compact_project_files)
+        # Journal left by the journaled saves (set before) would otherwise be replayed over the newer file on load
+        project_journal.remove_journal(file_name)
+    elif not rewrite and changes is not None and not project_journal.needs_compaction(file_name):
+        project_journal.append_changes(file_name, model.root_name, changes)
+    else:
+        temp_file_name = f'{file_name}{TEMP_EXTENSION}'
+        try:
+            __write_to_file(model, file_name, temp_file_name, settings.compact_project_files)
+            os.replace(temp_file_name, file_name)
+        finally:
+            if os.path.exists(temp_file_name):  # Left only if writing or replacing has failed
+                os.remove(temp_file_name)
+        project_journal.remove_journal(file_name)
+    model.clear_changes()   # Only once saved, so that the changes are not lost if saving fails
+
+
+def __write_to_file(model: Model, file_name: str, target_file_name: str, compact: bool) -> None:
+    """Writes the whole model to file (binary project file if it has the BINARY_EXTENSION; JSON file otherwise).
+
+    :param model: Model to write.
+    :param file_name: Project file path, determining the format.
+    :param target_file_name: Path of the file to write to.
+    :param compact: Whether to write compact JSON.
+    """
+    if file_name.endswith(BINARY_EXTENSION):
+        with open(target_file_name, 'wb') as file:
+            write_project(model, file)
+    else:
+        json_string = get_json_string(model, compact=compact)
+        with open(target_file_name, 'w') as file:
+            file.write(json_string)
+
+
 def solve(input_path: str,
           output_path: str,
           answer_sets_count: int = 1,
@@ -117,18 +183,51 @@ def solve(input_path: str,
 def generate(output_path: Optional[str],
              model: Model,
              show_all_predicates: bool,
-             shown_predicates_dict: Dict[str, bool]):
+             shown_predicates_dict: Dict[str, bool]) -> Tuple[List[BoundTightening], List[str], int]:
     """Generates output logic program based on model.
 
     :param output_path: Output file path.
     :param model: Model to encode in output logic program.
     :param show_all_predicates: If True, then no "#show" directive is generated;
     :param shown_predicates_dict: Predicates to generate the "#show" directives for.
+    :return: Tuple of the form (list of the numbers of components' instances tightened by the bounds propagation,
+                                descriptions of the simple constraints removed by the constraints simplification,
+                                number of rules left out by the dead code elimination),
+        all empty (or 0) unless enabled.
     """
     if not output_path:
         raise BGError('Logic program output path must be specified.')
 
-    code = generate_code(model, show_all_predicates, shown_predicates_dict)
+    settings = Settings.get_settings()
+    if settings.static_checks:
+        conflicts = find_conflicts(model)
+        if conflicts:
+            raise BGError('The model is unsatisfiable:\n' + '\n'.join(conflicts))
+    simplification = simplify_constraints(model) if settings.constraints_simplification else None
+    if simplification is not None and simplification.contradictions:
+        raise BGError('The model is unsatisfiable:\n' + '\n'.join(simplification.contradictions))
+    symbol_table = create_symbol_table(model) if settings.intern_constants else None
+    tightenings = propagate_bounds(model) if settings.bounds_propagation else []
+    instances_counts = {t.component_id: t.bound for t in tightenings}
+    cache = __generation_cache if settings.generation_cache else None
+    simple_constraints = simplification.constraints if simplification is not None else None
     with open(output_path, 'w') as output_file:
-        output_file.write(code)
-        Settings.get_settings().save_changes(shown_predicates_dict=shown_predicates_dict)
+        pruned_rules_count = write_code(model, show_all_predicates, shown_predicates_dict, output_file, cache,
+                                        ports_compatibility_by_type=settings.ports_compatibility_by_type,
+                                        deterministic_ports_binding=settings.deterministic_ports_binding,
+                                        linear_symmetry_breaking=settings.linear_symmetry_breaking,
+                                        connections_symmetry_breaking=settings.connections_symmetry_breaking,
+                                        symbol_table=symbol_table,
+                                        instances_counts=instances_counts,
+                                        aggregated_resources=settings.aggregated_resources,
+                                        shared_conditions=settings.shared_conditions,
+                                        simple_constraints=simple_constraints,
+                                        dead_code_elimination=settings.dead_code_elimination)
+        settings.save_changes(shown_predicates_dict=shown_predicates_dict)
+    symbol_table_path = f'{output_path}{SYMBOL_TABLE_EXTENSION}'
+    if symbol_table is not None:
+        with open(symbol_table_path, 'w') as symbol_table_file:
+            symbol_table_file.write(get_json_string(symbol_table, sort=False, compact=True))
+    elif os.path.exists(symbol_table_path):
+        os.remove(symbol_table_path)    # Codes of the previously generated program do not apply anymore
+    return tightenings, simplification.removed if simplification is not None else [], pruned_rules_count
@@ -1,37 +1,34 @@
 """Provides helper functions for conversion between objects and JSON strings."""
 
 import json
-from typing import Any, List, Dict
+from typing import Any
 
+INDENT = 4
+COMPACT_SEPARATORS = (',', ':')
 
-def get_json_string(object_: Any, sort: bool = True) -> str:
-    """Converts the object to JSON string.
+
+def get_json_string(object_: Any, sort: bool = True, compact: bool = False) -> str:
+    """Converts the object to JSON string. Objects providing the to_json method are converted with it;
+    the others are converted to the dictionaries of their attributes.
+
+    The compact string is not indented, which also lets json use its (several times faster) C encoder.
 
     :param object_: Object
     :param sort: Whether to sort the keys.
+    :param compact: Whether to leave out the indentation and whitespace.
     :return: JSON string.
     """
-    return json.dumps(object_, default=lambda obj: obj.__dict__, sort_keys=sort, indent=4)
-
-
-def deserialize_list(class_, data) -> List[Any]:
-    """Creates a list of type class_ from json.
-
-    :param class_: Target class.
-    :param data: List of JSON objects.
-    :return: List of objects of type class_.
-    """
-    return [] if not data else list(map(class_.from_json, data))
+    if hasattr(object_, 'to_json'):
+        object_ = object_.to_json()
+    if compact:
+        return json.dumps(object_, default=__to_json, sort_keys=sort, separators=COMPACT_SEPARATORS)
+    return json.dumps(object_, default=__to_json, sort_keys=sort, indent=INDENT)
 
 
-def deserialize_dict(dict_) -> Dict[int, Any]:
-    """Maps the dict's kay to int.
+def __to_json(obj: Any) -> Any:
+    """Converts the object to a JSON-serializable form.
 
-    :param dict_: Input dictionary.
-    :return: Dictionary with its key mapped to int.
+    :param obj: Object.
+    :return: JSON-serializable form of the object.
     """
-    return {int(key): val for key, val in dict_.items()}
-
-
-
-
+    return obj.to_json() if hasattr(obj, 'to_json') else obj.__dict__
@@ -0,0 +1,102 @@
+"""Provides the binary project file format.
+
+The file starts with a header (magic bytes, format version and the number of sections), followed by the table
+of sections (name, offset and length of each of them) and the sections themselves. Each section holds a compact
+JSON string of one of the model's attributes, decoded separately, straight from the memory-mapped file. Creating
+the model decodes all the sections, hence the format is a compact container, not a lazily loaded one.
+"""
+
+import json
+import mmap
+import struct
+from typing import Any, Dict, BinaryIO, List, Tuple
+
+from misc.exceptions import BGError
+from misc.json_converter import get_json_string
+from model import Model
+
+MAGIC = b'BGPF'
+VERSION = 1
+ENCODING = 'utf-8'
+HEADER_FORMAT = '<4sHH'     # Magic bytes, version, number of sections
+SECTION_ENTRY_FORMAT = '<32sQQ'     # Name, offset, length
+SECTIONS = ['root_name', 'taxonomy', 'resources', 'ports', 'simple_constraints', 'complex_constraints']
+
+
+def write_project(model: Model, file: BinaryIO) -> None:
+    """Writes the model to the binary project file.
+
+    :param model: Model to write.
+    :param file: File opened for writing in binary mode.
+    """
+    data = model.to_json()
+    sections = [(name, get_json_string(data[name], compact=True).encode(ENCODING)) for name in SECTIONS]
+    offset = struct.calcsize(HEADER_FORMAT) + len(sections) * struct.calcsize(SECTION_ENTRY_FORMAT)
+    file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, len(sections)))
+    for name, section in sections:
+        file.write(struct.pack(SECTION_ENTRY_FORMAT, name.encode(ENCODING), offset, len(section)))
+        offset += len(section)
+    for _, section in sections:
+        file.write(section)
+
+
+class ProjectFile:
+    """Binary project file, memory-mapped and decoded section by section.
+
+    Attributes:
+        __buffer: Memory-mapped content of the file.
+        __sections: Offsets and lengths of the sections by their names.
+    """
+    def __init__(self, file: BinaryIO):
+        try:
+            self.__buffer: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, sections_count = struct.unpack_from(HEADER_FORMAT, self.__buffer)
+            if magic != MAGIC or version != VERSION:
+                raise BGError(f'{file.name} is not a project file of a supported version.')
+            self.__sections: Dict[str, Tuple[int, int]] = {}
+            entries_offset = struct.calcsize(HEADER_FORMAT)
+            for i in range(sections_count):
+                name, offset, length = struct.unpack_from(SECTION_ENTRY_FORMAT, self.__buffer,
+                                                          entries_offset + i * struct.calcsize(SECTION_ENTRY_FORMAT))
+                self.__sections[name.rstrip(b'\0').decode(ENCODING)] = (offset, length)
+        except (ValueError, struct.error) as e:
+            raise BGError(f'Error while opening the project file.\n{e}')
+
+    def __getitem__(self, name: str) -> Any:
+        """Decodes the section anew on every access (since creating the model consumes the decoded data),
+        so the decoded sections are not kept in memory.
+
+        :param name: Name of the section.
+        :return: Decoded section.
+        """
+        if name not in self.__sections:
+            raise BGError(f'Project file does not contain the "{name}" section.')
+        offset, length = self.__sections[name]
+        return json.loads(self.__buffer[offset:offset + length].decode(ENCODING))
+
+    @property
+    def sections_names(self) -> List[str]:
+        """Returns the names of the file's sections."""
+        return list(self.__sections)
+
+    @property
+    def root_name(self) -> str:
+        """Returns the name of the root component, without decoding the other sections."""
+        return self['root_name']
+
+    def to_model(self) -> Model:
+        """Creates the model, decoding its sections one by one.
+
+        :return: Model.
+        """
+        return Model.from_dict(self)
+
+    def close(self) -> None:
+        """Releases the memory-mapped content of the file."""
+        self.__buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,121 @@
+"""Provides the journal of the project's changes, kept next to the project file.
+
+Instead of rewriting the whole project file on every save, the changes of the model since the previous save are
+appended to the journal as a single JSON line. Opening the project replays the journal on top of the project file.
+A line left incomplete by a crash is ignored, and cut off before the next line is appended, so every save is either
+applied entirely or not at all.
+"""
+
+import json
+import os
+from collections import ChainMap
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from misc.json_converter import get_json_string
+
+JOURNAL_EXTENSION = '.journal'
+ENCODING = 'utf-8'
+# The journal is compacted (merged into the project file) once it gets larger than this fraction of the project file
+COMPACTION_RATIO = 0.5
+
+
+def get_journal_path(file_name: str) -> str:
+    """Returns the path of the project file's journal.
+
+    :param file_name: Project file path.
+    :return: Journal file path.
+    """
+    return f'{file_name}{JOURNAL_EXTENSION}'
+
+
+def needs_compaction(file_name: str) -> bool:
+    """Checks whether the project file's journal should be compacted into the project file.
+
+    :param file_name: Project file path.
+    :return: True if the project file does not exist or its journal is too large; False otherwise.
+    """
+    if not os.path.exists(file_name):
+        return True
+    journal_path = get_journal_path(file_name)
+    journal_size = os.path.getsize(journal_path) if os.path.exists(journal_path) else 0
+    return journal_size > COMPACTION_RATIO * os.path.getsize(file_name)
+
+
+def append_changes(file_name: str, root_name: str, changes: List[Tuple[str, int, Optional[Any]]]) -> None:
+    """Appends the model's changes to the project file's journal, as a single line.
+
+    :param file_name: Project file path.
+    :param root_name: Name of the root component.
+    :param changes: List of tuples of the form (section's name, entity's id, changed entity or None if removed).
+    """
+    record = {
+        'root_name': root_name,
+        'changes': [[section, id_, None if item is None else item.to_json()] for section, id_, item in changes]
+    }
+    line = get_json_string(record, sort=False, compact=True) + '\n'
+    __truncate_incomplete_line(get_journal_path(file_name))
+    with open(get_journal_path(file_name), 'a', encoding=ENCODING) as journal:
+        journal.write(line)
+        journal.flush()
+        os.fsync(journal.fileno())
+
+
+def __truncate_incomplete_line(journal_path: str) -> None:
+    """Cuts off the journal's last line, if a crash has left it incomplete (not ending with a new line).
+    Otherwise the lines appended after it would never be replayed.
+
+    :param journal_path: Journal file path.
+    """
+    if not os.path.exists(journal_path) or os.path.getsize(journal_path) == 0:
+        return
+    with open(journal_path, 'rb+') as journal:
+        journal.seek(-1, os.SEEK_END)
+        if journal.read(1) == b'\n':
+            return
+        journal.seek(0)
+        journal.truncate(journal.read().rfind(b'\n') + 1)    # Whole journal, if it has no complete line
+        journal.flush()
+        os.fsync(journal.fileno())
+
+
+def remove_journal(file_name: str) -> None:
+    """Removes the project file's journal, if it exists.
+
+    :param file_name: Project file path.
+    """
+    journal_path = get_journal_path(file_name)
+    if os.path.exists(journal_path):
+        os.remove(journal_path)
+
+
+def replay(file_name: str, data: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Applies the changes from the project file's journal (if it exists) to the project's data. Only the sections
+    changed in the journal are looked up in the data, the others are left to be looked up by the caller.
+
+    :param file_name: Project file path.
+    :param data: Project's data (e.g. ProjectFile).
+    :return: Project's data with the changes applied.
+    """
+    journal_path = get_journal_path(file_name)
+    if not os.path.exists(journal_path):
+        return data
+
+    changed: Dict[str, Any] = {}
+    sections: Dict[str, Dict[int, Any]] = {}    # Sections' items by their ids, preserving their order
+    with open(journal_path, 'r', encoding=ENCODING) as journal:
+        for line in journal:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                break   # Incomplete line, written during a crash
+            changed['root_name'] = record['root_name']
+            for section, id_, item in record['changes']:
+                if section not in sections:
+                    sections[section] = {i['id_']: i for i in data[section]}
+                if item is None:
+                    sections[section].pop(id_, None)
+                else:
+                    sections[section][id_] = item
+    for section, items in sections.items():
+        changed[section] = list(items.values())
+    return ChainMap(changed, data)
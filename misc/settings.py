@@ -46,6 +46,35 @@ class Settings:
         show_all_predicates: Whether to include the "#show" directives in the generated logic program file
             at all.
         instance_representation: Default instance representation.
+        compact_project_files: Whether to save the projects as compact (not indented) JSON files.
+        journaled_saves: Whether to append the changes to the project file's journal on save,
+            instead of rewriting the whole project file.
+        generation_cache: Whether to keep the sections of the generated logic programs in memory, so that
+            the sections whose data has not changed since the previous export are not generated anew.
+        ports_compatibility_by_type: Whether to encode the compatibility of ports in the generated logic programs
+            once per pair of port types, instead of once per pair of ports' individuals.
+        deterministic_ports_binding: Whether to bind the ports' instances to the components' instances according
+            to their ids in the generated logic programs, instead of letting the solver choose them.
+        linear_symmetry_breaking: Whether to order the instances in the generated logic programs by rules over
+            the pairs of consecutive ids, instead of all pairs of ids.
+        connections_symmetry_breaking: Whether to order the instances (of the components with symmetry breaking)
+            in the generated logic programs lexicographically by their connections too.
+        intern_constants: Whether to encode the string constants in the generated logic programs by integer codes
+            (translated back to the names by the solver, using the symbol table saved next to the program).
+        bounds_propagation: Whether to generate only as many instances of the components as can be in a configuration
+            according to the bounds propagated from the associations, simple constraints and resources.
+        static_checks: Whether to check the model for the conflicts making it unsatisfiable before generating
+            the logic programs (and not to generate them if any is found).
+        aggregated_resources: Whether to balance the resources in the generated logic programs by the numbers
+            of instances of each component type, instead of the amounts produced by each instance
+            (no "prd" atoms are derived then).
+        shared_conditions: Whether to generate the identical conditions of the complex constraints in the generated
+            logic programs once, under a head shared by all of them.
+        constraints_simplification: Whether to merge the simple constraints counting the same components and to remove
+            the ones that always hold or are implied by the other ones, before generating the logic programs
+            (and not to generate them if any of the constraints can never be satisfied).
+        dead_code_elimination: Whether to leave out the rules of the taxonomy, resources and ports in the generated
+            logic programs that never apply, since the components or ports' individuals they refer to have no instances.
     """
     def __init__(self,
                  recently_opened_projects: Deque[ProjectInfo] = None,
@@ -55,7 +84,21 @@ class Settings:
                  show_predicates_symbols: bool = True,
                  program_to_solve_path: str = None,
                  show_all_predicates: bool = False,
-                 instance_representation: InstanceRepresentation = InstanceRepresentation.Mixed):
+                 instance_representation: InstanceRepresentation = InstanceRepresentation.Mixed,
+                 compact_project_files: bool = False,
+                 journaled_saves: bool = False,
+                 generation_cache: bool = False,
+                 ports_compatibility_by_type: bool = False,
+                 deterministic_ports_binding: bool = False,
+                 linear_symmetry_breaking: bool = False,
+                 connections_symmetry_breaking: bool = False,
+                 intern_constants: bool = False,
+                 bounds_propagation: bool = False,
+                 static_checks: bool = False,
+                 aggregated_resources: bool = False,
+                 shared_conditions: bool = False,
+                 constraints_simplification: bool = False,
+                 dead_code_elimination: bool = False):
         self.recently_opened_projects: Deque[ProjectInfo] = recently_opened_projects if recently_opened_projects is not None \
             else deque([], maxlen=MAX_RECENTLY_OPENED_PROJECTS_COUNT)
         # By default show only IN and CN predicates
@@ -67,6 +110,20 @@ class Settings:
         self.show_predicates_symbols: bool = show_predicates_symbols
         self.instance_representation: InstanceRepresentation = instance_representation
         self.program_to_solve_path: str = program_to_solve_path
+        self.compact_project_files: bool = compact_project_files
+        self.journaled_saves: bool = journaled_saves
+        self.generation_cache: bool = generation_cache
+        self.ports_compatibility_by_type: bool = ports_compatibility_by_type
+        self.deterministic_ports_binding: bool = deterministic_ports_binding
+        self.linear_symmetry_breaking: bool = linear_symmetry_breaking
+        self.connections_symmetry_breaking: bool = connections_symmetry_breaking
+        self.intern_constants: bool = intern_constants
+        self.bounds_propagation: bool = bounds_propagation
+        self.static_checks: bool = static_checks
+        self.aggregated_resources: bool = aggregated_resources
+        self.shared_conditions: bool = shared_conditions
+        self.constraints_simplification: bool = constraints_simplification
+        self.dead_code_elimination: bool = dead_code_elimination
 
     @classmethod
     def get_settings(cls):
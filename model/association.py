@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Dict, Any
 
 
 class Association:
@@ -8,6 +8,8 @@ class Association:
         min_: Minimal quantity of components
         max_: Maximal quantity of components
     """
+    __slots__ = ('min_', 'max_')
+
     def __init__(self,
                  min_: Optional[int] = None,
                  max_: Optional[int] = None):
@@ -15,6 +17,13 @@ class Association:
         self.max_: Optional[int] = max_
 
     @classmethod
-    def from_json(cls, data):
-        """Necessary to create an instance from JSON"""
-        return None if not data else cls(**data)
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> Optional['Association']:
+        """Creates an instance from the dictionary of its (JSON-decoded) attributes; None if there is none."""
+        return None if not data else cls(data['min_'], data['max_'])
+
+    def to_json(self) -> Dict[str, Any]:
+        """Necessary to convert an instance to JSON"""
+        return {
+            'min_': self.min_,
+            'max_': self.max_
+        }
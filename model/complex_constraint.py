@@ -1,7 +1,6 @@
 import uuid
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 
-from misc.json_converter import deserialize_list
 from model import SimpleConstraint
 
 
@@ -20,6 +19,8 @@ class ComplexConstraint:
         consequent_all: If True, then the all elements of consequent must evaluate to true at the same time;
             otherwise some of them must.
     """
+    __slots__ = ('id_', 'name', 'description', 'antecedent', 'antecedent_all', 'consequent', 'consequent_all')
+
     def __init__(self,
                  id_: Optional[int] = None,
                  name: str = None,
@@ -37,9 +38,21 @@ class ComplexConstraint:
         self.consequent_all: bool = consequent_all
 
     @classmethod
-    def from_json(cls, data):
-        """Necessary to create an instance from JSON"""
-        data['antecedent'] = deserialize_list(SimpleConstraint, data['antecedent'])
-        data['consequent'] = deserialize_list(SimpleConstraint, data['consequent'])
-        return cls(**data)
+    def from_dict(cls, data: Dict[str, Any]) -> 'ComplexConstraint':
+        """Creates an instance from the dictionary of its (JSON-decoded) attributes."""
+        return cls(data['id_'], data['name'], data['description'],
+                   [SimpleConstraint.from_dict(sc) for sc in data['antecedent']],
+                   [SimpleConstraint.from_dict(sc) for sc in data['consequent']],
+                   data['antecedent_all'], data['consequent_all'])
 
+    def to_json(self) -> Dict[str, Any]:
+        """Necessary to convert an instance to JSON"""
+        return {
+            'id_': self.id_,
+            'name': self.name,
+            'description': self.description,
+            'antecedent': [sc.to_json() for sc in self.antecedent],
+            'antecedent_all': self.antecedent_all,
+            'consequent': [sc.to_json() for sc in self.consequent],
+            'consequent_all': self.consequent_all
+        }
@@ -1,7 +1,6 @@
 import uuid
-from typing import Optional, Dict
+from typing import Optional, Dict, Any
 
-from misc.json_converter import deserialize_dict
 from model import Association
 
 
@@ -28,6 +27,9 @@ class Component:
             means that resource is consumed by component.
         ports: Dictionary of type "id of port": "Amount of ports the component has".
     """
+    __slots__ = ('id_', 'name', 'is_leaf', 'level', 'parent_id', 'exact', 'count', 'min_count', 'max_count',
+                 'symmetry_breaking', 'association', 'produces', 'ports')
+
     def __init__(self,
                  name: str,
                  level: int,
@@ -57,19 +59,32 @@ class Component:
         self.ports: Dict[int, int] = ports if ports is not None else {}
 
     @classmethod
-    def from_json(cls, data):
-        """Necessary to create an instance from JSON"""
-        data['association'] = Association.from_json(data['association'])
-        data['produces'] = deserialize_dict(data['produces'])
-        data['ports'] = deserialize_dict(data['ports'])
-        return cls(**data)
+    def from_dict(cls, data: Dict[str, Any]) -> 'Component':
+        """Creates an instance from the dictionary of its (JSON-decoded) attributes."""
+        return cls(data['name'], data['level'], data['id_'], data['parent_id'], data['is_leaf'], data['exact'],
+                   data['count'], data['min_count'], data['max_count'], data['symmetry_breaking'],
+                   Association.from_dict(data['association']),
+                   {int(id_): amount for id_, amount in data['produces'].items()},   # JSON keys are strings
+                   {int(id_): amount for id_, amount in data['ports'].items()})
+
+    def to_json(self) -> Dict[str, Any]:
+        """Necessary to convert an instance to JSON"""
+        return {
+            'id_': self.id_,
+            'name': self.name,
+            'is_leaf': self.is_leaf,
+            'level': self.level,
+            'parent_id': self.parent_id,
+            'exact': self.exact,
+            'count': self.count,
+            'min_count': self.min_count,
+            'max_count': self.max_count,
+            'symmetry_breaking': self.symmetry_breaking,
+            'association': None if self.association is None else self.association.to_json(),
+            'produces': self.produces,
+            'ports': self.ports
+        }
 
     def __repr__(self):
         """Provides object's string representation. For development purposes only."""
         return self.name
-
-
-
-
-
-
@@ -22,12 +22,7 @@ def __extract_tabs(line: str) -> Tuple[int, str]:
     :param line: Line containing \t symbols and component's name.
     :return: A tuple of the form (component's level, components'name).
     """
-    tab_count = 0
-    for letter in line:
-        if letter != CHILD_SYMBOL:
-            break
-        else:
-            tab_count += 1
+    tab_count = len(line) - len(line.lstrip(CHILD_SYMBOL))
     cmp_name = line.lstrip()
     return tab_count, normalize_name(cmp_name)
 
@@ -42,7 +37,7 @@ def string_to_taxonomy(taxonomy_string: str) -> List[Component]:
                                                 CHILD_SYMBOL)  # make sure N spaces are converted to '\t'
     taxonomy = []
     last_on_level = []
-    cmp_names = []
+    cmp_names = set()
 
     for line in taxonomy_string.split('\n'):
         if not line or line.isspace():      # If entire line contains only spaces, ignore it
@@ -52,7 +47,7 @@ def string_to_taxonomy(taxonomy_string: str) -> List[Component]:
             raise BGError(f'Taxonomy contains more than one component '
                           f'named "{component_name}".')
         else:
-            cmp_names.append(component_name)
+            cmp_names.add(component_name)
         if len(last_on_level) < level:      # If there are too many intendations,
             raise BGError(f'Cannot create a child of non-existing component. '
                           f'Check number of tabs in component: "{component_name} " '
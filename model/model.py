@@ -1,7 +1,8 @@
-from typing import List, Tuple, Any
+from contextlib import contextmanager
+from itertools import count
+from typing import List, Tuple, Any, Dict, Optional, Iterator, Iterable, Mapping, Set, Callable
 import json
 
-from misc.json_converter import deserialize_list
 from model.helpers import normalize_name, matches
 from misc.exceptions import BGError
 
@@ -11,18 +12,51 @@ from model.complex_constraint import ComplexConstraint
 from model.port import Port
 from model.resource import Resource
 
+SECTIONS_BY_TYPE = {
+    Component: 'taxonomy',
+    Resource: 'resources',
+    Port: 'ports',
+    SimpleConstraint: 'simple_constraints',
+    ComplexConstraint: 'complex_constraints'
+}
 
 class Model:
     """Gathers in one place all configuration's problem instance information.
 
+    Model issues its own compact, sequential ids to the components, resources, ports and constraints added to it;
+    the (uuid) ids of the entities loaded into the Model are remapped to such ids as well.
+
     Attributes:
         root_name: Name of the root component.
         taxonomy:  Taxonomy of components - tree structure, implemented as a list of components,
             each of them having a pointer to the parent component (or None if there is no parent).
+            The components removed within an open batch of edits are taken out of it once it is read.
         resources:  List of resources.
         ports: List of ports.
         simple_constraints: List of simple constraints.
         complex_constraints: List of complex constraints.
+        __components_by_id: Index of components by their ids.
+        __components_by_name: Index of components by their names.
+        __components_ordinals: Ordinal numbers of components, preserving their order in the taxonomy.
+        __ordinals_counter: Counter issuing the ordinal numbers of components.
+        __children: Direct children of components (in the taxonomy's order) by their parent's id;
+            the top-level components are stored under None.
+        __leaf_children_cache: Cached leaf descendants of components by their ids.
+        __resources_by_id: Index of resources by their ids.
+        __resources_by_name: Index of resources by their names.
+        __ports_by_id: Index of ports by their ids.
+        __ports_by_name: Index of ports by their names.
+        __constraints_by_component_id: Constraints (by their ids) referring to the components, by the components' ids.
+        __constraints_names: Names of all constraints (simple and complex).
+        __ids_counter: Counter issuing the ids of entities.
+        __batch_depth: Number of currently open (nested) batches of edits.
+        __batch_callbacks: Functions to be executed once the outermost batch of edits is committed.
+        __taxonomy: List of components, returned by the taxonomy property.
+        __taxonomy_compaction_pending: True if components have been removed from the indexes, but not yet
+            from the taxonomy list (which is deferred while a batch of edits is open).
+        __changes: Entities changed (or None if removed) since the changes were last cleared,
+            by their sections' names and ids.
+        __all_changed: True if the whole model has changed since the changes were last cleared.
     """
     def __init__(self,
                  root_name: str = None,
@@ -32,30 +66,276 @@ class Model:
                  simple_constraints: List[SimpleConstraint] = None,
                  complex_constraints: List[ComplexConstraint] = None):
         self.root_name: str = root_name
-        self.taxonomy: List[Component] = taxonomy if taxonomy is not None else []
+        self.__taxonomy: List[Component] = taxonomy if taxonomy is not None else []
         self.resources: List[Resource] = resources if resources is not None else []
         self.ports: List[Port] = ports if ports is not None else []
         self.simple_constraints: List[SimpleConstraint] = simple_constraints if simple_constraints is not None else []
         self.complex_constraints: List[ComplexConstraint] = complex_constraints if complex_constraints is not None else []
 
+        self.__components_by_id: Dict[int, Component] = {}
+        self.__components_by_name: Dict[str, Component] = {}
+        self.__components_ordinals: Dict[int, int] = {}
+        self.__ordinals_counter: Iterator[int] = count()
+        self.__children: Dict[Optional[int], List[Component]] = {}
+        self.__leaf_children_cache: Dict[int, List[Component]] = {}
+        self.__resources_by_id: Dict[int, Resource] = {}
+        self.__resources_by_name: Dict[str, Resource] = {}
+        self.__ports_by_id: Dict[int, Port] = {}
+        self.__ports_by_name: Dict[str, Port] = {}
+        self.__constraints_by_component_id: Dict[int, Dict[int, Any]] = {}
+        self.__constraints_names: Set[str] = set()
+        self.__ids_counter: Iterator[int] = count(1)
+        self.__batch_depth: int = 0
+        self.__batch_callbacks: List[Callable[[], Any]] = []
+        self.__taxonomy_compaction_pending: bool = False
+        self.__changes: Dict[Tuple[str, int], Optional[Any]] = {}
+        self.__all_changed: bool = True
+        self.__remap_ids()
+        self.__index_components()
+        for res in self.resources:
+            self.__resources_by_id[res.id_] = res
+            self.__resources_by_name.setdefault(res.name, res)
+        for prt in self.ports:
+            self.__ports_by_id[prt.id_] = prt
+            self.__ports_by_name.setdefault(prt.name, prt)
+        for ctr in self.get_all_constraints():
+            self.__index_constraint(ctr)
+            self.__constraints_names.add(ctr.name)
+
     def clear(self):
         """Clears out all Model's attributes and sets the new root name."""
-        self.taxonomy.clear()
+        self.__taxonomy.clear()
+        self.__taxonomy_compaction_pending = False
         self.resources.clear()
         self.ports.clear()
         self.simple_constraints.clear()
         self.complex_constraints.clear()
+        self.__index_components()
+        self.__resources_by_id.clear()
+        self.__resources_by_name.clear()
+        self.__ports_by_id.clear()
+        self.__ports_by_name.clear()
+        self.__constraints_by_component_id.clear()
+        self.__constraints_names.clear()
+        self.__ids_counter = count(1)
+        self.__changes.clear()
+        self.__all_changed = True
+
+    def mark_changed(self, *items: Any) -> None:
+        """Marks the entities as changed. Necessary when the entities' attributes are set directly,
+        not by Model's methods.
+
+        :param items: Changed components, resources, ports or constraints.
+        """
+        if not self.__all_changed:
+            for item in items:
+                self.__changes[(SECTIONS_BY_TYPE[type(item)], item.id_)] = item
+
+    def __mark_removed(self, *items: Any) -> None:
+        """Marks the entities as removed.
+
+        :param items: Removed components, resources, ports or constraints.
+        """
+        if not self.__all_changed:
+            for item in items:
+                self.__changes[(SECTIONS_BY_TYPE[type(item)], item.id_)] = None
+
+    def get_changes(self) -> Optional[List[Tuple[str, int, Optional[Any]]]]:
+        """Returns the changes since they were last cleared (see clear_changes).
+
+        :return: List of tuples of the form (section's name, entity's id, changed entity or None if removed),
+            in the order of the first change of each entity; None if the whole model has changed (e.g. it has been
+            loaded, cleared or has got a new taxonomy).
+        """
+        if self.__all_changed:
+            return None
+        return [(section, id_, item) for (section, id_), item in self.__changes.items()]
+
+    def clear_changes(self) -> None:
+        """Forgets the changes, once they have been saved."""
+        self.__changes.clear()
+        self.__all_changed = False
+
+    def __next_id(self) -> int:
+        """Issues a new id.
+
+        :return: Id.
+        """
+        return next(self.__ids_counter)
+
+    def __remap_ids(self) -> None:
+        """Issues new ids to all the Model's entities and updates all the references to them."""
+        cmps_ids = self.__remap_components_ids(self.__taxonomy)
+        res_ids = {}
+        for res in self.resources:
+            res_ids[res.id_] = res.id_ = self.__next_id()
+        prt_ids = {}
+        for prt in self.ports:
+            prt_ids[prt.id_] = prt.id_ = self.__next_id()
+        for prt in self.ports:
+            prt.compatible_with = [prt_ids[id_] for id_ in prt.compatible_with if id_ in prt_ids]
+        remap_produces = any(id_ != new_id for id_, new_id in res_ids.items())
+        remap_ports = any(id_ != new_id for id_, new_id in prt_ids.items())
+        for cmp in self.__taxonomy:     # Unless the ids are unchanged (e.g. the project has been saved with compact ids)
+            if remap_produces or any(id_ not in res_ids for id_ in cmp.produces):
+                cmp.produces = {res_ids[id_]: val for id_, val in cmp.produces.items() if id_ in res_ids}
+            if remap_ports or any(id_ not in prt_ids for id_ in cmp.ports):
+                cmp.ports = {prt_ids[id_]: val for id_, val in cmp.ports.items() if id_ in prt_ids}
+        for ctr in self.get_all_constraints():
+            ctr.id_ = self.__next_id()
+            self.__issue_nested_constraints_ids(ctr)
+            self.__remap_constraints_components_ids(ctr, cmps_ids)
+
+    def __remap_components_ids(self, taxonomy: List[Component]) -> Dict[int, int]:
+        """Issues new ids to the components of the taxonomy and updates their parents' ids.
+
+        :param taxonomy: List of components.
+        :return: Dictionary of the form "old id": "new id".
+        """
+        cmps_ids = {}
+        for cmp in taxonomy:
+            cmps_ids[cmp.id_] = cmp.id_ = self.__next_id()
+        for cmp in taxonomy:
+            if cmp.parent_id is not None:
+                cmp.parent_id = cmps_ids.get(cmp.parent_id)
+        return cmps_ids
+
+    def __issue_nested_constraints_ids(self, ctr: Any) -> None:
+        """Issues new ids to the simple constraints nested in a complex constraint.
+
+        :param ctr: SimpleConstraint or ComplexConstraint.
+        """
+        if isinstance(ctr, ComplexConstraint):
+            for sc in [*ctr.antecedent, *ctr.consequent]:
+                sc.id_ = self.__next_id()
+
+    @staticmethod
+    def __remap_constraints_components_ids(ctr: Any, cmps_ids: Dict[int, int]) -> None:
+        """Updates the ids of components the constraint refers to.
+
+        :param ctr: SimpleConstraint or ComplexConstraint.
+        :param cmps_ids: Dictionary of the form "old id": "new id" of components.
+        """
+        simple_ctrs = [ctr] if isinstance(ctr, SimpleConstraint) else [*ctr.antecedent, *ctr.consequent]
+        for sc in simple_ctrs:
+            sc.components_ids = [cmps_ids[id_] for id_ in sc.components_ids if id_ in cmps_ids]
+
+    @contextmanager
+    def batch(self, on_commit: Optional[Callable[[], Any]] = None) -> Iterator['Model']:
+        """Groups the edits of the model into a single batch, eg:
+            with model.batch(on_commit=lambda: pub.sendMessage(actions.TAXONOMY_EDITED)):
+                ...
+
+        Every edit is still validated, and updates the indexes and the leaf status of the components it affects,
+        at once (incrementally, hence at a cost independent of the model's size), so that the model stays consistent
+        within the batch. What is deferred are the callbacks (e.g. change notifications, which make the views rebuild),
+        executed once the batch is committed, and taking the removed components out of the taxonomy list, done once
+        the taxonomy is read (or the batch is committed) instead of after every removal. Batches may be nested;
+        the callbacks of all of them are executed once, after the outermost batch is committed. Edits are not rolled
+        back on error, and then the callbacks are not executed.
+
+        :param on_commit: Function to be executed (e.g. a change notification) once the batch is committed.
+        :return: The model itself.
+        """
+        if on_commit is not None and on_commit not in self.__batch_callbacks:
+            self.__batch_callbacks.append(on_commit)
+        self.__batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self.__batch_depth -= 1
+            if not self.__batch_depth:
+                self.__batch_callbacks.clear()
+                self.__compact_taxonomy()
+            raise
+        self.__batch_depth -= 1
+        if not self.__batch_depth:
+            self.__compact_taxonomy()
+            callbacks, self.__batch_callbacks = self.__batch_callbacks, []
+            for callback in callbacks:
+                callback()
+
+    @property
+    def taxonomy(self) -> List[Component]:
+        """Returns the taxonomy list, without the components removed within the open batch (if any)."""
+        self.__compact_taxonomy()
+        return self.__taxonomy
+
+    @taxonomy.setter
+    def taxonomy(self, taxonomy: List[Component]) -> None:
+        """Sets the taxonomy list itself; set_taxonomy also updates the indexes and the components."""
+        self.__taxonomy = taxonomy
+
+    def __compact_taxonomy(self) -> None:
+        """Removes from the taxonomy list the components that have already been removed from the indexes."""
+        if self.__taxonomy_compaction_pending:
+            self.__taxonomy_compaction_pending = False
+            self.__taxonomy = [c for c in self.__taxonomy if c.id_ in self.__components_by_id]
+
+    def __remove_from_taxonomy(self, cmps_ids: Set[int]) -> None:
+        """Removes the components from the taxonomy list, or defers it until the batch is committed.
+
+        :param cmps_ids: Ids of the components to remove.
+        """
+        if self.__batch_depth:
+            self.__taxonomy_compaction_pending = True
+        else:
+            self.__taxonomy = [c for c in self.__taxonomy if c.id_ not in cmps_ids]
+
+    def __iter_taxonomy(self) -> Iterator[Component]:
+        """Iterates over the taxonomy's components in their order, skipping those removed within the open batch,
+        so that the taxonomy list need not be rebuilt before every lookup.
+
+        :return: Iterator over the components.
+        """
+        if not self.__taxonomy_compaction_pending:
+            return iter(self.__taxonomy)
+        return (c for c in self.__taxonomy if c.id_ in self.__components_by_id)
+
+    @staticmethod
+    def __find(items: Iterable[Any], by_id: Dict[int, Any], by_name: Dict[str, Any], **kwargs) -> Optional[Any]:
+        """Returns the first item whose attributes match the kwargs. If the item is looked for only by its id or
+        only by its name, then the corresponding index is used instead of scanning the items.
+
+        :param items: Items to look in.
+        :param by_id: Index of the items by their ids.
+        :param by_name: Index of the items by their names.
+        :param kwargs: Desired attributes of an item.
+        :return: Item if found; None otherwise.
+        """
+        if len(kwargs) == 1:
+            if 'id_' in kwargs:
+                return by_id.get(kwargs['id_'])
+            elif 'name' in kwargs:
+                return by_name.get(kwargs['name'])
+        return next((item for item in items if matches(item, **kwargs)), None)
 
     @classmethod
     def from_json(cls, json_string):
         """Necessary to create an instance from JSON."""
-        data = json.loads(json_string)
-        data['taxonomy'] = deserialize_list(Component, data['taxonomy'])
-        data['resources'] = deserialize_list(Resource, data['resources'])  # Convert dictionary to object
-        data['ports'] = deserialize_list(Port, data['ports'])
-        data['simple_constraints'] = deserialize_list(SimpleConstraint, data['simple_constraints'])
-        data['complex_constraints'] = deserialize_list(ComplexConstraint, data['complex_constraints'])
-        return cls(**data)
+        return cls.from_dict(json.loads(json_string))
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]):
+        """Creates an instance from the mapping of its (JSON-decoded) attributes. Each attribute is looked up once,
+        so the mapping may decode them one by one (e.g. ProjectFile)."""
+        return cls(root_name=data['root_name'],
+                   taxonomy=[Component.from_dict(cmp) for cmp in data['taxonomy']],
+                   resources=[Resource.from_dict(res) for res in data['resources']],
+                   ports=[Port.from_dict(prt) for prt in data['ports']],
+                   simple_constraints=[SimpleConstraint.from_dict(ctr) for ctr in data['simple_constraints']],
+                   complex_constraints=[ComplexConstraint.from_dict(ctr) for ctr in data['complex_constraints']])
+
+    def to_json(self) -> Dict[str, Any]:
+        """Necessary to convert an instance to JSON; leaves out the indexes."""
+        return {
+            'root_name': self.root_name,
+            'taxonomy': [cmp.to_json() for cmp in self.taxonomy],
+            'resources': [res.to_json() for res in self.resources],
+            'ports': [prt.to_json() for prt in self.ports],
+            'simple_constraints': [ctr.to_json() for ctr in self.simple_constraints],
+            'complex_constraints': [ctr.to_json() for ctr in self.complex_constraints]
+        }
 
     # Root component
     def set_root_name(self, root_name: str) -> None:
@@ -64,7 +344,7 @@ class Model:
         :param root_name: Name of the root component.
         """
         root_name = normalize_name(root_name)
-        if root_name in self.get_all_components_names():
+        if root_name in self.__components_by_name:
             raise BGError(f'Component with name: "{root_name}" already exists in the taxonomy.')
         self.root_name = root_name
 
@@ -74,30 +354,102 @@ class Model:
 
         :param taxonomy: List of components representing the taxonomy.
         """
-        self.taxonomy = taxonomy
+        self.__all_changed = True
+        cmps_ids = self.__remap_components_ids(taxonomy)
+        for ctr in self.get_all_constraints():
+            self.__remap_constraints_components_ids(ctr, cmps_ids)
+        self.__taxonomy = taxonomy
+        self.__taxonomy_compaction_pending = False
+        self.__index_components()
+        self.__constraints_by_component_id.clear()
+        for ctr in self.get_all_constraints():
+            self.__index_constraint(ctr)
         self.__update_taxonomy()
 
+    def __index_components(self) -> None:
+        """Rebuilds the indexes of components from scratch."""
+        self.__components_by_id.clear()
+        self.__components_by_name.clear()
+        self.__components_ordinals.clear()
+        self.__ordinals_counter = count()
+        self.__children.clear()
+        self.__leaf_children_cache.clear()
+        for cmp in self.__taxonomy:
+            self.__index_component(cmp)
+
+    def __index_component(self, cmp: Component) -> None:
+        """Adds the component to the indexes of components.
+
+        :param cmp: Component to add.
+        """
+        self.__components_by_id[cmp.id_] = cmp
+        self.__components_by_name.setdefault(cmp.name, cmp)
+        self.__components_ordinals[cmp.id_] = next(self.__ordinals_counter)
+        self.__children.setdefault(cmp.parent_id, []).append(cmp)
+
+    def __unindex_component(self, cmp: Component) -> None:
+        """Removes the component from the indexes of components.
+
+        :param cmp: Component to remove.
+        """
+        self.__components_by_id.pop(cmp.id_, None)
+        if self.__components_by_name.get(cmp.name) is cmp:
+            del self.__components_by_name[cmp.name]
+        self.__components_ordinals.pop(cmp.id_, None)
+        self.__leaf_children_cache.pop(cmp.id_, None)
+        self.__children.pop(cmp.id_, None)
+        siblings = self.__children.get(cmp.parent_id)
+        if siblings is not None:    # Unless its parent has been removed already
+            siblings.remove(cmp)
+        self.__invalidate_leaf_children(cmp.parent_id)
+
+    def __invalidate_leaf_children(self, cmp_id: Optional[int]) -> None:
+        """Removes the cached leaf descendants of the component and all of its ancestors.
+
+        :param cmp_id: Id of the component whose subtree has changed.
+        """
+        while cmp_id is not None:
+            self.__leaf_children_cache.pop(cmp_id, None)
+            cmp = self.__components_by_id.get(cmp_id)
+            cmp_id = None if cmp is None else cmp.parent_id
+
     def __update_taxonomy(self) -> None:
         """Traverses through taxonomy and sets the default properties of "leaf" and "non-leaf" components.
-        Used when taxonomy is changed.
-        """
-        parents_ids = [cmp.parent_id for cmp in self.taxonomy if cmp.parent_id is not None]
-        parents_ids = set(parents_ids)
-
-        for cmp in self.taxonomy:
-            if cmp.id_ not in parents_ids:
-                # Cmp is a leaf
-                cmp.is_leaf = True
-                cmp.symmetry_breaking = True
-            else:
-                # Cmp is not a leaf
-                cmp.is_leaf = False
-                cmp.symmetry_breaking = None
-                cmp.count = None
-                cmp.min_count = None
-                cmp.max_count = None
-                cmp.produces = {}
-                cmp.ports = {}
+        Used when the whole taxonomy is changed.
+        """
+        for cmp in self.__taxonomy:
+            self.__update_leaf_status(cmp)
+
+    def __update_parents_leaf_status(self, cmp: Component) -> None:
+        """Sets the default properties of the component's parent, after a child was added to or removed from it.
+        Used instead of traversing through the whole taxonomy when a single component is added or removed.
+
+        :param cmp: Component added or removed.
+        """
+        if cmp.parent_id is not None:
+            parent = self.__components_by_id.get(cmp.parent_id)
+            if parent is not None:
+                self.__update_leaf_status(parent)
+
+    def __update_leaf_status(self, cmp: Component) -> None:
+        """Sets the default properties of "leaf" or "non-leaf" component, depending on whether it has children.
+
+        :param cmp: Component to update.
+        """
+        self.mark_changed(cmp)
+        if not self.__children.get(cmp.id_):
+            # Cmp is a leaf
+            cmp.is_leaf = True
+            cmp.symmetry_breaking = True
+        else:
+            # Cmp is not a leaf
+            cmp.is_leaf = False
+            cmp.symmetry_breaking = None
+            cmp.count = None
+            cmp.min_count = None
+            cmp.max_count = None
+            cmp.produces = {}
+            cmp.ports = {}
 
     def add_component(self, cmp: Component) -> Component:
         """Creates and adds new component to taxonomy.
@@ -106,12 +458,16 @@ class Model:
         :return: Added component.
         """
         cmp.name = normalize_name(cmp.name)
-        if cmp.name in self.get_all_components_names():
+        if cmp.name in self.__components_by_name:
             raise BGError(f'Component with name: "{cmp.name}" already exists in the taxonomy.')
         elif cmp.name == self.root_name:
             raise BGError(f'Component cannot have same name as the root component.')
-        self.taxonomy.append(cmp)
-        self.__update_taxonomy()
+        cmp.id_ = self.__next_id()
+        self.__taxonomy.append(cmp)
+        self.__index_component(cmp)
+        self.__invalidate_leaf_children(cmp.parent_id)
+        self.__update_leaf_status(cmp)
+        self.__update_parents_leaf_status(cmp)
         return cmp
 
     def remove_component_recursively(self, cmp: Component) -> Tuple[List[Component], List[Any]]:
@@ -123,35 +479,40 @@ class Model:
         """
         cmp_children = self.get_components_children(cmp)
         cmps_to_remove = [cmp, *cmp_children]
-        self.taxonomy = [cmp for cmp in self.taxonomy if cmp not in cmps_to_remove]
-        self.__update_taxonomy()
-        removed_ctrs = [ctr for cmp in cmps_to_remove for ctr in self.__remove_components_constraints(cmp)]
-        return cmps_to_remove, removed_ctrs
-
-    def __remove_components_constraints(self, cmp: Component) -> List[Any]:
-        """Removes component from model. Looks for references of the removed component in the constraints
+        self.__remove_from_taxonomy({c.id_ for c in cmps_to_remove})
+        for c in cmps_to_remove:    # Parents are removed before their children
+            self.__unindex_component(c)
+        self.__mark_removed(*cmps_to_remove)
+        self.__update_parents_leaf_status(cmp)
+        return cmps_to_remove, self.__remove_components_constraints(cmps_to_remove)
+
+    def __remove_components_constraints(self, cmps: List[Component]) -> List[Any]:
+        """Removes components from model. Looks for references of the removed components in the constraints
         and removes this constraints from the model as well.
 
-        :param cmp: Component to remove.
-        :return: List of constraints removed that contained component.
-        """
-        simple_ctr_to_remove = []
-        for sc in self.simple_constraints:
-            if cmp.id_ in sc.components_ids:
-                simple_ctr_to_remove.append(sc)
-
-        complex_ctr_to_remove = []
-        for cc in self.complex_constraints:
-            for ctr in [*cc.antecedent, *cc.consequent]:
-                if cmp.id_ in ctr.components_ids:
-                    complex_ctr_to_remove.append(cc)
-                    break
-
-        # Remove simple constraints
-        self.simple_constraints = [sc for sc in self.simple_constraints if sc not in simple_ctr_to_remove]
-        # Remove complex constraints
-        self.complex_constraints = [cc for cc in self.complex_constraints if cc not in complex_ctr_to_remove]
-        return simple_ctr_to_remove + complex_ctr_to_remove
+        :param cmps: Components to remove.
+        :return: List of constraints removed that contained components.
+        """
+        simple_ctr_to_remove = {}
+        complex_ctr_to_remove = {}
+        for cmp in cmps:
+            for ctr in self.__constraints_by_component_id.pop(cmp.id_, {}).values():
+                if isinstance(ctr, SimpleConstraint):
+                    simple_ctr_to_remove[ctr.id_] = ctr
+                else:
+                    complex_ctr_to_remove[ctr.id_] = ctr
+
+        if simple_ctr_to_remove:
+            self.simple_constraints = [sc for sc in self.simple_constraints if sc.id_ not in simple_ctr_to_remove]
+        if complex_ctr_to_remove:
+            self.complex_constraints = [cc for cc in self.complex_constraints
+                                        if cc.id_ not in complex_ctr_to_remove]
+        removed_ctrs = [*simple_ctr_to_remove.values(), *complex_ctr_to_remove.values()]
+        for ctr in removed_ctrs:
+            self.__unindex_constraint(ctr)
+            self.__constraints_names.discard(ctr.name)
+        self.__mark_removed(*removed_ctrs)
+        return removed_ctrs
 
     def get_components_children(self, cmp: Component, **kwargs) -> List[Component]:
         """Returns the list of component's children (obtained recursively).
@@ -160,20 +521,28 @@ class Model:
         :param kwargs: Additional parameters of the desired children components.
         :return: List of component's children.
         """
-        def __get_components_children(cmp_: Component, children_: List[Component]) -> None:
-            """Creates a list of children of the cmp_ component, be recursive calls to itself.
+        if kwargs == {'is_leaf': True}:
+            leaf_children = self.__leaf_children_cache.get(cmp.id_)
+            if leaf_children is None:
+                leaf_children = self.__get_subtree(cmp, is_leaf=True)
+                self.__leaf_children_cache[cmp.id_] = leaf_children
+            return list(leaf_children)
+        return self.__get_subtree(cmp, **kwargs)
 
-            :param cmp_: Component, to create the children's list of.
-            :param children_: List of child components.
-            """
-            for c in self.taxonomy:
-                if c.parent_id == cmp_.id_:
-                    if matches(c, **kwargs):
-                        children_.append(c)
-                    __get_components_children(c, children_)
+    def __get_subtree(self, cmp: Component, **kwargs) -> List[Component]:
+        """Traverses the component's subtree (in pre-order) using the children index.
 
+        :param cmp: Component, to return the children of.
+        :param kwargs: Additional parameters of the desired children components.
+        :return: List of component's children.
+        """
         children = []
-        __get_components_children(cmp, children)
+        stack = list(reversed(self.__children.get(cmp.id_, [])))
+        while stack:
+            c = stack.pop()
+            if matches(c, **kwargs):
+                children.append(c)
+            stack.extend(reversed(self.__children.get(c.id_, [])))
         return children
 
     def remove_component_preserve_children(self, cmp: Component) -> Tuple[Component, List[Any]]:
@@ -186,12 +555,18 @@ class Model:
         :return: Tuple of the form (component removed from the taxonomy,
                                     list of constraints removed from model [because of removing of the component])
         """
-        for c in self.taxonomy:
-            if c.parent_id == cmp.id_:
-                c.parent_id = cmp.parent_id
-        self.taxonomy.remove(cmp)
-        self.__update_taxonomy()
-        return cmp, self.__remove_components_constraints(cmp)
+        children = self.__children.pop(cmp.id_, [])
+        for c in children:
+            c.parent_id = cmp.parent_id
+        self.mark_changed(*children)
+        siblings = self.__children.setdefault(cmp.parent_id, [])
+        siblings.extend(children)
+        siblings.sort(key=lambda c: self.__components_ordinals[c.id_])   # Preserve taxonomy's order
+        self.__remove_from_taxonomy({cmp.id_})
+        self.__unindex_component(cmp)
+        self.__mark_removed(cmp)
+        self.__update_parents_leaf_status(cmp)
+        return cmp, self.__remove_components_constraints([cmp])
 
     def get_component(self, **kwargs) -> Component:
         """Returns the first component whose attributes match the kwargs.
@@ -199,7 +574,7 @@ class Model:
         :param kwargs: Desired attributes of a component.
         :return: Component.
         """
-        return next((cmp for cmp in self.taxonomy if matches(cmp, **kwargs)), None)
+        return self.__find(self.__iter_taxonomy(), self.__components_by_id, self.__components_by_name, **kwargs)
 
     def get_components(self, **kwargs) -> List[Component]:
         """Returns a list of components with attributes that match the kwargs.
@@ -207,7 +582,7 @@ class Model:
         :param kwargs: Desired attributes of a components.
         :return: List of components.
         """
-        return [c for c in self.taxonomy if matches(c, **kwargs)]
+        return [c for c in self.__iter_taxonomy() if matches(c, **kwargs)]
 
     def get_components_by_ids(self, ids: List[int]) -> List[Component]:
         """Returns a list of components that have their ids among given ids list.
@@ -215,7 +590,8 @@ class Model:
         :param ids: List of ids of components to return.
         :return: List of components.
         """
-        return [c for c in self.taxonomy if c.id_ in ids]
+        components = [self.__components_by_id[id_] for id_ in set(ids) if id_ in self.__components_by_id]
+        return sorted(components, key=lambda c: self.__components_ordinals[c.id_])  # Preserve taxonomy's order
 
     def rename_component(self, cmp: Component, new_name: str) -> Component:
         """Changes name of a specified component.
@@ -225,9 +601,12 @@ class Model:
         :return: Component with its name changed
         """
         new_name = normalize_name(new_name)
-        if new_name in self.get_all_components_names() and cmp.name != new_name:    # Allow changing name for the same
+        if new_name in self.__components_by_name and cmp.name != new_name:    # Allow changing name for the same
             raise BGError(f'Component with name: "{new_name}" already exists in the taxonomy.')
+        self.__components_by_name.pop(cmp.name, None)
         cmp.name = new_name
+        self.__components_by_name[cmp.name] = cmp
+        self.mark_changed(cmp)
         return cmp
 
     def get_all_components_names(self):
@@ -235,7 +614,7 @@ class Model:
 
         :return: List of all components names.
         """
-        return [c.name for c in self.taxonomy]
+        return [c.name for c in self.__iter_taxonomy()]
 
     def set_components_leaf_children_properties(self, cmp: Component, **kwargs):
         """Sets the attributes of the leaf children of cmp to those specified in kwargs.
@@ -248,6 +627,7 @@ class Model:
         for c in leaf_children:
             for attr, val in kwargs.items():
                 setattr(c, attr, val)
+        self.mark_changed(*leaf_children)
         return leaf_children
 
     def set_all_leaf_components_properties(self, **kwargs):
@@ -260,6 +640,7 @@ class Model:
         for c in leaf_cmps:
             for attr, val in kwargs.items():
                 setattr(c, attr, val)
+        self.mark_changed(*leaf_cmps)
         return leaf_cmps
 
     # Resources
@@ -277,10 +658,13 @@ class Model:
         :return: Added Resource.
         """
         res.name = normalize_name(res.name)
-        resources_names = self.get_all_resources_names()
-        if res.name in resources_names:
+        if res.name in self.__resources_by_name:
             raise BGError(f'Resource "{res.name}" already exists.')
+        res.id_ = self.__next_id()
         self.resources.append(res)
+        self.__resources_by_id[res.id_] = res
+        self.__resources_by_name[res.name] = res
+        self.mark_changed(res)
         return res
 
     def get_resource(self, **kwargs) -> Resource:
@@ -289,7 +673,7 @@ class Model:
         :param kwargs: Desired attributes of a resource.
         :return: Resource.
         """
-        return next((res for res in self.resources if matches(res, **kwargs)), None)
+        return self.__find(self.resources, self.__resources_by_id, self.__resources_by_name, **kwargs)
 
     def rename_resource(self, res: Resource, new_name: str) -> Resource:
         """Changes name of a specified resource.
@@ -301,10 +685,12 @@ class Model:
         :return: Resource with its name changed
         """
         new_name = normalize_name(new_name)
-        res_names = self.get_all_resources_names()
-        if new_name in res_names and res.name != new_name:  # Allow changing name for the same
+        if new_name in self.__resources_by_name and res.name != new_name:  # Allow changing name for the same
             raise BGError(f'Resource with name: "{new_name}" already exists in the taxonomy.')
+        self.__resources_by_name.pop(res.name, None)
         res.name = new_name
+        self.__resources_by_name[res.name] = res
+        self.mark_changed(res)
         return res
 
     def remove_resource(self, res: Resource) -> Resource:
@@ -313,11 +699,15 @@ class Model:
         :param res: Resource to be removed from self.
         :return: Removed Resource.
         """
-        for c in self.taxonomy:
+        for c in self.__iter_taxonomy():
             if res.id_ in c.produces:
                 del c.produces[res.id_]  # Remove information about production of this resource from components
+                self.mark_changed(c)
 
         self.resources.remove(res)  # Remove component it self
+        del self.__resources_by_id[res.id_]
+        self.__resources_by_name.pop(res.name, None)
+        self.__mark_removed(res)
         return res
 
     def set_resource_production_to_all_components_children(self, cmp: Component, res: Resource, value: int) \
@@ -333,6 +723,7 @@ class Model:
         leaf_children = self.get_components_children(cmp, is_leaf=True)
         for c in leaf_children:
             c.produces[res.id_] = value
+        self.mark_changed(*leaf_children)
         return leaf_children
 
     # Ports
@@ -343,9 +734,13 @@ class Model:
         :return: Added port.
         """
         prt.name = normalize_name(prt.name)
-        if prt.name in self.get_all_ports_names():
+        if prt.name in self.__ports_by_name:
             raise BGError(f'Port "{prt.name}" already exists.')
+        prt.id_ = self.__next_id()
         self.ports.append(prt)
+        self.__ports_by_id[prt.id_] = prt
+        self.__ports_by_name[prt.name] = prt
+        self.mark_changed(prt)
         return prt
 
     def rename_port(self, prt: Port, new_name: str) -> Port:
@@ -356,9 +751,12 @@ class Model:
         :return: Renamed Port.
         """
         new_name = normalize_name(new_name)
-        if new_name in self.get_all_ports_names() and prt.name != new_name:     # Allow changing name for the same
+        if new_name in self.__ports_by_name and prt.name != new_name:     # Allow changing name for the same
             raise BGError(f'Port "{new_name}" already exists.')
+        self.__ports_by_name.pop(prt.name, None)
         prt.name = new_name
+        self.__ports_by_name[prt.name] = prt
+        self.mark_changed(prt)
         return prt
 
     def get_port(self, **kwargs) -> Port:
@@ -367,7 +765,7 @@ class Model:
         :param kwargs: Desired attributes of a port.
         :return: Port.
         """
-        return next((prt for prt in self.ports if matches(prt, **kwargs)), None)
+        return self.__find(self.ports, self.__ports_by_id, self.__ports_by_name, **kwargs)
 
     def get_ports_by_ids(self, ids: List[int]) -> List[Port]:
         """Returns a list of ports that have their ids among given ids list.
@@ -375,6 +773,7 @@ class Model:
         :param ids: List of ids of ports to return.
         :return: List of ports.
         """
+        ids = set(ids)
         return [p for p in self.ports if p.id_ in ids]
 
     def remove_port(self, prt: Port) -> Port:
@@ -383,11 +782,15 @@ class Model:
         :param prt: Port to be removed from self.
         :return: Removed Port.
         """
-        for c in self.taxonomy:
+        for c in self.__iter_taxonomy():
             if prt.id_ in c.ports:
                 del c.ports[prt.id_]  # Remove information about ports from components
+                self.mark_changed(c)
 
         self.ports.remove(prt)  # Remove port itself
+        del self.__ports_by_id[prt.id_]
+        self.__ports_by_name.pop(prt.name, None)
+        self.__mark_removed(prt)
         return prt
 
     def get_all_ports_names(self) -> List[str]:
@@ -408,12 +811,15 @@ class Model:
         for pid in ports_to_remove_ids:
             port_ = self.get_port(id_=pid)
             port_.compatible_with.remove(port.id_)
+            self.mark_changed(port_)
         # Add to other ports compatibility with this port
         for pid in compatible_ports_ids:
             port_ = self.get_port(id_=pid)
             if port.id_ not in port_.compatible_with:
                 port_.compatible_with.append(port.id_)
+                self.mark_changed(port_)
         port.compatible_with = compatible_ports_ids
+        self.mark_changed(port)
 
     def set_ports_amount_to_all_components_children(self, cmp: Component, prt: Port, number: int) \
             -> List[Component]:
@@ -427,6 +833,7 @@ class Model:
         leaf_children = self.get_components_children(cmp, is_leaf=True)
         for c in leaf_children:
             c.ports[prt.id_] = number
+        self.mark_changed(*leaf_children)
         return leaf_children
 
     def get_all_constraints(self) -> List[Any]:
@@ -462,7 +869,7 @@ class Model:
             and complex constraints (Simple constraints are put first in the union, complex constraints later).
         """
         new_name = normalize_name(ctr.name)
-        if ctr.name in self.get_all_constraints_names():
+        if new_name in self.__constraints_names:
             raise BGError(f'Constraint with the name {ctr.name} already exists.')
         ctr.name = new_name
 
@@ -480,6 +887,11 @@ class Model:
                 raise BGError('Constraint must have consequent.')
 
             self.complex_constraints.append(ctr)
+        ctr.id_ = self.__next_id()
+        self.__issue_nested_constraints_ids(ctr)
+        self.__index_constraint(ctr)
+        self.__constraints_names.add(ctr.name)
+        self.mark_changed(ctr)
         return ctr, self.get_constraint_index(ctr)
 
     def edit_constraint(self, edited_ctr: Any) -> Tuple[Any, int]:
@@ -490,7 +902,7 @@ class Model:
         """
         new_name = normalize_name(edited_ctr.name)
         current_ctr = self.get_constraint(id_=edited_ctr.id_)
-        if new_name in self.get_all_constraints_names() and edited_ctr.name != current_ctr.name:
+        if new_name in self.__constraints_names and new_name != current_ctr.name:
             raise BGError(f'Constraint with the name {edited_ctr.name} already exists.')
         edited_ctr.name = new_name
 
@@ -512,6 +924,12 @@ class Model:
             # Replace constraint
             self.complex_constraints.remove(current_ctr)
             self.complex_constraints.append(edited_ctr)
+        self.__issue_nested_constraints_ids(edited_ctr)
+        self.__unindex_constraint(current_ctr)
+        self.__index_constraint(edited_ctr)
+        self.__constraints_names.discard(current_ctr.name)
+        self.__constraints_names.add(edited_ctr.name)
+        self.mark_changed(edited_ctr)
         return edited_ctr, self.get_constraint_index(edited_ctr)
 
     def remove_constraint(self, ctr: Any) -> Any:
@@ -524,8 +942,42 @@ class Model:
             self.simple_constraints.remove(ctr)
         else:
             self.complex_constraints.remove(ctr)
+        self.__unindex_constraint(ctr)
+        self.__constraints_names.discard(ctr.name)
+        self.__mark_removed(ctr)
         return ctr
 
+    @staticmethod
+    def __get_constraints_components_ids(ctr: Any) -> Set[int]:
+        """Returns the ids of components the constraint refers to.
+
+        :param ctr: SimpleConstraint or ComplexConstraint.
+        :return: Set of components' ids.
+        """
+        if isinstance(ctr, SimpleConstraint):
+            return set(ctr.components_ids)
+        return {id_ for sc in [*ctr.antecedent, *ctr.consequent] for id_ in sc.components_ids}
+
+    def __index_constraint(self, ctr: Any) -> None:
+        """Adds the constraint to the index of constraints by the components they refer to.
+
+        :param ctr: SimpleConstraint or ComplexConstraint to add.
+        """
+        for cmp_id in self.__get_constraints_components_ids(ctr):
+            self.__constraints_by_component_id.setdefault(cmp_id, {})[ctr.id_] = ctr
+
+    def __unindex_constraint(self, ctr: Any) -> None:
+        """Removes the constraint from the index of constraints by the components they refer to.
+
+        :param ctr: SimpleConstraint or ComplexConstraint to remove.
+        """
+        for cmp_id in self.__get_constraints_components_ids(ctr):
+            cmp_ctrs = self.__constraints_by_component_id.get(cmp_id)
+            if cmp_ctrs is not None:
+                cmp_ctrs.pop(ctr.id_, None)
+                if not cmp_ctrs:
+                    del self.__constraints_by_component_id[cmp_id]
+
     def get_constraint_index(self, ctr: Any) -> int:
         """Returns the index of a constraint in the list created as a union of sorted list of simple constraint
             and sorted list of complex constraints.
@@ -539,8 +991,8 @@ class Model:
 
     def remove_all_constraints(self) -> None:
         """Removes all constraints from model."""
+        self.__mark_removed(*self.get_all_constraints())
         self.simple_constraints.clear()
         self.complex_constraints.clear()
-
-
-
+        self.__constraints_by_component_id.clear()
+        self.__constraints_names.clear()
@@ -1,5 +1,5 @@
 import uuid
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 
 
 class Port:
@@ -11,6 +11,8 @@ class Port:
         force_connection: Whether or not a port connection is required.
         compatible_with: List of port ids that this port is compatible with.
     """
+    __slots__ = ('id_', 'name', 'force_connection', 'compatible_with')
+
     def __init__(self,
                  name: str,
                  id_: Optional[int] = None,
@@ -22,9 +24,18 @@ class Port:
         self.compatible_with: List[int] = compatible_with if compatible_with is not None else []
 
     @classmethod
-    def from_json(cls, data):
-        """Necessary to create an instance from JSON"""
-        return cls(**data)
+    def from_dict(cls, data: Dict[str, Any]) -> 'Port':
+        """Creates an instance from the dictionary of its (JSON-decoded) attributes."""
+        return cls(data['name'], data['id_'], data['compatible_with'], data['force_connection'])
+
+    def to_json(self) -> Dict[str, Any]:
+        """Necessary to convert an instance to JSON"""
+        return {
+            'id_': self.id_,
+            'name': self.name,
+            'force_connection': self.force_connection,
+            'compatible_with': self.compatible_with
+        }
 
     def __repr__(self):
         """For development purposes only"""
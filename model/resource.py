@@ -1,4 +1,5 @@
 import uuid
+from typing import Dict, Any
 
 
 class Resource:
@@ -8,6 +9,8 @@ class Resource:
         id_: Unique identifier
         name: Name
     """
+    __slots__ = ('id_', 'name')
+
     def __init__(self,
                  name: str,
                  id_: int = None):
@@ -15,7 +18,13 @@ class Resource:
         self.name = name
 
     @classmethod
-    def from_json(cls, data):
-        """Necessary to create an instance from JSON"""
-        return cls(**data)
+    def from_dict(cls, data: Dict[str, Any]) -> 'Resource':
+        """Creates an instance from the dictionary of its (JSON-decoded) attributes."""
+        return cls(data['name'], data['id_'])
 
+    def to_json(self) -> Dict[str, Any]:
+        """Necessary to convert an instance to JSON"""
+        return {
+            'id_': self.id_,
+            'name': self.name
+        }
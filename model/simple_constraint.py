@@ -1,5 +1,5 @@
 import uuid
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 
 
 class SimpleConstraint:
@@ -15,6 +15,8 @@ class SimpleConstraint:
         distinct: If set to True, components of the same type are counted only once;
             otherwise every appearance is counted.
     """
+    __slots__ = ('id_', 'name', 'description', 'min_', 'max_', 'components_ids', 'distinct')
+
     def __init__(self,
                  id_: Optional[int] = None,
                  name: str = None,
@@ -32,7 +34,19 @@ class SimpleConstraint:
         self.distinct: bool = distinct
 
     @classmethod
-    def from_json(cls, data):
-        """Necessary to create an instance from JSON"""
-        return cls(**data)
+    def from_dict(cls, data: Dict[str, Any]) -> 'SimpleConstraint':
+        """Creates an instance from the dictionary of its (JSON-decoded) attributes."""
+        return cls(data['id_'], data['name'], data['description'], data['min_'], data['max_'], data['components_ids'],
+                   data['distinct'])
 
+    def to_json(self) -> Dict[str, Any]:
+        """Necessary to convert an instance to JSON"""
+        return {
+            'id_': self.id_,
+            'name': self.name,
+            'description': self.description,
+            'min_': self.min_,
+            'max_': self.max_,
+            'components_ids': self.components_ids,
+            'distinct': self.distinct
+        }
@@ -4,11 +4,13 @@ from typing import Dict, Any, Callable, Optional
 
 import clingo
 import csv
+import json
+import os
 import re
 from enum import IntEnum
 
 
-from code_generator import DOMAIN_STRING, PRD_SYMBOL
+from code_generator import DOMAIN_STRING, PRD_SYMBOL, CNT_SYMBOL, SymbolTable, SYMBOL_TABLE_EXTENSION
 
 
 class InstanceRepresentation(IntEnum):
@@ -30,7 +32,8 @@ FACT_RE = r'\w+\(\d+\.\.\d+\)\.'
 
 # Stores predicates and indexes of the arguments, where ints don't represent any instance of a component
 PREDICATES_TO_PRESERVE_INTEGERS_IN = {
-    PRD_SYMBOL: [2]
+    PRD_SYMBOL: [2],
+    CNT_SYMBOL: [1]
 }
 
 
@@ -93,6 +96,7 @@ class Solver:
         self.__output_csv_file_writer = None
         self.__current_answer_set: int = 0
         self.__instances_dictionary: Dict[range, str] = {}
+        self.__symbol_table: Optional[SymbolTable] = None
 
     def __get_instances_dictionary(self):
         """Traverses through input logic file looking for instance predicates
@@ -105,6 +109,15 @@ class Solver:
                     range_, name = get_instance_range_and_name(line)
                     self.__instances_dictionary[range_] = name
 
+    def __get_symbol_table(self):
+        """Loads the symbol table saved next to the input logic file (if its string constants are encoded
+        by integer codes).
+        """
+        symbol_table_file_name = f'{self.__input_file_name}{SYMBOL_TABLE_EXTENSION}'
+        if os.path.exists(symbol_table_file_name):
+            with open(symbol_table_file_name, mode='r') as file:
+                self.__symbol_table = SymbolTable.from_json(json.load(file))
+
     def __get_arguments_representations(self, symbol: clingo.Symbol):
         """Extracts representation of predicates arguments.
 
@@ -112,8 +125,12 @@ class Solver:
         :return: List of representations of predicates arguments.
         """
         symbol_arguments = []
+        interned_arguments = self.__symbol_table.get_arguments(symbol.name) if self.__symbol_table is not None \
+            else []
         for i, arg in enumerate(symbol.arguments):
-            if arg.type == clingo.SymbolType.Number:
+            if i in interned_arguments:
+                symbol_arguments.append(self.__symbol_table.get_name(arg.number))
+            elif arg.type == clingo.SymbolType.Number:
                 if self.__instance_representation == InstanceRepresentation.Id:
                     symbol_arguments.append(arg.number)
                 else:
@@ -180,6 +197,7 @@ class Solver:
         self.__completed = True     # Reset "completed" variable
         self.__control.load(self.__input_file_name)
         self.__get_instances_dictionary()
+        self.__get_symbol_table()
         self.__control.ground([('base', [])])
         self.__control.configuration.solve.models = self.__answer_sets_count
         with open(self.__output_file_name, 'w', newline='') as output_csv_file:
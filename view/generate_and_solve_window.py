@@ -16,7 +16,7 @@ WINDOW_TITLE = 'Generate logic program...'
 GENERATED_FILE_SUFFIX = 'gen'
 
 WINDOW_WIDTH_RATIO = 0.3
-WINDOW_HEIGHT_RATIO = 0.675
+WINDOW_HEIGHT_RATIO = 0.8
 
 
 class GenerateAndSolveWindow(HasCommonSetup,
@@ -69,6 +69,7 @@ class GenerateAndSolveWindow(HasCommonSetup,
     def __ok(self) -> None:
         """Executed whenever __ok_button is pressed."""
         try:
+            self.__settings.save_changes(**self.__generate_frame.generation_options)    # Read by generate
             generate(self.__generate_frame.export_to_path, self.__state.model,
                      self.__generate_frame.show_all_predicates, self.__generate_frame.shown_predicates_dict)
             self.__solve_frame.solve(self.__generate_frame.export_to_path,
@@ -14,6 +14,22 @@ from view.style import BACKGROUND_COLOR_PRIMARY, CONTROL_PAD_Y, CONTROL_PAD_X
 GENERATED_FILE_SUFFIX = 'gen'
 SHOW_PREDICATES_CONTAINER_FRAME_HEIGHT = 200
 EXPORT_WINDOW_TITLE = 'Export logic program to:'
+# Pairs of the form (name of the setting, label of its checkbox); see Settings for their descriptions
+GENERATION_OPTIONS = [
+    ('generation_cache', 'Reuse unchanged sections'),
+    ('ports_compatibility_by_type', 'Ports compatibility by type'),
+    ('deterministic_ports_binding', 'Deterministic ports binding'),
+    ('linear_symmetry_breaking', 'Linear symmetry breaking'),
+    ('connections_symmetry_breaking', 'Symmetry breaking by connections'),
+    ('intern_constants', 'Integer constants'),
+    ('bounds_propagation', 'Bounds propagation'),
+    ('static_checks', 'Static checks'),
+    ('aggregated_resources', 'Resources by component types'),
+    ('shared_conditions', 'Shared conditions'),
+    ('constraints_simplification', 'Constraints simplification'),
+    ('dead_code_elimination', 'Dead code elimination'),
+]
+GENERATION_OPTIONS_COLUMNS_COUNT = 2
 
 
 class GenerateFrame(ttk.Frame,
@@ -66,6 +82,16 @@ class GenerateFrame(ttk.Frame,
         self.__show_all_predicates_checkbox_label = ttk.Label(self, text='Show all predicates:')
         self.__show_all_predicates_checkbox = ttk.Checkbutton(self, variable=self.__show_all_predicates_checkbox_var)
 
+        self.__generation_options_label = ttk.Label(self, text='Generation options:')
+        self.__generation_options_frame = ttk.Frame(self)
+        self.__generation_options_checkbox_widgets_dict = {}
+        # Generation option checkboxes
+        for setting_name, label_text in GENERATION_OPTIONS:
+            var = tk.BooleanVar(value=getattr(self.__settings, setting_name))
+            label = ttk.Label(self.__generation_options_frame, text=label_text)
+            checkbox = ttk.Checkbutton(self.__generation_options_frame, variable=var)
+            self.__generation_options_checkbox_widgets_dict[setting_name] = (var, label, checkbox)
+
         root_name = '' if not self.__state.model else self.__state.model.root_name
         path, file_name = get_target_file_location(self.__state.file, root_name,
                                                    suffix=GENERATED_FILE_SUFFIX, extension=LP_EXTENSION)
@@ -88,7 +114,14 @@ class GenerateFrame(ttk.Frame,
         self.__show_all_predicates_checkbox_label.grid(row=1, column=0, sticky=tk.W, pady=CONTROL_PAD_Y, padx=CONTROL_PAD_X)
         self.__show_all_predicates_checkbox.grid(row=1, column=1, sticky=tk.E, pady=CONTROL_PAD_Y, padx=CONTROL_PAD_X)
 
-        self.__export_to_path_frame.grid(row=2, column=0, columnspan=2, sticky=tk.EW + tk.S, pady=CONTROL_PAD_Y)
+        self.__generation_options_label.grid(row=2, column=0, sticky=tk.N + tk.W, pady=CONTROL_PAD_Y, padx=CONTROL_PAD_X)
+        self.__generation_options_frame.grid(row=2, column=1, sticky=tk.NSEW, pady=CONTROL_PAD_Y, padx=CONTROL_PAD_X)
+        for i, (_, label, checkbox) in enumerate(self.__generation_options_checkbox_widgets_dict.values()):
+            row, column = divmod(i, GENERATION_OPTIONS_COLUMNS_COUNT)
+            checkbox.grid(row=row, column=2 * column, padx=CONTROL_PAD_X)
+            label.grid(row=row, column=2 * column + 1, sticky=tk.W)
+
+        self.__export_to_path_frame.grid(row=3, column=0, columnspan=2, sticky=tk.EW + tk.S, pady=CONTROL_PAD_Y)
 
         self.__show_predicates_container_frame.columnconfigure(0, weight=1)
 
@@ -96,7 +129,7 @@ class GenerateFrame(ttk.Frame,
         self.columnconfigure(1, weight=1, uniform='fred')
 
         self.rowconfigure(1, weight=1)
-        self.rowconfigure(2, weight=1)
+        self.rowconfigure(3, weight=1)
 
     def __on_mousewheel(self, event) -> None:
         """Executes whenever mousewheel is scrolled and cursor is inside the __show_predicates_canvas."""
@@ -146,6 +179,15 @@ class GenerateFrame(ttk.Frame,
         """Returns the __show_all_predicates_checkbox value."""
         return self.__show_all_predicates_checkbox_var.get()
 
+    @property
+    def generation_options(self) -> Dict[str, bool]:
+        """Returns the values of the generation options' checkboxes.
+
+        :return: Dictionary of type setting_name: value.
+        """
+        return {setting_name: checkbox_var.get() for setting_name, (checkbox_var, _1, _2)
+                in self.__generation_options_checkbox_widgets_dict.items()}
+
     def change_frame_controls_state(self, state) -> None:
         """Changes widgets' state.
 
@@ -153,5 +195,6 @@ class GenerateFrame(ttk.Frame,
         """
         change_controls_state(state,
                               *[checkbox for (_0, _1, checkbox) in self.__show_predicates_checkbox_widgets_dict.values()],
-                              self.__show_all_predicates_checkbox)
+                              self.__show_all_predicates_checkbox,
+                              *[checkbox for (_0, _1, checkbox) in self.__generation_options_checkbox_widgets_dict.values()])
         self.__export_to_path_frame.change_state(state)
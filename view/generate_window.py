@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from misc.exceptions import BGError
 from misc.file_operations import extract_file_name, generate
 from misc.settings import Settings
 from misc.state import State
@@ -13,7 +14,7 @@ WINDOW_TITLE = 'Generate and solve logic program...'
 GENERATED_FILE_SUFFIX = 'gen'
 
 WINDOW_WIDTH_RATIO = 0.3
-WINDOW_HEIGHT_RATIO = 0.425
+WINDOW_HEIGHT_RATIO = 0.55
 
 
 class GenerateWindow(HasCommonSetup,
@@ -50,9 +51,22 @@ class GenerateWindow(HasCommonSetup,
 
     def __ok(self):
         """Executed whenever the __ok_button is pressed."""
-        generate(self.__generate_frame.export_to_path, self.__state.model, self.__generate_frame.show_all_predicates,
-                 self.__generate_frame.shown_predicates_dict)
+        try:
+            self.__settings.save_changes(**self.__generate_frame.generation_options)    # Read by generate
+            tightenings, removed_constraints, pruned_rules_count = generate(
+                self.__generate_frame.export_to_path, self.__state.model,
+                self.__generate_frame.show_all_predicates, self.__generate_frame.shown_predicates_dict)
+        except BGError as e:
+            messagebox.showerror('Error', e.message, parent=self)
+            return
         file_name = extract_file_name(self.__generate_frame.export_to_path)
-        messagebox.showinfo('Export successful.', f'Exported successfully to\n{file_name}.', parent=self)
+        message = f'Exported successfully to\n{file_name}.'
+        if tightenings:
+            message += '\n\nNumbers of instances tightened:\n' + '\n'.join(str(t) for t in tightenings)
+        if removed_constraints:
+            message += '\n\nSimple constraints simplified:\n' + '\n'.join(removed_constraints)
+        if pruned_rules_count:
+            message += f'\n\nRules of the components without instances left out: {pruned_rules_count}'
+        messagebox.showinfo('Export successful.', message, parent=self)
 
 
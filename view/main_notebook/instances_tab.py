@@ -254,6 +254,7 @@ class InstancesTab(Tab,
         """Executed whenever the __symmetry_breaking_checkbox is toggled"""
         if self.__selected_component and self.__selected_component.is_leaf:
             self.__selected_component.symmetry_breaking = self.__symm_breaking_checkbox_var.get()
+            self.__state.model.mark_changed(self.__selected_component)
             self.__taxonomy_tree.update_values(self.__selected_component)
 
     def __on_count_changed(self, *_) -> None:
@@ -284,6 +285,7 @@ class InstancesTab(Tab,
                 self.__selected_component.count = None  # Reset both
                 self.__selected_component.min_count = None
             finally:
+                self.__state.model.mark_changed(self.__selected_component)
                 self.__taxonomy_tree.update_values(self.__selected_component)
 
     def __apply_count_to_all_children(self) -> None:
@@ -353,6 +355,7 @@ class InstancesTab(Tab,
 
             if self.__selected_component.is_leaf:
                 self.__selected_component.exact = exact_value
+                self.__state.model.mark_changed(self.__selected_component)
                 self.__taxonomy_tree.update_values(self.__selected_component)
 
     def __on_max_changed(self, *_):
@@ -372,6 +375,7 @@ class InstancesTab(Tab,
             except tk.TclError:
                 pass
             finally:
+                self.__state.model.mark_changed(self.__selected_component)
                 self.__taxonomy_tree.update_values(self.__selected_component)
 
     def __apply_symmetry_breaking_for_all_components(self):
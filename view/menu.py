@@ -1,11 +1,11 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from typing import TextIO
 
 from pubsub import pub
 
-from misc.file_operations import JSON_EXTENSION, extract_file_name, open_project, JSON_FILE_TYPE, ALL_FILES_TYPE
-from misc import json_converter, actions
+from misc.file_operations import JSON_EXTENSION, extract_file_name, open_project, save_to_file, JSON_FILE_TYPE, \
+    BINARY_FILE_TYPE, ALL_FILES_TYPE
+from misc import actions
 from misc.settings import Settings
 from misc.state import State
 from view.ask_string_window import AskStringWindow
@@ -93,37 +93,35 @@ class Menu(tk.Menu):
 
     def __on_save(self):
         """Executed whenever file_menu's Save command is selected."""
-        json_string = json_converter.get_json_string(self.__state.model)
         if self.__state.file:
-            with open(self.__state.file.name, 'w') as file_:
-                self.__save(file_, json_string)
+            self.__save(self.__state.file.name)
         else:
             self.__on_save_as()
 
     def __on_save_as(self):
         """Executed whenever file_menu's Save as... command is selected."""
-        json_string = json_converter.get_json_string(self.__state.model)
         file_name = filedialog.asksaveasfilename(defaultextension=JSON_EXTENSION,
-                                                 filetypes=(JSON_FILE_TYPE, ALL_FILES_TYPE),
+                                                 filetypes=(JSON_FILE_TYPE, BINARY_FILE_TYPE, ALL_FILES_TYPE),
                                                  initialfile=self.__state.model.root_name)
+        if not file_name:   # Dialog cancelled
+            return
         try:
-            with open(file_name, 'w') as file:
-                self.__save(file, json_string)
-                self.__state.file = file
-                messagebox.showinfo('Saved successfully', f'Saved succesfully to\n{file.name}.')
+            self.__save(file_name)
+            messagebox.showinfo('Saved successfully', f'Saved succesfully to\n{file_name}.')
         except FileNotFoundError as e:
             messagebox.showerror('File not found.', str(e))
 
-    def __save(self, file: TextIO, json_string: str):
-        """Saves JSON model to file.
+    def __save(self, file_name: str):
+        """Saves model to file.
 
-        :param file: Output file .
-        :param json_string: Model encrypted in JSON string.
+        :param file_name: Output file path.
         """
-        file.write(json_string)
-        file_name = extract_file_name(file.name)
-        Settings.get_settings().add_recently_opened_project(self.__state.model.root_name, file.name)
-        pub.sendMessage(actions.MODEL_SAVED, file_name=file_name)
+        save_to_file(self.__state.model, file_name, rewrite=self.__state.file is None or
+                     self.__state.file.name != file_name)
+        with open(file_name) as file:
+            self.__state.file = file    # Only the name of the (closed) file is used later on
+        Settings.get_settings().add_recently_opened_project(self.__state.model.root_name, file_name)
+        pub.sendMessage(actions.MODEL_SAVED, file_name=extract_file_name(file_name))
 
     def __help(self):
         HelpWindow(self.__parent_frame)
@@ -227,6 +227,7 @@ class AssociationsTab(Tab,
                                       self.__max_spinbox,
                                       self.__min_spinbox)
                 self.__selected_component.association = None
+            self.__state.model.mark_changed(self.__selected_component)
             self.__taxonomy_tree.update_values(self.__selected_component)
 
     def __on_has_min_changed(self, *_):
@@ -245,6 +246,7 @@ class AssociationsTab(Tab,
                     self.__selected_component.association.min_ = None
                 change_controls_state(tk.DISABLED, self.__min_spinbox)
                 self.__min_spinbox_var.set('')
+            self.__state.model.mark_changed(self.__selected_component)
 
     def __on_has_max_changed(self, *_):
         """Executed whenever the __has_max_checkbox_var is toggled"""
@@ -268,6 +270,7 @@ class AssociationsTab(Tab,
                     self.__selected_component.association.max_ = None
                 change_controls_state(tk.DISABLED, self.__max_spinbox)
                 self.__max_spinbox_var.set('')
+            self.__state.model.mark_changed(self.__selected_component)
 
     def __on_min_changed(self, *_):
         """Executed whenever the __min_spinbox_var value changes."""
@@ -284,6 +287,7 @@ class AssociationsTab(Tab,
             except tk.TclError:
                 self.__selected_component.association.min_ = None
             finally:
+                self.__state.model.mark_changed(self.__selected_component)
                 self.__taxonomy_tree.update_values(self.__selected_component)
 
     def __on_max_changed(self, *_):
@@ -299,4 +303,5 @@ class AssociationsTab(Tab,
             except tk.TclError:
                 self.__selected_component.association.max_ = None
             finally:
+                self.__state.model.mark_changed(self.__selected_component)
                 self.__taxonomy_tree.update_values(self.__selected_component)
@@ -81,10 +81,10 @@ class CreateTaxonomyWindow(HasCommonSetup,
         try:
             taxonomy_string = self.__text.get(1.0, tk.END)
             taxonomy = string_converter.string_to_taxonomy(taxonomy_string)
-            self.__state.model.set_taxonomy(taxonomy)  # Sets taxonomy and marks leaves
-            # Remove all constraints (since they [if exist] are based on the old components.
-            self.__state.model.remove_all_constraints()
-            self.__callback()
+            with self.__state.model.batch(on_commit=self.__callback):
+                self.__state.model.set_taxonomy(taxonomy)  # Sets taxonomy and marks leaves
+                # Remove all constraints (since they [if exist] are based on the old components.
+                self.__state.model.remove_all_constraints()
             self.grab_release()
             self.destroy()
         except BGError as e:
@@ -352,6 +352,7 @@ class PortsTab(Tab,
         if self.__selected_port:
             value = self.__force_connection_checkbox_var.get()
             self.__selected_port.force_connection = value
+            self.__state.model.mark_changed(self.__selected_port)
 
     def __on_amount_changed(self, *_):
         """Executed whenever the __amount_spinbox value changes."""
@@ -367,6 +368,7 @@ class PortsTab(Tab,
                 elif self.__selected_port.id_ in self.__selected_component.ports:
                     del self.__selected_component.ports[self.__selected_port.id_]
 
+                self.__state.model.mark_changed(self.__selected_component)
                 self.__taxonomy_tree.update_values(self.__selected_component)
 
     def __apply_to_all_children(self):
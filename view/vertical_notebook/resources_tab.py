@@ -320,6 +320,7 @@ class ResourcesTab(Tab,
                 elif self.__selected_resource.id_ in self.__selected_component.produces:
                     del self.__selected_component.produces[self.__selected_resource.id_]
 
+                self.__state.model.mark_changed(self.__selected_component)
                 self.__taxonomy_tree.update_values(self.__selected_component)
 
     def __apply_to_all_children(self):